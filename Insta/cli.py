@@ -13,16 +13,21 @@ import logging
 import os
 import sys
 import threading
+from datetime import date, datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 # Ensure project root is on path
 PROJECT_ROOT = Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# Both are memoized in config.loader (keyed on file/dir mtime), so menus can call them freely
 from config.loader import get_full_config, list_account_configs
+from src.health.monitor import get_cooldown_until, is_in_cooldown
+from src.orchestrator.planner import build_plan
 from state import repository as repo
-from state.db import DEFAULT_DB_PATH, ensure_schema
+from state.db import DEFAULT_DB_PATH, close_thread_connections, ensure_schema
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,20 +43,34 @@ _run_thread = None
 CURRENT_ACCOUNT_FILE = PROJECT_ROOT / "data" / "current_account.txt"
 
 
+# Last value read from CURRENT_ACCOUNT_FILE and the file's st_mtime_ns at that time
+_current_account_cache: Optional[str] = None
+_current_account_mtime: int = 0
+
+
 def _get_current_account() -> str:
-    """Return selected account id from data/current_account.txt, or 'default'."""
-    if CURRENT_ACCOUNT_FILE.exists():
-        try:
-            return CURRENT_ACCOUNT_FILE.read_text(encoding="utf-8").strip() or "default"
-        except Exception:
-            pass
-    return "default"
+    """Return selected account id from data/current_account.txt, or 'default'. Re-reads only when the file changes."""
+    global _current_account_cache, _current_account_mtime
+    try:
+        mtime = os.stat(CURRENT_ACCOUNT_FILE).st_mtime_ns
+    except OSError:
+        return "default"
+    if _current_account_cache is not None and mtime == _current_account_mtime:
+        return _current_account_cache
+    try:
+        account_id = CURRENT_ACCOUNT_FILE.read_text(encoding="utf-8").strip() or "default"
+    except Exception:
+        return "default"
+    _current_account_cache, _current_account_mtime = account_id, mtime
+    return account_id
 
 
 def _set_current_account(account_id: str) -> None:
     """Persist selected account for multi-account CLI."""
+    global _current_account_cache, _current_account_mtime
     CURRENT_ACCOUNT_FILE.parent.mkdir(parents=True, exist_ok=True)
     CURRENT_ACCOUNT_FILE.write_text(account_id, encoding="utf-8")
+    _current_account_cache, _current_account_mtime = account_id, os.stat(CURRENT_ACCOUNT_FILE).st_mtime_ns
 
 
 def _cmd_status(account_id: str) -> int:
@@ -78,7 +97,7 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
     config = get_full_config(account_id)
     limits = config.get("limits", {})
     one_session_per_day = limits.get("one_session_per_day", True)
-    today = __import__("datetime").date.today()
+    today = date.today()
 
     first_run_date = repo.get_first_run_date(account_id)
     if not first_run_date:
@@ -98,11 +117,8 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
     total_actions_today, likes_today = repo.get_today_totals(account_id)
     bio_edit_done = repo.get_bio_edit_done(account_id)
 
-    from src.health.monitor import is_in_cooldown
     in_cooldown = is_in_cooldown(account_id)
 
-    from src.orchestrator.planner import build_plan
-
     plan = build_plan(
         first_run_date,
         last_run_date,
@@ -116,7 +132,6 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
 
     if plan is None:
         if in_cooldown:
-            from src.health.monitor import get_cooldown_until
             until = get_cooldown_until(account_id)
             print(f"Account is in cooldown until {until}. Do not run until then.")
         elif one_session_per_day and not force and last_run_date == today:
@@ -142,9 +157,9 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
     activity = app_config.get("activity")  # None by default
     adb_serial = device_config.get("adb_serial")
 
-    from src.device.driver import create_driver
+    # Device/runner modules import Appium; keep them out of module scope so status/menus work without it
+    from src.device.driver import create_driver, ensure_app_foreground
     from src.device.instagram_app import InstagramApp
-    from src.device.driver import ensure_app_foreground
 
     try:
         driver = create_driver(package=package, activity=activity, adb_serial=adb_serial)
@@ -158,8 +173,7 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
 
     # Record last run date and session start
     repo.set_last_run_date(account_id, today)
-    from datetime import timezone
-    session_started = __import__("datetime").datetime.now(timezone.utc)
+    session_started = datetime.now(timezone.utc)
 
     def on_action_done(action_type: str, count: int):
         repo.record_action(account_id, today, action_type, count)
@@ -171,21 +185,25 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
     config_with_force["force_mode"] = force
 
     def run():
-        result = run_plan(
-            plan,
-            app,
-            account_id,
-            today,
-            on_action_done=on_action_done,
-            session_started_at=session_started,
-            stop_flag=lambda: _stop_requested,
-            config=config_with_force,
-        )
-        logger.info("Session finished: %s", result)
+        try:
+            result = run_plan(
+                plan,
+                app,
+                account_id,
+                today,
+                on_action_done=on_action_done,
+                session_started_at=session_started,
+                stop_flag=lambda: _stop_requested,
+                config=config_with_force,
+            )
+            logger.info("Session finished: %s", result)
+        finally:
+            close_thread_connections()
 
     _run_thread = threading.Thread(target=run)
     _run_thread.start()
     _run_thread.join()
+    repo.flush_actions()
 
     try:
         driver.quit()
@@ -244,7 +262,7 @@ def _menu_auto_run():
     # Check if already ran today
     ensure_schema()
     last_run = repo.get_last_run_date(account_id)
-    today = __import__("datetime").date.today()
+    today = date.today()
     if last_run == today:
         print("⚠️  Already ran today. Use force mode to run again.")
         force = input("Force run (bypass daily limit)? [y/N]: ").strip().lower() == 'y'
@@ -3,8 +3,9 @@ Load default config and per-account config (YAML).
 """
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 # Default to project root
 CONFIG_ROOT = Path(__file__).resolve().parent
@@ -16,14 +17,46 @@ try:
 except ImportError:
     yaml = None  # type: ignore
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    try:
+        from yaml import SafeLoader as _SafeLoader
+    except ImportError:
+        _SafeLoader = None  # type: ignore
+
+# Parsed YAML keyed by path; entries are reused while (st_mtime_ns, st_size) is unchanged.
+# Callers treat the returned dicts as read-only.
+_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+# Merged config per account_id, with the (defaults, account) dicts it was built from.
+_FULL: Dict[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = {}
+# (ACCOUNTS_DIR st_mtime_ns, sorted account_ids); adding/removing a file bumps the dir mtime.
+_LIST_CACHE: Optional[Tuple[int, list]] = None
+
+
+def invalidate() -> None:
+    """Drop all cached YAML and merged configs (e.g. after editing config files in-process, or in tests)."""
+    global _LIST_CACHE
+    _CACHE.clear()
+    _FULL.clear()
+    _LIST_CACHE = None
+
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
     if not yaml:
         raise RuntimeError("PyYAML is required for config. Install with: pip install PyYAML")
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _CACHE.pop(path, None)
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    cached = _CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
+    _CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 def get_defaults() -> Dict[str, Any]:
@@ -46,25 +79,54 @@ def get_full_config(account_id: str) -> Dict[str, Any]:
     """Merge defaults and account config. Account overrides defaults."""
     defaults = get_defaults()
     account = get_account_config(account_id)
+    # _load_yaml hands back the same dict objects while the files are unchanged
+    cached = _FULL.get(account_id)
+    if cached and cached[0] is defaults and cached[1] is account:
+        return cached[2]
+    merged = _merge(defaults, account)
+    _FULL[account_id] = (defaults, account, merged)
+    return merged
 
-    def merge(base: Dict, override: Dict) -> Dict:
-        out = dict(base)
-        for k, v in override.items():
-            if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-                out[k] = merge(out[k], v)
-            else:
-                out[k] = v
-        return out
 
-    return merge(defaults, account)
+def _merge(base: Dict, override: Dict) -> Dict:
+    """Deep-merge override into a copy of base. Only sub-dicts that are overridden get copied."""
+    out = base.copy()
+    stack = [(out, override)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(cur, dict) and isinstance(v, dict):
+                # Copy before writing into it: base dicts are shared with the YAML cache
+                cur = cur.copy()
+                dst[k] = cur
+                stack.append((cur, v))
+            else:
+                dst[k] = v
+    return out
 
 
 def list_account_configs() -> list[str]:
     """List account_ids that have a config file (excluding example.yaml)."""
-    if not ACCOUNTS_DIR.exists():
+    global _LIST_CACHE
+    try:
+        mtime = os.stat(ACCOUNTS_DIR).st_mtime_ns
+    except FileNotFoundError:
         return []
+    if _LIST_CACHE and _LIST_CACHE[0] == mtime:
+        return list(_LIST_CACHE[1])
     ids_ = []
-    for p in ACCOUNTS_DIR.iterdir():
-        if p.suffix in (".yaml", ".yml") and p.stem != "example":
-            ids_.append(p.stem)
-    return sorted(ids_)
+    with os.scandir(ACCOUNTS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith(".yaml"):
+                stem = name[:-5]
+            elif name.endswith(".yml"):
+                stem = name[:-4]
+            else:
+                continue
+            if stem and stem != "example":
+                ids_.append(stem)
+    ids_.sort()
+    _LIST_CACHE = (mtime, ids_)
+    return list(ids_)
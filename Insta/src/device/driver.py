@@ -4,16 +4,44 @@ No automated login: user must be already logged in on the device.
 """
 from __future__ import annotations
 
+import shutil
+import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
+# appium (and selenium/urllib3 under it) is imported on first use, not at module load
+if TYPE_CHECKING:
+    from appium import webdriver
 
 # Project root for config
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# adb resolved once per process (falls back to PATH lookup at call time if not found now)
+_ADB = shutil.which("adb") or "adb"
+
+# ApplicationState.RUNNING_IN_FOREGROUND as returned by query_app_state
+APP_STATE_FOREGROUND = 4
+
+
+def _wait_foreground(
+    driver: "webdriver.WebDriver",
+    package: str,
+    timeout: float = 3.0,
+    interval: float = 0.1,
+) -> bool:
+    """Poll until package is in the foreground (or timeout). Returns True once it is."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if driver.query_app_state(package) == APP_STATE_FOREGROUND:
+                return True
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
 
 def create_driver(
     package: str = "com.instagram.android",
@@ -27,6 +55,9 @@ def create_driver(
     Assumes Appium server is running (e.g. appium or appium server) and device is connected.
     If activity is None, we'll activate the app after creating the driver (recommended for noReset=True).
     """
+    from appium import webdriver
+    from appium.options.android import UiAutomator2Options
+
     options = UiAutomator2Options()
     options.app_package = package
     # Don't clear app data: we reuse existing session (manual login only)
@@ -51,18 +82,24 @@ def create_driver(
     if not activity:
         try:
             driver.activate_app(package)
-            time.sleep(1)
+            _wait_foreground(driver, package)
         except Exception:
             # Fallback: use adb to launch the app's main launcher activity
-            import subprocess
-            adb_cmd = ["adb"]
+            adb_cmd = [_ADB]
             if adb_serial:
                 adb_cmd.extend(["-s", adb_serial])
             # Use monkey to launch app (doesn't require exact activity name)
             adb_cmd.extend(["shell", "monkey", "-p", package, "-c", "android.intent.category.LAUNCHER", "1"])
             try:
-                subprocess.run(adb_cmd, capture_output=True, timeout=5, check=False)
-                time.sleep(2)
+                # Output is never read: discard it instead of buffering through pipes
+                subprocess.run(
+                    adb_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                    check=False,
+                )
+                _wait_foreground(driver, package)
             except Exception:
                 pass  # If this fails, user can manually open Instagram
     
@@ -75,4 +112,4 @@ def ensure_app_foreground(driver: webdriver.WebDriver, package: str = "com.insta
         driver.activate_app(package)
     except Exception:
         driver.start_activity(package, None)
-    time.sleep(1)
+    _wait_foreground(driver, package)
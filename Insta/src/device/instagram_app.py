@@ -5,7 +5,9 @@ Mobile-only; no login automation. Assumes user is already logged in.
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from contextlib import nullcontext
 from typing import List, Optional, Tuple
 
 from appium.webdriver import WebElement
@@ -29,29 +31,49 @@ FIND_POLL = 0.5
 MAX_SWIPES = 50
 
 
-def _find_element(driver: WebDriver, selectors: List[Tuple[str, str]], timeout: float = FIND_TIMEOUT) -> Optional[WebElement]:
+def _find_element(
+    driver: WebDriver,
+    selectors: List[Tuple[str, str]],
+    timeout: float = FIND_TIMEOUT,
+    stop: Optional[threading.Event] = None,
+    lock: Optional[threading.RLock] = None,
+) -> Optional[WebElement]:
+    """
+    First displayed element matched by selectors, polled until timeout. For concurrent probes on one
+    session: each driver call runs under lock, and the search gives up once stop is set.
+    """
     by_map = {
         "accessibility id": AppiumBy.ACCESSIBILITY_ID,
         "id": AppiumBy.ID,
         "xpath": AppiumBy.XPATH,
         "class name": AppiumBy.CLASS_NAME,
     }
+    guard = lock if lock is not None else nullcontext()
     end = time.time() + timeout
     last_error = None
-    while time.time() < end:
+    # Always make at least one pass, so timeout=0 is a single immediate probe
+    while True:
         for by_key, locator in selectors:
+            if stop is not None and stop.is_set():
+                return None
             try:
                 by = by_map.get(by_key, by_key)
-                el = driver.find_element(by, locator)
-                if el and el.is_displayed():
-                    return el
+                with guard:
+                    el = driver.find_element(by, locator)
+                    if el and el.is_displayed():
+                        return el
             except NoSuchElementException:
                 continue
             except WebDriverException as e:
                 last_error = e
                 continue
-        time.sleep(FIND_POLL)
-    return None
+        if time.time() >= end:
+            return None
+        if stop is not None:
+            if stop.wait(FIND_POLL):
+                return None
+        else:
+            time.sleep(FIND_POLL)
 
 
 def _tap_element(driver: WebDriver, element: WebElement) -> None:
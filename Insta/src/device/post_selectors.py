@@ -3,7 +3,11 @@ Selectors for Instagram posting UI elements.
 """
 from __future__ import annotations
 
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
+
+# Selector builders are memoized: each returns the same immutable tuple on every call
+Selectors = Tuple[Tuple[str, str], ...]
 
 # Appium locator strategies
 BY_ACCESSIBILITY_ID = "accessibility id"
@@ -11,10 +15,14 @@ BY_ID = "id"
 BY_XPATH = "xpath"
 BY_CLASS = "class name"
 
+# One UiAutomator query for the create-post (+) button: content-desc containing New...post, Create or Add
+NEW_POST_UIAUTOMATOR = 'new UiSelector().descriptionMatches("(?is).*(new.*post|create|add).*")'
+
 
-def create_post_button_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def create_post_button_selectors() -> Selectors:
     """Create post button (+ icon) - generic (feed tab bar or elsewhere)."""
-    return [
+    return (
         (BY_ACCESSIBILITY_ID, "New post"),
         (BY_ACCESSIBILITY_ID, "New Post"),
         (BY_ACCESSIBILITY_ID, "Create"),
@@ -24,12 +32,13 @@ def create_post_button_selectors() -> List[Tuple[str, str]]:
         (BY_XPATH, "//android.widget.ImageButton[contains(@content-desc, 'New')]"),
         (BY_XPATH, "//android.widget.ImageButton[contains(@content-desc, 'Create')]"),
         (BY_XPATH, "//*[contains(@resource-id, 'tab_bar')]//android.widget.ImageButton[position()=3]"),
-    ]
+    )
 
 
-def create_post_button_on_profile_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def create_post_button_on_profile_selectors() -> Selectors:
     """Create post (+) button on Profile screen - usually top left in the action bar."""
-    return [
+    return (
         (BY_ACCESSIBILITY_ID, "New post"),
         (BY_ACCESSIBILITY_ID, "New Post"),
         (BY_ACCESSIBILITY_ID, "Create"),
@@ -44,120 +53,159 @@ def create_post_button_on_profile_selectors() -> List[Tuple[str, str]]:
         (BY_XPATH, "//android.widget.ImageButton[contains(@content-desc, 'Create')]"),
         (BY_XPATH, "//android.widget.ImageView[contains(@content-desc, 'New')]"),
         (BY_XPATH, "//android.widget.ImageView[contains(@content-desc, 'Create')]"),
-    ]
+    )
 
 
-def gallery_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def gallery_selectors() -> Selectors:
     """Gallery/file picker button."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@content-desc, 'Gallery') or contains(@content-desc, 'gallery')]"),
         (BY_XPATH, "//*[contains(@resource-id, 'gallery')]"),
         (BY_XPATH, "//*[contains(@text, 'Gallery')]"),
-    ]
+    )
+
+
+@lru_cache(maxsize=None)
+def gallery_thumbnail_selectors() -> Selectors:
+    """Media thumbnails in the gallery grid (present once the picker has loaded)."""
+    return (
+        (BY_XPATH, "//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView"),
+        (BY_XPATH, "//android.widget.ImageView[@clickable='true']"),
+        (BY_XPATH, "//*[contains(@resource-id, 'thumbnail')]"),
+    )
 
 
-def photo_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def multi_select_selectors() -> Selectors:
+    """Gallery "Select multiple" toggle (carousel multi-select mode)."""
+    return (
+        (BY_XPATH, "//*[contains(@content-desc, 'Select multiple') or contains(@content-desc, 'select multiple')]"),
+        (BY_XPATH, "//*[contains(@resource-id, 'multi_select')]"),
+        (BY_XPATH, "//*[contains(@text, 'Select multiple')]"),
+    )
+
+
+@lru_cache(maxsize=None)
+def photo_selectors() -> Selectors:
     """Photo option in create post menu."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Photo') or contains(@text, 'photo')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Photo')]"),
-    ]
+    )
 
 
-def video_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def video_selectors() -> Selectors:
     """Video option in create post menu."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Video') or contains(@text, 'video')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Video')]"),
-    ]
+    )
 
 
-def reel_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def reel_selectors() -> Selectors:
     """Reel option in create post menu."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Reel') or contains(@text, 'reel')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Reel')]"),
-    ]
+    )
 
 
-def post_option_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def post_option_selectors() -> Selectors:
     """Post option in the first create menu (Post | Story | Reel | Live)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Post') and not(contains(@text, 'Story'))]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Post') and not(contains(@content-desc, 'Story'))]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Post')]"),
-    ]
+    )
 
 
-def next_button_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def next_button_selectors() -> Selectors:
     """Next/Continue button (crop and composer steps)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Next') or contains(@text, 'next')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Next')]"),
         (BY_XPATH, "//*[contains(@resource-id, 'next')]"),
         (BY_XPATH, "//*[contains(@text, 'Continue') or contains(@text, 'continue')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Continue')]"),
-    ]
+    )
 
 
-def continue_button_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def continue_button_selectors() -> Selectors:
     """Continue / Proceed button (crop or intermediate steps)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Continue') or contains(@text, 'continue')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Continue')]"),
         (BY_XPATH, "//*[contains(@text, 'Proceed') or contains(@text, 'proceed')]"),
-    ]
+    )
 
 
-def caption_input_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def caption_input_selectors() -> Selectors:
     """Caption text input field."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@resource-id, 'caption')]"),
         (BY_XPATH, "//*[contains(@resource-id, 'row_caption')]//android.widget.EditText"),
         (BY_XPATH, "//android.widget.EditText[contains(@hint, 'Write a caption') or contains(@hint, 'caption')]"),
         (BY_CLASS, "android.widget.EditText"),
-    ]
+    )
 
 
-def share_post_button_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def share_post_button_selectors() -> Selectors:
     """Share/Post button."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Share') or contains(@text, 'Post')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Share') or contains(@content-desc, 'Post')]"),
         (BY_XPATH, "//*[contains(@resource-id, 'share') or contains(@resource-id, 'post')]"),
-    ]
+    )
 
 
-def add_more_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def add_more_selectors() -> Selectors:
     """Add more photos button (for carousel)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Add more') or contains(@text, 'add more')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Add more')]"),
         (BY_XPATH, "//*[contains(@text, 'Add photo') or contains(@text, 'Add')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Add')]"),
         (BY_XPATH, "//*[contains(@resource-id, 'add')]"),
-    ]
+    )
 
 
-def done_button_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def done_button_selectors() -> Selectors:
     """Done button (after selecting media)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Done') or contains(@text, 'done')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Done')]"),
-    ]
+    )
+
+
+@lru_cache(maxsize=None)
+def next_or_done_selectors() -> Selectors:
+    """Next or Done button: either one means the picker accepted a selection."""
+    return next_button_selectors() + done_button_selectors()
 
 
-def filter_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def filter_selectors() -> Selectors:
     """Filter button (optional, can skip)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Filter') or contains(@text, 'filter')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Filter')]"),
-    ]
+    )
 
 
-def skip_button_selectors() -> List[Tuple[str, str]]:
+@lru_cache(maxsize=None)
+def skip_button_selectors() -> Selectors:
     """Skip button (for optional steps)."""
-    return [
+    return (
         (BY_XPATH, "//*[contains(@text, 'Skip') or contains(@text, 'skip')]"),
         (BY_XPATH, "//*[contains(@content-desc, 'Skip')]"),
-    ]
+    )
@@ -5,10 +5,19 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import random
+import re
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from string import Formatter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +27,116 @@ CAPTIONS_DIR = PROJECT_ROOT / "captions"
 CAPTIONS_TEMPLATES = CAPTIONS_DIR / "templates.json"
 CAPTIONS_HASHTAGS = CAPTIONS_DIR / "hashtags.json"
 
+DEFAULT_TEMPLATES = {
+    "photo": [
+        "{caption}",
+        "✨ {caption}",
+        "📸 {caption}",
+        "{caption} ✨",
+    ],
+    "video": [
+        "{caption}",
+        "🎥 {caption}",
+        "📹 {caption}",
+    ],
+    "reel": [
+        "{caption}",
+        "🎬 {caption}",
+        "✨ {caption}",
+        "{caption} 💯",
+    ],
+    "carousel": [
+        "{caption}",
+        "📸 {caption}",
+        "✨ {caption}",
+    ],
+}
+
+DEFAULT_HASHTAGS = {
+    "general": [
+        "#instagood", "#photooftheday", "#beautiful", "#picoftheday",
+        "#instadaily", "#photography", "#love", "#nature", "#art",
+    ],
+    "photo": [
+        "#photography", "#photo", "#photographer", "#photoshoot",
+    ],
+    "video": [
+        "#video", "#videography", "#videographer", "#videooftheday",
+    ],
+    "reel": [
+        "#reels", "#reelsinstagram", "#reel", "#reelitfeelit",
+        "#reelsvideo", "#reelsindia",
+    ],
+    "niche": [],
+}
+
+# Caption files already created/verified by _ensure_files in this process
+_ENSURED: Set[Path] = set()
+
+# Parsed JSON per path, reused while st_mtime_ns is unchanged (shared across CaptionManager instances)
+_TEMPLATES_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+_HASHTAGS_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_json_cached(path: Path, cache: Dict[Path, Tuple[int, Dict[str, Any]]]) -> Dict[str, List[str]]:
+    """Load a {name: [str, ...]} JSON file via the mtime-keyed cache. Lists are copied so callers may mutate them."""
+    mtime = path.stat().st_mtime_ns
+    cached = cache.get(path)
+    if cached and cached[0] == mtime:
+        data = cached[1]
+    else:
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        cache[path] = (mtime, data)
+    return {k: list(v) for k, v in data.items()}
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Serialize obj and write it in one go; the temp file + os.replace keeps readers from seeing a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(_dumps(obj))
+    os.replace(tmp, path)
+
+
+_TIME_FIELDS = frozenset(("date", "time"))
+
+
+def _compile_template(template: str) -> Tuple[Callable[[Dict[str, Any]], str], FrozenSet[str]]:
+    """
+    Parse a caption template once. Returns (renderer, field names) where renderer(variables) is
+    equivalent to template.format_map(variables). Plain "{name}" fields are joined directly;
+    anything fancier (specs, conversions, attribute or index access, positional fields) falls
+    back to format_map.
+    """
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return template.format_map, _TIME_FIELDS  # raises the same error at render time
+    fields = frozenset(
+        re.split(r"[.\[]", field, maxsplit=1)[0] for _, field, _, _ in parsed if field
+    )
+    pieces: List[Tuple[str, Optional[str]]] = []
+    for literal, field, spec, conv in parsed:
+        if field is not None and (spec or conv or not field.isidentifier()):
+            return template.format_map, fields
+        pieces.append((literal, field))
+
+    def render(variables: Dict[str, Any]) -> str:
+        out = []
+        for literal, field in pieces:
+            out.append(literal)
+            if field is not None:
+                out.append(format(variables[field], ""))
+        return "".join(out)
+
+    return render, fields
+
 
 class CaptionManager:
     """Manages captions and hashtags."""
@@ -27,80 +146,49 @@ class CaptionManager:
         self.hashtags_file = hashtags_file or CAPTIONS_HASHTAGS
         self._ensure_files()
         self.templates: Dict[str, List[str]] = {}
+        # media_type -> [(template, renderer, field names)], kept in step with self.templates
+        self._compiled: Dict[str, List[Tuple[str, Callable[[Dict[str, Any]], str], FrozenSet[str]]]] = {}
         self.hashtag_pools: Dict[str, List[str]] = {}
+        # Deduplicated union per sorted tuple of pool names; cleared whenever pools change
+        self._pool_union_cache: Dict[Tuple[str, ...], List[str]] = {}
         self._load_templates()
         self._load_hashtags()
     
     def _ensure_files(self):
-        """Create default caption/hashtag files if they don't exist."""
+        """Create default caption/hashtag files if they don't exist (checked once per path per process)."""
+        if self.templates_file in _ENSURED and self.hashtags_file in _ENSURED:
+            return
         self.templates_file.parent.mkdir(parents=True, exist_ok=True)
         
         if not self.templates_file.exists():
-            default_templates = {
-                "photo": [
-                    "{caption}",
-                    "✨ {caption}",
-                    "📸 {caption}",
-                    "{caption} ✨",
-                ],
-                "video": [
-                    "{caption}",
-                    "🎥 {caption}",
-                    "📹 {caption}",
-                ],
-                "reel": [
-                    "{caption}",
-                    "🎬 {caption}",
-                    "✨ {caption}",
-                    "{caption} 💯",
-                ],
-                "carousel": [
-                    "{caption}",
-                    "📸 {caption}",
-                    "✨ {caption}",
-                ],
-            }
-            with open(self.templates_file, "w", encoding="utf-8") as f:
-                json.dump(default_templates, f, indent=2)
+            _write_json(self.templates_file, DEFAULT_TEMPLATES)
         
         if not self.hashtags_file.exists():
-            default_hashtags = {
-                "general": [
-                    "#instagood", "#photooftheday", "#beautiful", "#picoftheday",
-                    "#instadaily", "#photography", "#love", "#nature", "#art",
-                ],
-                "photo": [
-                    "#photography", "#photo", "#photographer", "#photoshoot",
-                ],
-                "video": [
-                    "#video", "#videography", "#videographer", "#videooftheday",
-                ],
-                "reel": [
-                    "#reels", "#reelsinstagram", "#reel", "#reelitfeelit",
-                    "#reelsvideo", "#reelsindia",
-                ],
-                "niche": [],
-            }
-            with open(self.hashtags_file, "w", encoding="utf-8") as f:
-                json.dump(default_hashtags, f, indent=2)
+            _write_json(self.hashtags_file, DEFAULT_HASHTAGS)
+        _ENSURED.add(self.templates_file)
+        _ENSURED.add(self.hashtags_file)
     
     def _load_templates(self):
         """Load caption templates."""
         try:
-            with open(self.templates_file, "r", encoding="utf-8") as f:
-                self.templates = json.load(f)
+            self.templates = _load_json_cached(self.templates_file, _TEMPLATES_CACHE)
         except Exception as e:
             logger.warning("Failed to load templates: %s", e)
             self.templates = {}
+        self._compiled = {
+            media_type: [(t, *_compile_template(t)) for t in templates]
+            for media_type, templates in self.templates.items()
+        }
     
     def _load_hashtags(self):
         """Load hashtag pools."""
         try:
-            with open(self.hashtags_file, "r", encoding="utf-8") as f:
-                self.hashtag_pools = json.load(f)
+            pools = _load_json_cached(self.hashtags_file, _HASHTAGS_CACHE)
+            self.hashtag_pools = {k: list(dict.fromkeys(v)) for k, v in pools.items()}
         except Exception as e:
             logger.warning("Failed to load hashtags: %s", e)
             self.hashtag_pools = {}
+        self._pool_union_cache.clear()
     
     def generate_caption(
         self,
@@ -109,19 +197,24 @@ class CaptionManager:
         variables: Optional[Dict[str, str]] = None,
     ) -> str:
         """Generate caption from template."""
-        variables = variables or {}
-        variables.setdefault("caption", base_caption or "")
-        variables.setdefault("date", datetime.now().strftime("%B %d, %Y"))
-        variables.setdefault("time", datetime.now().strftime("%I:%M %p"))
-        
-        templates = self.templates.get(media_type, [])
+        templates = self._compiled.get(media_type)
         if not templates:
             return base_caption or ""
         
-        template = random.choice(templates)
+        template, render, fields = random.choice(templates)
+        
+        variables = variables or {}
+        variables.setdefault("caption", base_caption or "")
+        # Only look up the clock when the chosen template actually uses {date}/{time}
+        if not fields.isdisjoint(_TIME_FIELDS):
+            now = datetime.now()
+            if "date" in fields:
+                variables.setdefault("date", now.strftime("%B %d, %Y"))
+            if "time" in fields:
+                variables.setdefault("time", now.strftime("%I:%M %p"))
         
         try:
-            caption = template.format(**variables)
+            caption = render(variables)
         except KeyError:
             caption = base_caption or template
         
@@ -136,22 +229,18 @@ class CaptionManager:
         """Get random hashtags from pools."""
         pools = pools or ["general", media_type]
         
-        all_hashtags = []
-        for pool_name in pools:
-            if pool_name in self.hashtag_pools:
-                all_hashtags.extend(self.hashtag_pools[pool_name])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_hashtags = []
-        for tag in all_hashtags:
-            if tag not in seen:
-                seen.add(tag)
-                unique_hashtags.append(tag)
+        key = tuple(sorted(pools))
+        unique_hashtags = self._pool_union_cache.get(key)
+        if unique_hashtags is None:
+            # Pools are already deduplicated; union them without duplicates
+            unique_hashtags = list(dict.fromkeys(chain.from_iterable(
+                self.hashtag_pools[name] for name in key if name in self.hashtag_pools
+            )))
+            self._pool_union_cache[key] = unique_hashtags
         
-        # Shuffle and return requested count
-        random.shuffle(unique_hashtags)
-        return unique_hashtags[:count]
+        # Sample the requested count (no full shuffle of the pool)
+        k = max(0, min(count, len(unique_hashtags)))
+        return random.sample(unique_hashtags, k)
     
     def format_caption_with_hashtags(
         self,
@@ -159,36 +248,33 @@ class CaptionManager:
         hashtags: List[str],
         hashtag_position: str = "end",
     ) -> str:
-        """Format caption with hashtags."""
+        """Format caption with hashtags ("beginning" puts them first; "end"/"separate" append them)."""
+        if not hashtags:
+            return caption
         hashtag_str = " ".join(hashtags)
-        
-        if hashtag_position == "end":
-            return f"{caption}\n\n{hashtag_str}" if hashtags else caption
-        elif hashtag_position == "beginning":
-            return f"{hashtag_str}\n\n{caption}" if hashtags else caption
-        else:  # separate
-            return f"{caption}\n\n{hashtag_str}" if hashtags else caption
+        if hashtag_position == "beginning":
+            return f"{hashtag_str}\n\n{caption}"
+        return f"{caption}\n\n{hashtag_str}"
     
     def add_template(self, media_type: str, template: str):
         """Add a new caption template."""
         if media_type not in self.templates:
             self.templates[media_type] = []
         self.templates[media_type].append(template)
+        self._compiled.setdefault(media_type, []).append((template, *_compile_template(template)))
         self._save_templates()
     
     def add_hashtags(self, pool_name: str, hashtags: List[str]):
         """Add hashtags to a pool."""
-        if pool_name not in self.hashtag_pools:
-            self.hashtag_pools[pool_name] = []
-        self.hashtag_pools[pool_name].extend(hashtags)
+        existing = self.hashtag_pools.get(pool_name, [])
+        self.hashtag_pools[pool_name] = list(dict.fromkeys(chain(existing, hashtags)))
+        self._pool_union_cache.clear()
         self._save_hashtags()
     
     def _save_templates(self):
         """Save templates to file."""
-        with open(self.templates_file, "w", encoding="utf-8") as f:
-            json.dump(self.templates, f, indent=2)
+        _write_json(self.templates_file, self.templates)
     
     def _save_hashtags(self):
         """Save hashtags to file."""
-        with open(self.hashtags_file, "w", encoding="utf-8") as f:
-            json.dump(self.hashtag_pools, f, indent=2)
+        _write_json(self.hashtags_file, self.hashtag_pools)
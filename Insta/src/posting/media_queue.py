@@ -6,7 +6,7 @@ from __future__ import annotations
 import json
 import logging
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional
 
@@ -132,6 +132,33 @@ class MediaQueue:
             
             return self._row_to_post_item(row)
     
+    def next_due_time(self, account_id: Optional[str] = None, db_path: Optional[Path] = None) -> Optional[datetime]:
+        """Earliest scheduled_time among pending/scheduled posts (naive UTC), or None if nothing is scheduled."""
+        db_path = db_path or self.db_path
+        with db_module.cursor(db_path) as cur:
+            if account_id:
+                cur.execute(
+                    """
+                    SELECT MIN(scheduled_time) FROM post_queue
+                    WHERE account_id = ? AND status IN ('pending', 'scheduled') AND scheduled_time IS NOT NULL
+                    """,
+                    (account_id,),
+                )
+            else:
+                cur.execute(
+                    """
+                    SELECT MIN(scheduled_time) FROM post_queue
+                    WHERE status IN ('pending', 'scheduled') AND scheduled_time IS NOT NULL
+                    """
+                )
+            row = cur.fetchone()
+        if not row or not row[0]:
+            return None
+        due = datetime.fromisoformat(row[0].replace("Z", "+00:00"))
+        if due.tzinfo is not None:
+            due = due.astimezone(timezone.utc).replace(tzinfo=None)
+        return due
+    
     def update_status(
         self,
         post_id: int,
@@ -168,6 +195,41 @@ class MediaQueue:
         
         logger.info("Updated post %s status to %s", post_id, status.value)
     
+    def claim_post(self, post_id: int, db_path: Optional[Path] = None) -> bool:
+        """
+        Atomically move a queued (pending/scheduled) or failed post to POSTING; failed stays claimable so
+        a manual retry works. Returns False if the post is posting or already posted (another request
+        or process got there first), so the same post is never dispatched twice.
+        """
+        db_path = db_path or self.db_path
+        with db_module.cursor(db_path) as cur:
+            cur.execute(
+                "UPDATE post_queue SET status = ?, error_message = NULL"
+                " WHERE id = ? AND status IN ('pending', 'scheduled', 'failed')",
+                (PostStatus.POSTING.value, post_id),
+            )
+            claimed = cur.rowcount == 1
+        if claimed:
+            logger.info("Updated post %s status to %s", post_id, PostStatus.POSTING.value)
+        return claimed
+    
+    def recover_interrupted_posts(self, db_path: Optional[Path] = None) -> int:
+        """
+        Mark posts left in POSTING by a crashed or killed process as FAILED so they can be claimed
+        (retried) again. Call at startup, before anything in this process starts posting.
+        """
+        db_path = db_path or self.db_path
+        with db_module.cursor(db_path) as cur:
+            cur.execute(
+                "UPDATE post_queue SET status = ?, error_message = ? WHERE status = ?",
+                (PostStatus.FAILED.value, "Interrupted while posting (process stopped); retry to post again",
+                 PostStatus.POSTING.value),
+            )
+            recovered = cur.rowcount
+        if recovered:
+            logger.warning("Reset %s interrupted post(s) from posting to failed", recovered)
+        return recovered
+    
     def mark_posted(self, post_id: int, success: bool = True, error_message: Optional[str] = None, db_path: Optional[Path] = None):
         """Mark post as posted and move files."""
         db_path = db_path or self.db_path
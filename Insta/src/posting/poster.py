@@ -4,11 +4,31 @@ Uses see-decide-act state machine: detect screen state, decide action, act, repe
 """
 from __future__ import annotations
 
+import atexit
+import base64
+import hashlib
+import io
+import json
 import logging
+import os
+import queue
+import random
+import shlex
+import shutil
 import subprocess
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from concurrent.futures import wait as futures_wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # type: ignore
 
 from src.device import post_selectors as post_sel
 from src.posting.models import MediaType, PostItem
@@ -17,7 +37,13 @@ from src.posting.screen_state import (
     get_posting_screen_state,
     get_action_for_state,
     find_element_by_intent,
+    find_tap_point_by_intent,
+    count_selected,
+    gallery_thumbnail_points,
+    node_bounds,
+    parse_page_source,
     dump_screen_summary,
+    save_debug_image,
 )
 
 import sys
@@ -25,6 +51,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from selenium.common.exceptions import WebDriverException
+
 from src.device.instagram_app import _find_element, _tap_element, _tap_element_robust
 
 logger = logging.getLogger(__name__)
@@ -32,24 +60,341 @@ logger = logging.getLogger(__name__)
 MAX_POST_STEPS = 25
 UNKNOWN_STEPS_BEFORE_FAIL = 4
 STEP_SLEEP_SEC = 1.5
+# Max wait in _find_any for losing probes to finish their in-flight driver call after being stopped
+PROBE_DRAIN_SEC = 2.0
+# Pushed media goes to DCIM so Android media scanner and Instagram picker can find it
+DEVICE_MEDIA_DIR = "/sdcard/DCIM/InstagramPost/"
+# Marker echoed after each command on the persistent adb shell (followed by the exit code)
+SHELL_SENTINEL = "__END__"
+# UiAutomator2 settings applied per session: the defaults wait up to 10s for the UI to go idle
+# before every lookup, which Instagram's animated screens rarely do. Disable with fast_idle=False.
+FAST_IDLE_SETTINGS = {
+    "waitForIdleTimeout": 500,
+    "waitForSelectorTimeout": 1000,
+    "actionAcknowledgmentTimeout": 500,
+}
+# Candidate XPaths for the first gallery thumbnail, in default try order
+GALLERY_IMAGE_XPATHS = (
+    "//android.widget.ImageView[@clickable='true'][1]",
+    "//android.widget.ImageView[1]",
+    "//*[contains(@resource-id, 'thumbnail') or contains(@resource-id, 'image')][1]",
+    "//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView[1]",
+    "//*[@clickable='true']//android.widget.ImageView[1]",
+)
+# Last gallery XPath that worked, per Instagram version; lets warm starts try the winner first
+SELECTOR_PGO_PATH = PROJECT_ROOT / "data" / "selector_pgo.json"
+# How long one page-source snapshot is reused by state detection and intent lookups
+SNAPSHOT_TTL_SEC = 0.4
+# After acting, how long to wait for the page source to change before re-classifying anyway
+UNCHANGED_WAIT_SEC = 2.0
+INSTAGRAM_PACKAGE = "com.instagram.android"
+# Launch Instagram straight onto the Profile tab (-W: return once the activity is displayed)
+PROFILE_INTENT_CMD = f"am start -W -n {INSTAGRAM_PACKAGE}/.activity.MainTabActivity --es tab profile"
+# After tapping Share: poll for SUCCESS/PROFILE starting at this interval (backing off), for at most this long
+SHARE_VERIFY_POLL_SEC = 0.5
+SHARE_VERIFY_SEC = 30.0
+# Screen-state polling backs off from POLL_START_SEC, doubling up to POLL_CAP_SEC, plus up to POLL_JITTER_SEC
+POLL_START_SEC = 0.25
+POLL_CAP_SEC = 2.0
+POLL_JITTER_SEC = 0.1
+# ADBKeyBoard (https://github.com/senzhk/ADBKeyBoard) IME: when installed, captions are sent in one broadcast
+ADB_KEYBOARD_IME = "com.android.adbkeyboard/.AdbIME"
+# Upper bound on waiting for a background push (adb push + verify) before opening the gallery
+PUSH_WAIT_SEC = 90.0
+
+
+# stderr fragments of adb failures worth retrying (device briefly dropped off the transport)
+ADB_TRANSIENT_ERRORS = (b"device offline", b"error: closed", b"device still authorizing")
+
+
+def _backoff_delay(attempt: int, base: float = 0.4) -> float:
+    """Exponential backoff with a little jitter: base * 2**attempt + [0, 0.1)."""
+    return base * 2 ** attempt + random.random() * 0.1
+
+
+def _retry(fn, attempts: int = 3, base: float = 0.4, on=(WebDriverException, TimeoutError), retry_if=None):
+    """
+    Call fn() up to attempts times with exponential backoff between tries.
+    Retries when fn raises one of `on`, or when retry_if(result) is true. The last exception is
+    re-raised (or the last result returned) once attempts are exhausted.
+    """
+    for k in range(attempts):
+        last = k == attempts - 1
+        try:
+            result = fn()
+        except on:
+            if last:
+                raise
+            time.sleep(_backoff_delay(k, base))
+            continue
+        if last or retry_if is None or not retry_if(result):
+            return result
+        time.sleep(_backoff_delay(k, base))
+
+
+def _adb_transient_failure(result: subprocess.CompletedProcess) -> bool:
+    err = result.stderr or b""
+    return result.returncode != 0 and any(msg in err for msg in ADB_TRANSIENT_ERRORS)
+
+
+def _file_md5(path: Path) -> str:
+    """Hex MD5 of a local file, read in chunks."""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _wait_until(predicate, timeout: float, interval: float = 0.15):
+    """Call predicate until it returns something truthy or timeout elapses. Returns its last result."""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = predicate()
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(interval)
+
+
+class _TapPoint:
+    """Stand-in for a WebElement located in the page-source snapshot: click() taps its center."""
+
+    def __init__(self, driver, x: int, y: int, width: int = 0, height: int = 0):
+        self.driver = driver
+        self.location = {"x": x - width // 2, "y": y - height // 2}
+        self.size = {"width": width, "height": height}
+        self._point = (x, y)
+
+    def click(self) -> None:
+        self.driver.tap([self._point], 100)
+
+    def is_displayed(self) -> bool:
+        return True
 
 
 class InstagramPoster:
     """Handles posting to Instagram via Appium."""
     
-    def __init__(self, driver, account_id: str, adb_serial: Optional[str] = None):
+    def __init__(self, driver, account_id: str, adb_serial: Optional[str] = None, fast_idle: bool = True):
         self.driver = driver
         self.account_id = account_id
         self.adb_serial = adb_serial  # e.g. emulator-5554 for adb -s
+        if fast_idle:
+            try:
+                self.driver.update_settings(FAST_IDLE_SETTINGS)
+            except Exception as e:
+                logger.debug("Could not apply UiAutomator2 idle settings: %s", e)
+        # Long-lived `adb shell` (started on first use) so shell commands skip per-call adb spawn/handshake
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_lines: Optional[queue.Queue] = None
+        self._shell_lock = threading.Lock()
+        self._device_dir_ready = False
+        # Window size is fixed for the session (we never rotate); fetched once on first use
+        self._wsize: Optional[Tuple[int, int]] = None
+        # (page source, parsed root, time fetched); see _snapshot()
+        self._snap: Optional[Tuple[str, object, float]] = None
+        # (page-source digest, state) of the last classification; see _cached_state()
+        self._state_memo: Optional[Tuple[bytes, PostingScreenState]] = None
+        # Worker threads for concurrent element probes and background pushes (created on first use)
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
+        # Serializes driver calls made from _find_any probe threads (one Appium session, not thread-safe)
+        self._driver_lock = threading.RLock()
+        self._push_pool: Optional[ThreadPoolExecutor] = None
+        self._ig_version: Optional[str] = None
+        self._last_good_xpath: Optional[Dict[str, str]] = None  # loaded from SELECTOR_PGO_PATH on first use
+        self._adb_keyboard: Optional[bool] = None  # ADBKeyBoard installed? (checked on first text input)
+        # hash(page source) of the screen we last acted on; None after fallback taps or no action
+        self._last_src_hash: Optional[int] = None
+        # States that already got a full UI-tree stuck dump this post; later ones are screenshot-only
+        self._stuck_dumps_done: Set[PostingScreenState] = set()
+        # Page-source digests of recent stuck dumps (skips re-dumping an identical screen without a stat)
+        self._recent_dumps: Deque[str] = deque(maxlen=16)
     
+    def _snapshot(self, ttl: float = SNAPSHOT_TTL_SEC) -> Tuple[str, object]:
+        """Page source + parsed XML root, fetched once and shared for ttl seconds."""
+        now = time.monotonic()
+        if self._snap is None or now - self._snap[2] > ttl:
+            try:
+                src = self.driver.page_source or ""
+            except Exception:
+                src = ""
+            self._snap = (src, parse_page_source(src), now)
+        return self._snap[0], self._snap[1]
+
+    def _invalidate_snapshot(self) -> None:
+        self._snap = None
+
+    def _cached_state(self, ttl_ms: int = 250) -> PostingScreenState:
+        """
+        Screen state for the current snapshot (refetched if older than ttl_ms). Classification runs a
+        dozen element lookups, so the result is memoized by a digest of the page source: an identical
+        UI tree is the same screen, and back-to-back queries skip the lookups.
+        """
+        src, root = self._snapshot(ttl=ttl_ms / 1000)
+        key = hashlib.blake2b(src.encode("utf-8", "replace"), digest_size=16).digest()
+        if self._state_memo is not None and self._state_memo[0] == key:
+            return self._state_memo[1]
+        state = self._foreground_state_hint(root)
+        if state is None:
+            state = get_posting_screen_state(self.driver, page_source=src)
+        self._state_memo = (key, state)
+        return state
+
+    @staticmethod
+    def _foreground_state_hint(root) -> Optional[PostingScreenState]:
+        """
+        Cheap pre-check from the snapshot's package attributes: if no node belongs to Instagram (launcher
+        or another app in front) no posting screen can match, so skip the classifier's element probes,
+        which would all run to their timeouts. Returns None when the full classifier is needed.
+        Other packages alongside Instagram's (systemui, keyboard, permission dialog) don't count.
+        """
+        if root is None:
+            return None
+        seen_package = False
+        for node in root.iter():
+            package = node.get("package")
+            if package == INSTAGRAM_PACKAGE:
+                return None
+            if package:
+                seen_package = True
+        return PostingScreenState.UNKNOWN if seen_package else None
+
+    def _save_debug_image(self, name: str) -> None:
+        """Best-effort failure screenshot (name without extension; JPEG when Pillow is installed)."""
+        try:
+            save_debug_image(self.driver, name)
+        except Exception as e:
+            logger.debug("Screenshot failed: %s", e)
+
+    def _window(self) -> Tuple[int, int]:
+        """(width, height) of the device window, cached after the first query."""
+        if self._wsize is None:
+            size = self.driver.get_window_size()
+            self._wsize = (size["width"], size["height"])
+        return self._wsize
+
     def _adb_cmd(self, args: List[str], timeout: int = 30) -> subprocess.CompletedProcess:
         """Run adb with optional -s serial."""
         cmd = ["adb"]
         if self.adb_serial:
             cmd.extend(["-s", self.adb_serial])
         cmd.extend(args)
-        return subprocess.run(cmd, capture_output=True, timeout=timeout)
+        return _retry(
+            lambda: subprocess.run(cmd, capture_output=True, timeout=timeout),
+            on=(),
+            retry_if=_adb_transient_failure,
+        )
+
+    def _start_shell(self) -> None:
+        """Start the persistent adb shell and a reader thread feeding its output lines into a queue."""
+        cmd = ["adb"]
+        if self.adb_serial:
+            cmd.extend(["-s", self.adb_serial])
+        cmd.append("shell")
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        lines: queue.Queue = queue.Queue()
+
+        def _reader():
+            for line in proc.stdout:
+                lines.put(line)
+            lines.put(None)  # EOF: shell exited
+
+        threading.Thread(target=_reader, daemon=True).start()
+        self._shell, self._shell_lines = proc, lines
+        atexit.register(self.close_shell)
+
+    def close_shell(self) -> None:
+        """Close the persistent adb shell (safe to call more than once)."""
+        proc, self._shell = self._shell, None
+        self._shell_lines = None
+        atexit.unregister(self.close_shell)
+        if proc is None:
+            return
+        try:
+            proc.stdin.write("exit\n")
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+    def _shell_exec(self, command: str, timeout: float = 10) -> Tuple[int, str]:
+        """
+        Run a shell command on the device through the persistent adb shell.
+        Returns (exit code, combined stdout/stderr). Falls back to a one-shot `adb shell` if the
+        persistent shell can't be used; raises subprocess.TimeoutExpired on timeout.
+        """
+        with self._shell_lock:
+            try:
+                if self._shell is None or self._shell.poll() is not None:
+                    self._start_shell()
+                self._shell.stdin.write(f"{command}; echo {SHELL_SENTINEL}$?\n")
+                self._shell.stdin.flush()
+            except OSError as e:
+                logger.debug("Persistent adb shell unavailable (%s), using one-shot adb", e)
+                self.close_shell()
+                result = self._adb_cmd(["shell", command], timeout=int(timeout))
+                out = (result.stdout or b"") + (result.stderr or b"")
+                return result.returncode, out.decode(errors="replace")
+
+            out_lines = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._shell_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    # Shell state is unknown after a timeout; drop it so the next call starts fresh
+                    self.close_shell()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                if line is None:
+                    self.close_shell()
+                    return -1, "".join(out_lines)
+                idx = line.find(SHELL_SENTINEL)
+                if idx >= 0:
+                    if idx:
+                        out_lines.append(line[:idx])
+                    code = line[idx + len(SHELL_SENTINEL):].strip()
+                    return (int(code) if code.lstrip("-").isdigit() else -1), "".join(out_lines)
+                out_lines.append(line)
     
+    def _adb_keyboard_available(self) -> bool:
+        if self._adb_keyboard is None:
+            try:
+                _, out = self._shell_exec("ime list -s", timeout=5)
+                self._adb_keyboard = ADB_KEYBOARD_IME in out
+            except Exception:
+                self._adb_keyboard = False
+        return self._adb_keyboard
+
+    def _input_text(self, text: str) -> None:
+        """
+        Type text into the focused field. With ADBKeyBoard installed the whole text (newlines, emoji,
+        no length cap) goes in one broadcast and the previous IME is restored in the same shell command;
+        otherwise falls back to `input text`, which types per character and is capped at 500 chars.
+        """
+        if self._adb_keyboard_available():
+            msg = base64.b64encode(text.encode("utf-8")).decode("ascii")
+            rc, out = self._shell_exec(
+                "prev=$(settings get secure default_input_method); "
+                f"ime set {ADB_KEYBOARD_IME} >/dev/null && sleep 0.3 && "
+                f"am broadcast -a ADB_INPUT_B64 --es msg {msg} >/dev/null; rc=$?; "
+                'sleep 0.3; [ -n "$prev" ] && ime set "$prev" >/dev/null; (exit $rc)',
+                timeout=10,
+            )
+            if rc == 0:
+                return
+            logger.debug("ADBKeyBoard input failed (%s), falling back to input text", out.strip())
+        escaped = shlex.quote(text.replace("\n", " ").replace(" ", "%s")[:500])
+        self._shell_exec(f"input text {escaped}", timeout=5)
+
     def post_item(self, post_item: PostItem) -> bool:
         """Post a PostItem. Returns True if successful."""
         try:
@@ -77,43 +422,35 @@ class InstagramPoster:
         if el:
             return el
         
-        # 2) UIAutomator2: description contains New/Create/post
-        for desc in ["New post", "New Post", "Create", "new post", "create", "Add"]:
-            try:
-                el = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().descriptionContains("{desc}")')
-                if el and el.is_displayed():
-                    return el
-            except Exception:
-                continue
-        
+        # 2) UIAutomator2: description contains New...post/Create/Add (single server-side traversal)
         try:
-            el = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().descriptionContains("New").descriptionContains("post")')
+            el = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, post_sel.NEW_POST_UIAUTOMATOR)
             if el and el.is_displayed():
                 return el
         except Exception:
             pass
         
-        # 3) Top-left area: any clickable ImageButton/ImageView in top 15% of screen (action bar)
+        # 3) Top-left area: any clickable ImageButton/ImageView in top 15% of screen (action bar).
+        # Read bounds/clickable/displayed from one page-source snapshot instead of per-element calls.
         try:
-            size = self.driver.get_window_size()
-            h, w = size["height"], size["width"]
+            w, h = self._window()
             top_y_max = int(h * 0.15)
-            
-            for xpath in ["//android.widget.ImageButton", "//android.widget.ImageView"]:
-                els = self.driver.find_elements(AppiumBy.XPATH, xpath)
-                for el in els:
-                    try:
-                        if not el.is_displayed() or not el.get_attribute("clickable") == "true":
+            _, root = self._snapshot()
+            if root is not None:
+                for cls in ("android.widget.ImageButton", "android.widget.ImageView"):
+                    for node in root.iter(cls):
+                        if node.get("displayed", "true") != "true" or node.get("clickable") != "true":
                             continue
-                        loc = el.location
-                        if loc["y"] > top_y_max:
+                        b = node_bounds(node)
+                        if not b:
+                            continue
+                        x1, y1, x2, y2 = b
+                        if y1 > top_y_max:
                             continue
                         # Prefer left half of screen (top-left + button)
-                        if loc["x"] > w // 2:
+                        if x1 > w // 2:
                             continue
-                        return el
-                    except Exception:
-                        continue
+                        return _TapPoint(self.driver, (x1 + x2) // 2, (y1 + y2) // 2, x2 - x1, y2 - y1)
         except Exception:
             pass
         
@@ -133,6 +470,23 @@ class InstagramPoster:
         except Exception as e:
             logger.debug("Dismiss overlays failed (non-fatal): %s", e)
     
+    def _open_profile(self, app) -> bool:
+        """
+        Open the Profile tab with one `am start` intent; if that fails or lands elsewhere, fall back
+        to dismissing overlays with Back presses and tapping the Profile tab.
+        """
+        try:
+            rc, _ = self._shell_exec(PROFILE_INTENT_CMD, timeout=10)
+        except subprocess.TimeoutExpired:
+            rc = -1
+        if rc == 0:
+            state = self._wait_for_state((PostingScreenState.PROFILE,), 1.0)
+            if state == PostingScreenState.PROFILE:
+                return True
+            logger.debug("Profile intent landed on %s; using Back + tab navigation", state.value)
+        self._dismiss_overlays(back_presses=3)
+        return app.go_to_profile_tab()
+
     def _navigate_to_create_post(self) -> bool:
         """Navigate to Profile first, then tap the + button (top left) to open create post."""
         try:
@@ -140,37 +494,30 @@ class InstagramPoster:
             
             app = InstagramApp(self.driver)
             
-            # 0) Close any open overlay/dialog so we start from a clean state
-            self._dismiss_overlays(back_presses=3)
-            time.sleep(1)
-            
-            # 1) Go to Profile tab first
+            # 1) Go to Profile tab first (intent launch starts from a clean state, no overlays)
             logger.info("Navigating to Profile tab...")
-            if not app.go_to_profile_tab():
+            if not self._open_profile(app):
                 logger.error("Failed to open Profile tab")
                 return False
-            time.sleep(2)
+            _wait_until(lambda: _find_element(self.driver, post_sel.create_post_button_on_profile_selectors(), timeout=0.3), 2.0)
             
             # 2) Find and tap the + button on profile (top left)
             el = self._find_create_post_button_on_profile()
             if el:
                 logger.info("Found create post (+) button on profile, tapping...")
                 _tap_element(self.driver, el)
-                time.sleep(2)
-                # Confirm we're in create post flow (gallery or photo/video/reel options)
-                if _find_element(self.driver, post_sel.gallery_selectors(), timeout=3.0) or _find_element(self.driver, post_sel.photo_selectors(), timeout=2.0):
-                    return True
+                # Wait for create post flow (gallery or photo/video/reel options); proceed either way
+                _wait_until(self._create_flow_visible, 5.0)
                 return True
             
             # 3) Fallback: tap top-left coordinates (where + usually is on profile)
             try:
-                size = self.driver.get_window_size()
-                x = int(size["width"] * 0.12)
-                y = int(size["height"] * 0.08)
+                w, h = self._window()
+                x = int(w * 0.12)
+                y = int(h * 0.08)
                 logger.warning("Tapping top-left fallback at (%s, %s) for + button", x, y)
                 self.driver.tap([(x, y)], duration=100)
-                time.sleep(2)
-                if _find_element(self.driver, post_sel.gallery_selectors(), timeout=3.0) or _find_element(self.driver, post_sel.photo_selectors(), timeout=2.0):
+                if _wait_until(self._create_flow_visible, 5.0):
                     return True
             except Exception as fallback_err:
                 logger.debug("Top-left tap fallback failed: %s", fallback_err)
@@ -181,16 +528,122 @@ class InstagramPoster:
             logger.error("Failed to navigate to create post: %s", e, exc_info=True)
             return False
     
+    def _find_any(self, selector_groups, timeout: float):
+        """
+        Probe several selector groups concurrently and return the first element found (or None).
+        Only one of the groups is expected to match, so this costs one timeout instead of the sum.
+        The Appium session is not thread-safe: every probe call holds _driver_lock, and on return the
+        losing probes are stopped and drained so none still drives the session when the caller acts.
+        """
+        if self._probe_pool is None:
+            self._probe_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="probe")
+        stop = threading.Event()
+        futures = [
+            self._probe_pool.submit(_find_element, self.driver, group, timeout, stop=stop, lock=self._driver_lock)
+            for group in selector_groups
+        ]
+        try:
+            for fut in as_completed(futures, timeout=timeout + 2.0):
+                try:
+                    el = fut.result()
+                except Exception:
+                    continue
+                if el:
+                    return el
+        except FuturesTimeout:
+            pass
+        finally:
+            stop.set()
+            for fut in futures:
+                fut.cancel()
+            # A running probe exits after its current driver call
+            futures_wait(futures, timeout=PROBE_DRAIN_SEC)
+        return None
+
+    def _create_flow_visible(self) -> bool:
+        """True if the create post flow (gallery or photo option) is on screen."""
+        return self._find_any((post_sel.gallery_selectors(), post_sel.photo_selectors()), timeout=0.3) is not None
+
+    def _wait_for_screen(
+        self,
+        predicate,
+        timeout: float,
+        start: float = POLL_START_SEC,
+        cap: float = POLL_CAP_SEC,
+        jitter: float = POLL_JITTER_SEC,
+    ) -> PostingScreenState:
+        """
+        Classify the screen until predicate(state) is true or timeout elapses; returns the last state seen.
+        Sleeps start, 2*start, 4*start... (capped, plus random jitter) between polls, so fast transitions
+        return almost immediately while slow ones don't hammer the Appium server.
+        """
+        deadline = time.monotonic() + timeout
+        n = 0
+        while True:
+            # Fresh snapshot per poll; it stays cached for whatever the caller does next
+            self._invalidate_snapshot()
+            state = self._cached_state()
+            remaining = deadline - time.monotonic()
+            if predicate(state) or remaining <= 0:
+                return state
+            time.sleep(min(remaining, min(cap, start * 2 ** n) + random.uniform(0, jitter)))
+            n += 1
+
+    def _wait_for_state(self, targets, timeout: float, start: float = POLL_START_SEC) -> PostingScreenState:
+        """Poll screen state until it is one of targets (or timeout). Returns the last state seen."""
+        return self._wait_for_screen(lambda s: s in targets, timeout, start=start)
+
+    def _screen_changed_since(self, last_hash: Optional[bytes]) -> Tuple[bool, bytes]:
+        """
+        (changed, hash) for the current screenshot, downsampled to 64x64 grayscale so only real screen
+        changes register (not compression noise). Requires Pillow.
+        """
+        png = self.driver.get_screenshot_as_png()
+        thumb = Image.open(io.BytesIO(png)).convert("L").resize((64, 64))
+        h = hashlib.blake2b(thumb.tobytes(), digest_size=8).digest()
+        return h != last_hash, h
+
+    def _verify_shared(self, tapped_at: float) -> PostingScreenState:
+        """
+        Wait for SUCCESS/PROFILE until SHARE_VERIFY_SEC after the Share tap. Returns the last state seen.
+        With Pillow, a cheap screenshot hash gates classification: the frozen upload screen is only
+        re-checked every 1s, while a changed screen is classified right away and re-checked at 0.25s.
+        """
+        targets = (PostingScreenState.SUCCESS, PostingScreenState.PROFILE)
+        deadline = tapped_at + SHARE_VERIFY_SEC
+        if Image is None:
+            return self._wait_for_state(targets, max(0.0, deadline - time.monotonic()), start=SHARE_VERIFY_POLL_SEC)
+        state = PostingScreenState.UNKNOWN
+        last_hash: Optional[bytes] = None
+        while True:
+            try:
+                changed, last_hash = self._screen_changed_since(last_hash)
+            except Exception as e:
+                logger.debug("Screenshot hash failed, polling state instead: %s", e)
+                return self._wait_for_state(targets, max(0.0, deadline - time.monotonic()), start=SHARE_VERIFY_POLL_SEC)
+            if changed:
+                self._invalidate_snapshot()
+                state = self._cached_state()
+                if state in targets:
+                    return state
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return state
+            time.sleep(min(remaining, 0.25 if changed else 1.0))
+
+    def _gallery_loaded(self) -> bool:
+        return _find_element(self.driver, post_sel.gallery_thumbnail_selectors(), timeout=0.3) is not None
+
     def _push_file_to_device(self, file_path: Path) -> Optional[str]:
         """Push file to device via ADB. Uses DCIM so gallery/Instagram can see it. Verifies file exists. Returns device path if successful."""
-        # Use DCIM so Android media scanner and Instagram picker can find the file
-        device_dir = "/sdcard/DCIM/InstagramPost/"
         device_filename = file_path.name
-        device_file_path = device_dir + device_filename
+        device_file_path = DEVICE_MEDIA_DIR + device_filename
         
         try:
-            # Ensure directory exists on device
-            self._adb_cmd(["shell", "mkdir", "-p", device_dir], timeout=10)
+            # Ensure directory exists on device (once per poster)
+            if not self._device_dir_ready:
+                self._shell_exec(f"mkdir -p {DEVICE_MEDIA_DIR}", timeout=10)
+                self._device_dir_ready = True
             
             # Push file via ADB
             result = self._adb_cmd(["push", str(file_path), device_file_path], timeout=60)
@@ -201,19 +654,29 @@ class InstagramPoster:
             
             logger.info("Pushed file to device: %s", device_file_path)
             
-            # Verify file actually exists on device
-            check = self._adb_cmd(["shell", f"test -f '{device_file_path}' && echo exists"], timeout=10)
-            out = (check.stdout or b"").decode().strip()
+            # Verify size + MD5 of the pushed file and trigger media scanner (so gallery/Instagram
+            # see it) in one round trip; catches truncated pushes that a plain `test -f` would pass
+            _, out = self._shell_exec(
+                f"if test -f '{device_file_path}'; then echo exists; "
+                f"echo size=$(stat -c %s '{device_file_path}'); "
+                f"echo md5=$(md5sum '{device_file_path}' 2>/dev/null | cut -d' ' -f1); "
+                f"am broadcast -a android.intent.action.MEDIA_SCANNER_SCAN_FILE -d 'file://{device_file_path}' >/dev/null 2>&1 || echo scan_failed; fi",
+                timeout=30,
+            )
             if "exists" not in out:
                 logger.error("File verification failed: file not found on device at %s", device_file_path)
                 return None
-            
-            # Trigger media scanner so gallery/Instagram see the new file
-            try:
-                self._adb_cmd(["shell", "am", "broadcast", "-a", "android.intent.action.MEDIA_SCANNER_SCAN_FILE", "-d", f"file://{device_file_path}"], timeout=5)
-                time.sleep(1)
-            except Exception as scan_err:
-                logger.warning("Media scanner trigger failed (non-fatal): %s", scan_err)
+            remote = dict(line.split("=", 1) for line in out.split() if line.startswith(("size=", "md5=")))
+            if remote.get("size") != str(file_path.stat().st_size):
+                logger.error("File verification failed: size mismatch on device for %s (%s)", device_file_path, remote.get("size"))
+                return None
+            if remote.get("md5") and remote["md5"] != _file_md5(file_path):
+                logger.error("File verification failed: checksum mismatch on device for %s", device_file_path)
+                return None
+            if "scan_failed" in out:
+                logger.warning("Media scanner trigger failed (non-fatal)")
+            elif not self._wait_media_indexed(device_filename):
+                logger.debug("%s not in MediaStore yet; continuing", device_filename)
             
             return device_file_path
         except subprocess.TimeoutExpired:
@@ -223,6 +686,104 @@ class InstagramPoster:
             logger.error("Error pushing file to device: %s", e)
             return None
     
+    def _push_in_background(self, file_path: Path) -> Future:
+        """Start _push_file_to_device on a worker thread so UI navigation can run meanwhile."""
+        if self._push_pool is None:
+            self._push_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="push")
+        return self._push_pool.submit(self._push_file_to_device, file_path)
+
+    def _await_push(self, push_future: Future) -> Optional[str]:
+        """Device path from a background push (None if it failed or took longer than PUSH_WAIT_SEC)."""
+        try:
+            device_path = push_future.result(timeout=PUSH_WAIT_SEC)
+        except FuturesTimeout:
+            device_path = None
+        if not device_path:
+            logger.error("Failed to push file to device")
+        return device_path
+
+    def _push_files_bulk(self, file_paths: List[Path]) -> List[str]:
+        """
+        Push several files with one `adb push` of a local staging directory, then verify size + MD5 and
+        trigger the media scanner for all of them in one shell round trip.
+        Returns the device paths that verified, in file_paths order ([] if the push failed).
+        """
+        staging = tempfile.mkdtemp(prefix="igpush_")
+        try:
+            # Deterministic, collision-free names; hardlinks avoid copying when on the same volume
+            names = []
+            for i, fp in enumerate(file_paths):
+                name = f"{i:04d}_{fp.name}"
+                try:
+                    os.link(fp, os.path.join(staging, name))
+                except OSError:
+                    shutil.copy2(fp, os.path.join(staging, name))
+                names.append(name)
+
+            if not self._device_dir_ready:
+                self._shell_exec(f"mkdir -p {DEVICE_MEDIA_DIR}", timeout=10)
+                self._device_dir_ready = True
+
+            result = self._adb_cmd(["push", os.path.join(staging, "."), DEVICE_MEDIA_DIR], timeout=60 * len(names))
+            if result.returncode != 0:
+                logger.error("adb push failed: %s", (result.stderr or result.stdout or b"").decode(errors="replace"))
+                return []
+            logger.info("Pushed %d files to device: %s", len(names), DEVICE_MEDIA_DIR)
+
+            quoted = " ".join(shlex.quote(n) for n in names)
+            _, out = self._shell_exec(
+                f"cd {DEVICE_MEDIA_DIR} && stat -c 'size=%s %n' {quoted}; md5sum {quoted} 2>/dev/null; "
+                f"for f in {quoted}; do am broadcast -a android.intent.action.MEDIA_SCANNER_SCAN_FILE "
+                f"-d \"file://{DEVICE_MEDIA_DIR}$f\" >/dev/null 2>&1 || echo scan_failed; done",
+                timeout=30 + 5 * len(names),
+            )
+            sizes, md5s = {}, {}
+            for line in out.splitlines():
+                head, _, name = line.strip().partition(" ")
+                if head.startswith("size="):
+                    sizes[name] = head[len("size="):]
+                elif len(head) == 32:
+                    md5s[name.strip()] = head
+
+            device_paths = []
+            for fp, name in zip(file_paths, names):
+                if sizes.get(name) != str(fp.stat().st_size):
+                    logger.error("File verification failed: size mismatch on device for %s (%s)", name, sizes.get(name))
+                elif name in md5s and md5s[name] != _file_md5(fp):
+                    logger.error("File verification failed: checksum mismatch on device for %s", name)
+                else:
+                    device_paths.append(DEVICE_MEDIA_DIR + name)
+            if "scan_failed" in out:
+                logger.warning("Media scanner trigger failed for some files (non-fatal)")
+            elif device_paths and not self._wait_media_indexed(device_paths[-1].rsplit("/", 1)[-1]):
+                logger.debug("Carousel media not in MediaStore yet; continuing")
+            return device_paths
+        except subprocess.TimeoutExpired:
+            logger.error("adb push or verify timed out")
+            return []
+        except Exception as e:
+            logger.error("Error pushing files to device: %s", e)
+            return []
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _wait_media_indexed(self, filename: str, timeout: float = 2.0, interval: float = 0.2) -> bool:
+        """Poll MediaStore until a row with this display name shows up (or timeout). Returns True once indexed."""
+        where = "_display_name='%s'" % filename.replace("'", "''")
+        command = f"content query --uri content://media/external/file --projection _id --where {shlex.quote(where)}"
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _, out = self._shell_exec(command, timeout=max(1.0, timeout))
+                if "Row:" in out:
+                    return True
+            except Exception as e:
+                logger.debug("MediaStore query failed: %s", e)
+                return False
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
     def _select_media_type(self, media_type: MediaType) -> bool:
         """Select media type (Photo/Video/Reel) from create post menu."""
         try:
@@ -247,6 +808,42 @@ class InstagramPoster:
             logger.error("Failed to select media type: %s", e)
             return False
     
+    def _instagram_version(self) -> str:
+        """Installed Instagram versionName (queried once per poster); "unknown" if it can't be read."""
+        if self._ig_version is None:
+            version = "unknown"
+            try:
+                _, out = self._shell_exec("dumpsys package com.instagram.android | grep -m1 versionName", timeout=5)
+                if "versionName=" in out:
+                    version = out.split("versionName=", 1)[1].split()[0]
+            except Exception as e:
+                logger.debug("Could not read Instagram version: %s", e)
+            self._ig_version = version
+        return self._ig_version
+
+    def _gallery_xpath_order(self) -> List[str]:
+        """GALLERY_IMAGE_XPATHS with the last XPath that worked on this Instagram version first."""
+        if self._last_good_xpath is None:
+            try:
+                self._last_good_xpath = json.loads(SELECTOR_PGO_PATH.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._last_good_xpath = {}
+        best = self._last_good_xpath.get(self._instagram_version())
+        if best not in GALLERY_IMAGE_XPATHS:
+            return list(GALLERY_IMAGE_XPATHS)
+        return [best] + [x for x in GALLERY_IMAGE_XPATHS if x != best]
+
+    def _remember_gallery_xpath(self, xpath: str) -> None:
+        version = self._instagram_version()
+        if self._last_good_xpath is None or self._last_good_xpath.get(version) == xpath:
+            return
+        self._last_good_xpath[version] = xpath
+        try:
+            SELECTOR_PGO_PATH.parent.mkdir(parents=True, exist_ok=True)
+            SELECTOR_PGO_PATH.write_text(json.dumps(self._last_good_xpath, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.debug("Could not save selector stats: %s", e)
+
     def _select_file_from_gallery(self, file_path: Path) -> bool:
         """Select our file from gallery. We pushed to DCIM so it should appear in Recent/first positions."""
         try:
@@ -254,28 +851,23 @@ class InstagramPoster:
             gallery_el = _find_element(self.driver, post_sel.gallery_selectors(), timeout=4.0)
             if gallery_el:
                 _tap_element(self.driver, gallery_el)
-                time.sleep(2.5)  # Let gallery load and show our recently pushed file
+                _wait_until(self._gallery_loaded, 4.0)  # Let gallery load and show our recently pushed file
             else:
-                time.sleep(1.5)
+                _wait_until(self._gallery_loaded, 1.5)
             
             # Try to tap our file: we pushed to DCIM so it's often first/most recent in grid
-            # Try multiple selectors for first image in gallery
+            # Try multiple selectors for first image in gallery (last winner for this IG version first)
             from appium.webdriver.common.appiumby import AppiumBy
-            for xpath in [
-                "//android.widget.ImageView[@clickable='true'][1]",
-                "//android.widget.ImageView[1]",
-                "//*[contains(@resource-id, 'thumbnail') or contains(@resource-id, 'image')][1]",
-                "//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView[1]",
-                "//*[@clickable='true']//android.widget.ImageView[1]",
-            ]:
+            for xpath in self._gallery_xpath_order():
                 try:
                     image_el = self.driver.find_element(AppiumBy.XPATH, xpath)
                     if image_el and image_el.is_displayed():
                         image_el.click()
-                        time.sleep(1.5)
-                        # If we see Next or Done, we likely selected something
-                        if _find_element(self.driver, post_sel.next_button_selectors(), timeout=1.0) or _find_element(self.driver, post_sel.done_button_selectors(), timeout=1.0):
-                            return True
+                        self._remember_gallery_xpath(xpath)
+                        time.sleep(STEP_SLEEP_SEC)
+                        # Single immediate probe for Next/Done; the caller's state machine handles a miss
+                        if not _find_element(self.driver, post_sel.next_or_done_selectors(), timeout=0):
+                            logger.debug("Gallery tap: Next/Done not visible yet")
                         return True
                 except Exception:
                     continue
@@ -301,13 +893,56 @@ class InstagramPoster:
             except Exception:
                 break
 
+    def _select_carousel_batch(self, count: int) -> bool:
+        """
+        Fast path for carousel selection: switch the picker to multi-select, tap the `count` newest
+        thumbnails in one action sequence, then verify once from a single page-source read.
+        Returns False (multi-select switched back off) if anything doesn't line up.
+        """
+        gallery_el = _find_element(self.driver, post_sel.gallery_selectors(), timeout=2.0)
+        if gallery_el:
+            _tap_element(self.driver, gallery_el)
+        _wait_until(self._gallery_loaded, 4.0)
+        multi_el = _find_element(self.driver, post_sel.multi_select_selectors(), timeout=1.0)
+        if not multi_el:
+            return False  # Without multi-select each tap would just replace the selection
+        _tap_element(self.driver, multi_el)
+        try:
+            self._invalidate_snapshot()
+            _, root = self._snapshot()
+            points = gallery_thumbnail_points(root, count)
+            if len(points) == count:
+                # Grid is newest first and our files were pushed in order: tap oldest first to keep that order
+                self._tap_sequence(list(reversed(points)), hold_ms=80, gap_ms=250)
+                self._invalidate_snapshot()
+                _, root = self._snapshot()
+                selected = count_selected(root)
+                if selected >= count:
+                    return True
+                logger.warning("Carousel batch select: %d/%d marked selected", selected, count)
+        except Exception as e:
+            logger.debug("Carousel batch select failed: %s", e)
+        # Leaving multi-select clears the partial selection for the slow path
+        try:
+            toggle = _find_element(self.driver, post_sel.multi_select_selectors(), timeout=1.0)
+            if toggle:
+                _tap_element(self.driver, toggle)
+        except Exception:
+            pass
+        self._invalidate_snapshot()
+        return False
+
     def _select_all_carousel_photos(self, file_paths: List[Path], max_retries_per_image: int = 2) -> bool:
         """
         Phase 1 for carousel: select all photos in the picker first.
-        Uses retries and Back-on-fail to recover from mistouches. Returns True when all selected.
+        Tries the batch multi-select path first; otherwise selects one by one, using retries and
+        Back-on-fail to recover from mistouches. Returns True when all selected.
         """
         if not file_paths:
             return False
+        if len(file_paths) > 1 and self._select_carousel_batch(len(file_paths)):
+            logger.info("Carousel: selected %d images in one pass", len(file_paths))
+            return True
         # --- First image ---
         for attempt in range(max_retries_per_image):
             if self._select_file_from_gallery(file_paths[0]):
@@ -316,7 +951,7 @@ class InstagramPoster:
             if attempt < max_retries_per_image - 1:
                 logger.warning("Carousel: first image select failed, backing and retrying")
                 self._carousel_back_to_picker(1)
-                time.sleep(1.5)
+                time.sleep(_backoff_delay(attempt))
         else:
             logger.error("Carousel: failed to select first image")
             return False
@@ -328,18 +963,18 @@ class InstagramPoster:
                 add_el = _find_element(self.driver, post_sel.add_more_selectors(), timeout=3.0)
                 if add_el:
                     try:
-                        _tap_element_robust(self.driver, add_el)
-                        time.sleep(2.0)
+                        _retry(lambda: _tap_element_robust(self.driver, add_el), retry_if=lambda ok: not ok)
+                        _wait_until(self._gallery_loaded, 4.0)
                     except Exception as e:
                         logger.debug("Add more tap failed: %s", e)
                         if attempt < max_retries_per_image - 1:
                             self._carousel_back_to_picker(1)
-                            time.sleep(1.5)
+                            time.sleep(_backoff_delay(attempt))
                         continue
                 else:
                     if attempt < max_retries_per_image - 1:
                         self._carousel_back_to_picker(1)
-                        time.sleep(1.5)
+                        time.sleep(_backoff_delay(attempt))
                     continue
 
                 if self._select_file_from_gallery(fp):
@@ -349,26 +984,21 @@ class InstagramPoster:
                 if attempt < max_retries_per_image - 1:
                     logger.warning("Carousel: select image %d failed, backing and retrying", i)
                     self._carousel_back_to_picker(1)
-                    time.sleep(1.5)
+                    time.sleep(_backoff_delay(attempt))
             if not added:
                 logger.error("Carousel: failed to add image %d", i)
                 return False
             time.sleep(0.8)
 
         # Confirm we're in composer: Next or Done visible (all photos picked)
-        time.sleep(1.0)
-        next_el = _find_element(self.driver, post_sel.next_button_selectors(), timeout=2.0)
-        done_el = _find_element(self.driver, post_sel.done_button_selectors(), timeout=2.0)
-        if next_el or done_el:
+        if self._find_any((post_sel.next_button_selectors(), post_sel.done_button_selectors()), timeout=3.0):
             return True
         # Fallback: tap by position where Next/Done often is (bottom-right) to proceed
         try:
-            size = self.driver.get_window_size()
-            w, h = size["width"], size["height"]
+            w, h = self._window()
             for rx, ry in [(0.9, 0.92), (0.5, 0.92)]:
                 self.driver.tap([(int(w * rx), int(h * ry))], duration=100)
-                time.sleep(1.5)
-                if _find_element(self.driver, post_sel.next_button_selectors(), timeout=1.0):
+                if _find_element(self.driver, post_sel.next_button_selectors(), timeout=2.5):
                     return True
         except Exception:
             pass
@@ -401,9 +1031,7 @@ class InstagramPoster:
                     try:
                         el.click()
                         time.sleep(0.5)
-                        # Use ADB to input text (respects adb_serial); space as %s for shell
-                        escaped_text = full_text.replace("\n", " ").replace(" ", "%s")[:500]
-                        self._adb_cmd(["shell", "input", "text", escaped_text], timeout=5)
+                        self._input_text(full_text)
                         logger.info("Added caption via ADB input")
                         return True
                     except Exception as adb_error:
@@ -416,19 +1044,18 @@ class InstagramPoster:
             logger.error("Failed to add caption: %s", e)
             return False
     
-    def _tap_share(self) -> bool:
-        """Tap Share/Post button."""
+    def _tap_share(self) -> Optional[float]:
+        """Tap Share/Post button. Returns the time.monotonic() of the tap, or None if it wasn't tapped."""
         try:
             el = _find_element(self.driver, post_sel.share_post_button_selectors(), timeout=5.0)
             if el:
                 _tap_element(self.driver, el)
-                time.sleep(3)  # Wait for post to process
                 logger.info("Tapped share button")
-                return True
-            return False
+                return time.monotonic()  # Callers poll for the result from here
+            return None
         except Exception as e:
             logger.error("Failed to tap share: %s", e)
-            return False
+            return None
 
     def _advance_composer_then_share_and_verify(
         self, caption: str, hashtags: List[str], max_steps: int = 18
@@ -439,7 +1066,7 @@ class InstagramPoster:
         we've confirmed the post went through (avoids false positive on crop screen).
         """
         for step in range(max_steps):
-            state = get_posting_screen_state(self.driver)
+            state = self._cached_state()
             if state == PostingScreenState.SUCCESS:
                 return True
             if state == PostingScreenState.PROFILE:
@@ -447,30 +1074,67 @@ class InstagramPoster:
             if state == PostingScreenState.SHARE_READY:
                 self._add_caption(caption, hashtags)
                 time.sleep(1)
-                if not self._tap_share():
+                tapped_at = self._tap_share()
+                if tapped_at is None:
                     return False
-                time.sleep(8)
-                state_after = get_posting_screen_state(self.driver)
+                state_after = self._verify_shared(tapped_at)
                 if state_after in (PostingScreenState.SUCCESS, PostingScreenState.PROFILE):
                     return True
                 return False
             if state in (PostingScreenState.CROP_OR_EDIT, PostingScreenState.CAPTION_SCREEN):
                 # Tap Next/Skip only; do not tap Share here (crop/caption can be intermediate)
                 el = find_element_by_intent(self.driver, "next_or_skip")
-                if el and _tap_element_robust(self.driver, el):
-                    time.sleep(2)
-                else:
+                if not (el and _tap_element_robust(self.driver, el)):
                     self._fallback_tap_for_state(PostingScreenState.CROP_OR_EDIT)
-                    time.sleep(2)
+                # Same 2s bound as before, but return as soon as the screen moves on
+                self._wait_for_screen(lambda s: s != state, 2.0)
                 continue
             time.sleep(1.5)
         return False
 
+    def _tap_sequence(self, points: List[Tuple[int, int]], hold_ms: int = 120, gap_ms: int = 800) -> None:
+        """Tap each point in order using one W3C pointer-action sequence (a single HTTP round trip)."""
+        from selenium.webdriver.common.action_chains import ActionChains
+        from selenium.webdriver.common.actions import interaction
+        from selenium.webdriver.common.actions.action_builder import ActionBuilder
+        from selenium.webdriver.common.actions.pointer_input import PointerInput
+
+        actions = ActionChains(self.driver)
+        actions.w3c_actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, "finger"))
+        pointer = actions.w3c_actions.pointer_action
+        for x, y in points:
+            pointer.move_to_location(x, y)
+            pointer.pointer_down()
+            pointer.pause(hold_ms / 1000)
+            pointer.release()
+            pointer.pause(gap_ms / 1000)
+        actions.perform()
+
+    def _tap_candidates(self, points: List[Tuple[int, int]], hold_ms: int, state: PostingScreenState) -> bool:
+        """
+        Tap candidate positions one at a time, re-classifying the screen after each: the next candidate
+        is only tried while the screen is still on state (a later point may hit a control on the next
+        screen). Returns True if any tap was delivered.
+        """
+        tapped = False
+        for point in points:
+            try:
+                self._tap_sequence([point], hold_ms=hold_ms, gap_ms=0)
+            except Exception:
+                try:
+                    self.driver.tap([point], duration=hold_ms)
+                except Exception:
+                    continue
+            tapped = True
+            self._invalidate_snapshot()
+            if self._wait_for_screen(lambda s: s != state, STEP_SLEEP_SEC) != state:
+                return True
+        return tapped
+
     def _fallback_tap_for_state(self, state: PostingScreenState) -> bool:
         """Position-based fallback tap when find_element_by_intent returns None or when stuck."""
         try:
-            size = self.driver.get_window_size()
-            w, h = size["width"], size["height"]
+            w, h = self._window()
             if state == PostingScreenState.PROFILE:
                 x, y = int(w * 0.12), int(h * 0.08)
             elif state == PostingScreenState.CREATE_POST_FIRST_MENU:
@@ -484,26 +1148,12 @@ class InstagramPoster:
                 x, y = int(w * 0.2), int(h * 0.35)
             elif state == PostingScreenState.CROP_OR_EDIT:
                 # Try bottom-right first (common for Next), then center-bottom (Continue)
-                for rx, ry in [(0.9, 0.92), (0.5, 0.92), (0.85, 0.88)]:
-                    x, y = int(w * rx), int(h * ry)
-                    try:
-                        self.driver.tap([(x, y)], duration=120)
-                        time.sleep(STEP_SLEEP_SEC)
-                        return True
-                    except Exception:
-                        continue
-                return False
+                points = [(int(w * rx), int(h * ry)) for rx, ry in [(0.9, 0.92), (0.5, 0.92), (0.85, 0.88)]]
+                return self._tap_candidates(points, hold_ms=120, state=state)
             elif state == PostingScreenState.SHARE_READY:
                 # Share/Post button: try several positions (layout varies)
-                for x_ratio, y_ratio in [(0.85, 0.08), (0.5, 0.92), (0.85, 0.5), (0.9, 0.12)]:
-                    x, y = int(w * x_ratio), int(h * y_ratio)
-                    try:
-                        self.driver.tap([(x, y)], duration=150)
-                        time.sleep(STEP_SLEEP_SEC)
-                        return True
-                    except Exception:
-                        continue
-                return False
+                points = [(int(w * rx), int(h * ry)) for rx, ry in [(0.85, 0.08), (0.5, 0.92), (0.85, 0.5), (0.9, 0.12)]]
+                return self._tap_candidates(points, hold_ms=150, state=state)
             else:
                 return False
             self.driver.tap([(x, y)], duration=100)
@@ -514,7 +1164,10 @@ class InstagramPoster:
             return False
 
     def _perform_action(self, state: PostingScreenState, caption: str, hashtags: List[str]) -> bool:
-        """Perform the action for current state. Returns True if an action was executed."""
+        """
+        Perform the action for current state. Returns True if an action was executed.
+        Does not wait after tapping: post_photo polls the page source until the screen reacts.
+        """
         action = get_action_for_state(state)
         logger.info("State=%s action=%s", state.value, action)
 
@@ -526,35 +1179,37 @@ class InstagramPoster:
             if not el:
                 el = self._find_create_post_button_on_profile()
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(STEP_SLEEP_SEC)
                 return True
             return self._fallback_tap_for_state(state)
 
         if action == "tap_post_option":
             el = find_element_by_intent(self.driver, "post_option")
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(STEP_SLEEP_SEC)
                 return True
             return self._fallback_tap_for_state(PostingScreenState.CREATE_POST_FIRST_MENU)
 
         if action == "tap_gallery_or_photo":
             el = find_element_by_intent(self.driver, "gallery_or_photo")
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(STEP_SLEEP_SEC)
                 return True
             return self._fallback_tap_for_state(PostingScreenState.CREATE_POST_MENU)
 
         if action == "tap_first_image":
+            # Resolve from the step snapshot and tap coordinates: no findElement round trips
+            _, root = self._snapshot()
+            point = find_tap_point_by_intent(root, "first_image")
+            if point:
+                self._invalidate_snapshot()
+                self.driver.tap([point], 100)
+                return True
             el = find_element_by_intent(self.driver, "first_image")
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(STEP_SLEEP_SEC)
                 return True
             return self._fallback_tap_for_state(PostingScreenState.GALLERY)
 
         if action == "tap_next_or_skip":
             el = find_element_by_intent(self.driver, "next_or_skip")
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(STEP_SLEEP_SEC)
                 return True
             return self._fallback_tap_for_state(state)
 
@@ -573,20 +1228,17 @@ class InstagramPoster:
                         try:
                             el.click()
                             time.sleep(0.5)
-                            escaped = full_text.replace(" ", "%s").replace("'", "\\'")[:500]
-                            self._adb_cmd(["shell", "input", "text", escaped], timeout=5)
+                            self._input_text(full_text)
                         except Exception:
                             pass
             el = find_element_by_intent(self.driver, "share")
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(3)
                 return True
             return self._fallback_tap_for_state(PostingScreenState.SHARE_READY)
 
         if action == "tap_share":
             el = find_element_by_intent(self.driver, "share")
             if el and _tap_element_robust(self.driver, el):
-                time.sleep(3)
                 return True
             return self._fallback_tap_for_state(state)
 
@@ -601,23 +1253,19 @@ class InstagramPoster:
         logger.info("Posting photo (state machine): %s", file_path.name)
 
         try:
-            device_path = self._push_file_to_device(file_path)
-            if not device_path:
-                logger.error("Failed to push file to device")
-                return False
+            # Push in the background: adb is idle time for the Appium session, so navigate meanwhile
+            push_future = self._push_in_background(file_path)
 
             from src.device.instagram_app import InstagramApp
             app = InstagramApp(self.driver)
-            # Close any open overlay/dialog, then go to Profile
-            self._dismiss_overlays(back_presses=3)
-            time.sleep(1)
-            if not app.go_to_profile_tab():
+            # Go straight to Profile (falls back to closing overlays + tab tap)
+            if not self._open_profile(app):
                 logger.error("Failed to open Profile tab")
                 return False
-            time.sleep(2)
+            _wait_until(lambda: _find_element(self.driver, post_sel.create_post_button_on_profile_selectors(), timeout=0.3), 2.0)
 
             # Pre-flight: verify we're on a known starting screen
-            initial_state = get_posting_screen_state(self.driver)
+            initial_state = self._cached_state()
             if initial_state not in (
                 PostingScreenState.PROFILE,
                 PostingScreenState.CREATE_POST_MENU,
@@ -629,14 +1277,32 @@ class InstagramPoster:
                 else:
                     logger.warning("Pre-flight retry failed, continuing anyway")
 
+            # The file must be on the device (and scanned) before + opens the gallery
+            if not self._await_push(push_future):
+                return False
+
             unknown_count = 0
             last_state = None
             same_state_count = 0
             last_action_was_share = False
             had_share_ready_before = False  # Track if we were ever on share screen (for success inference)
 
+            self._last_src_hash = None
+            self._stuck_dumps_done.clear()
             for step in range(MAX_POST_STEPS):
-                state = get_posting_screen_state(self.driver)
+                # One page-source snapshot per step, shared by state detection and the action
+                # (a source fetched by the previous step's wait within 250ms is reused as-is)
+                src, _ = self._snapshot(ttl=0.25)
+                # Screen unchanged since our last action: poll the source until it reacts instead of
+                # re-classifying and re-acting on the same screen (bounded; then fall through)
+                if self._last_src_hash is not None and hash(src) == self._last_src_hash:
+                    deadline = time.monotonic() + UNCHANGED_WAIT_SEC
+                    while hash(src) == self._last_src_hash and time.monotonic() < deadline:
+                        time.sleep(0.25)
+                        self._invalidate_snapshot()
+                        src, _ = self._snapshot()
+                self._last_src_hash = None
+                state = self._cached_state()
                 logger.info("Step %d: state=%s", step + 1, state.value)
 
                 if state == PostingScreenState.SHARE_READY:
@@ -655,11 +1321,7 @@ class InstagramPoster:
                     unknown_count += 1
                     if unknown_count >= UNKNOWN_STEPS_BEFORE_FAIL:
                         logger.error("Stuck in UNKNOWN for %d steps", UNKNOWN_STEPS_BEFORE_FAIL)
-                        try:
-                            self.driver.save_screenshot("post_failed_unknown.png")
-                            logger.info("Screenshot saved: post_failed_unknown.png")
-                        except Exception:
-                            pass
+                        self._save_debug_image("post_failed_unknown")
                         return False
                     time.sleep(1)
                     continue
@@ -672,13 +1334,22 @@ class InstagramPoster:
                     if same_state_count >= 2:
                         logger.warning("Stuck in %s for %d steps, trying fallback tap", state.value, same_state_count)
                         try:
-                            dump_screen_summary(self.driver, f"post_stuck_{state.value}.txt")
-                            logger.info("Screen dump saved for debugging")
+                            # Dumps are named by a digest of the UI tree: an identical screen is never
+                            # written twice. Full tree dump once per state per post; others screenshot-only.
+                            h = hashlib.blake2b(src.encode("utf-8", "replace"), digest_size=6).hexdigest()
+                            if h not in self._recent_dumps:
+                                self._recent_dumps.append(h)
+                                dump_path = f"post_stuck_{state.value}_{h}.txt"
+                                # Same screen already dumped (e.g. by an earlier post): skip it entirely
+                                if not Path(dump_path).exists():
+                                    full_dump = state not in self._stuck_dumps_done
+                                    dump_screen_summary(self.driver, dump_path, use_ui_tree=full_dump)
+                                    self._stuck_dumps_done.add(state)
+                                    logger.info("Screen dump saved for debugging")
                         except Exception as dump_err:
                             logger.debug("Screen dump failed: %s", dump_err)
                         if self._fallback_tap_for_state(state):
-                            time.sleep(2.5)
-                            new_after_fallback = get_posting_screen_state(self.driver)
+                            new_after_fallback = self._wait_for_screen(lambda s: s != state, 2.5)
                             if new_after_fallback == PostingScreenState.SUCCESS:
                                 logger.info("Post success detected after fallback tap")
                                 return True
@@ -696,20 +1367,27 @@ class InstagramPoster:
                     acted = self._perform_action(state, caption, hashtags)
                 action_name = get_action_for_state(state)
                 last_action_was_share = acted and action_name in ("tap_share", "fill_caption_then_share")
+                if acted:
+                    self._last_src_hash = hash(src)
 
-                # Wait for transition; longer after Share (upload + possible navigation back to Profile)
+                # Wait for transition; after Share poll until upload finishes / app goes back to Profile.
+                # Other actions: return as soon as the state changes (bounded by the old fixed sleep)
+                new_state = None
                 if last_action_was_share:
-                    time.sleep(8.0)
+                    new_state = self._verify_shared(time.monotonic())
+                elif acted:
+                    new_state = self._wait_for_screen(lambda s: s != state, STEP_SLEEP_SEC)
                 else:
                     time.sleep(STEP_SLEEP_SEC)
 
                 if not acted and state not in (PostingScreenState.CAPTION_SCREEN, PostingScreenState.SHARE_READY):
                     if self._fallback_tap_for_state(state):
-                        time.sleep(2.0)
+                        new_state = self._wait_for_screen(lambda s: s != state, 2.0)
                     else:
                         logger.warning("No action and no fallback for state=%s", state.value)
 
-                new_state = get_posting_screen_state(self.driver)
+                if new_state is None:
+                    new_state = self._cached_state()
                 if new_state == PostingScreenState.SUCCESS:
                     logger.info("Post success detected after action")
                     return True
@@ -717,18 +1395,11 @@ class InstagramPoster:
                     logger.info("Post success detected (Profile after Share)")
                     return True
             logger.error("Max steps (%d) reached without SUCCESS", MAX_POST_STEPS)
-            try:
-                self.driver.save_screenshot("post_failed_max_steps.png")
-                logger.info("Screenshot saved: post_failed_max_steps.png")
-            except Exception:
-                pass
+            self._save_debug_image("post_failed_max_steps")
             return False
         except Exception as e:
             logger.error("Failed to post photo: %s", e, exc_info=True)
-            try:
-                self.driver.save_screenshot("post_failed_exception.png")
-            except Exception:
-                pass
+            self._save_debug_image("post_failed_exception")
             return False
     
     def post_video(self, file_path: Path, caption: str = "", hashtags: Optional[List[str]] = None) -> bool:
@@ -737,9 +1408,8 @@ class InstagramPoster:
         logger.info("Posting video: %s", file_path.name)
         
         try:
-            device_path = self._push_file_to_device(file_path)
-            if not device_path:
-                return False
+            # Push while navigating to the create flow; wait for it right before picking from the gallery
+            push_future = self._push_in_background(file_path)
             
             if not self._navigate_to_create_post():
                 return False
@@ -747,6 +1417,9 @@ class InstagramPoster:
             if not self._select_media_type(MediaType.VIDEO):
                 return False
             
+            if not self._await_push(push_future):
+                return False
+            
             if not self._select_file_from_gallery(file_path):
                 return False
             
@@ -766,9 +1439,8 @@ class InstagramPoster:
         logger.info("Posting reel: %s", file_path.name)
         
         try:
-            device_path = self._push_file_to_device(file_path)
-            if not device_path:
-                return False
+            # Push while navigating to the create flow; wait for it right before picking from the gallery
+            push_future = self._push_in_background(file_path)
             
             if not self._navigate_to_create_post():
                 return False
@@ -776,6 +1448,9 @@ class InstagramPoster:
             if not self._select_media_type(MediaType.REEL):
                 return False
             
+            if not self._await_push(push_future):
+                return False
+            
             if not self._select_file_from_gallery(file_path):
                 return False
             
@@ -795,13 +1470,8 @@ class InstagramPoster:
         logger.info("Posting carousel: %s images", len(file_paths))
         
         try:
-            # Push all files to device
-            device_paths = []
-            for fp in file_paths:
-                dp = self._push_file_to_device(fp)
-                if dp:
-                    device_paths.append(dp)
-            
+            # Push all files to device in one adb push
+            device_paths = self._push_files_bulk(file_paths)
             if not device_paths:
                 return False
             
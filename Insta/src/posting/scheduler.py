@@ -5,12 +5,12 @@ from __future__ import annotations
 
 import logging
 import threading
-import time
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
 
 from src.posting.media_queue import MediaQueue
 from src.posting.models import PostStatus
+from state.db import close_thread_connections
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,12 @@ class PostScheduler:
         self.account_id = account_id
         self.running = False
         self.thread: Optional[threading.Thread] = None
-        self.check_interval = 60  # Check every minute
+        self.check_interval = 60  # Check at least every minute
+        # Set to wake the loop early: on stop() and when a post is enqueued (notify_new_post)
+        self._wakeup_event = threading.Event()
+        # Post ids already triggered and not yet reported done via mark_completed()
+        self._in_flight: Set[int] = set()
+        self._in_flight_lock = threading.Lock()
     
     def start(self):
         """Start the scheduler in a background thread."""
@@ -39,23 +44,48 @@ class PostScheduler:
     def stop(self):
         """Stop the scheduler."""
         self.running = False
+        self._wakeup_event.set()
         if self.thread:
             self.thread.join(timeout=5)
         logger.info("Post scheduler stopped")
     
     def _run(self):
         """Main scheduler loop."""
-        while self.running:
-            try:
-                self._check_and_post()
-            except Exception as e:
-                logger.error("Scheduler error: %s", e, exc_info=True)
-            
-            # Sleep for check interval
-            for _ in range(self.check_interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+        try:
+            while self.running:
+                # Clear before checking: a notify_new_post() that lands during the check still wakes the wait
+                self._wakeup_event.clear()
+                try:
+                    self._check_and_post()
+                except Exception as e:
+                    logger.error("Scheduler error: %s", e, exc_info=True)
+                
+                # Sleep until the next scheduled post is due (at most check_interval), or until woken
+                # by stop() / notify_new_post(); no per-second polling of self.running
+                if self.running:
+                    self._wakeup_event.wait(self._seconds_until_next_check())
+        finally:
+            # MediaQueue reads cached a connection on this thread; release it with the thread
+            close_thread_connections()
+    
+    def notify_new_post(self):
+        """Wake the scheduler so a newly enqueued post is picked up without waiting out the interval."""
+        self._wakeup_event.set()
+    
+    def _seconds_until_next_check(self) -> float:
+        """Time to sleep: until the earliest future scheduled_time, clamped to [1s, check_interval]."""
+        try:
+            due = self.queue_manager.next_due_time(account_id=self.account_id)
+        except Exception as e:
+            logger.debug("Could not read next due time: %s", e)
+            return self.check_interval
+        if due is None:
+            return self.check_interval
+        wait = (due - datetime.utcnow()).total_seconds()
+        if wait <= 0:
+            # Already due and reported by _check_and_post; don't re-report it every second
+            return self.check_interval
+        return max(1.0, min(self.check_interval, wait))
     
     def _check_and_post(self):
         """Check for scheduled posts ready to post and trigger posting."""
@@ -67,6 +97,10 @@ class PostScheduler:
                 # Check if scheduled time has arrived
                 now = datetime.utcnow()
                 if not post.scheduled_time or post.scheduled_time <= now:
+                    with self._in_flight_lock:
+                        if post.id in self._in_flight:
+                            return  # Already triggered; waiting for it to be posted
+                        self._in_flight.add(post.id)
                     logger.info("Found post ready to publish: %s (type: %s)", post.id, post.media_type.value)
                     # Trigger posting (will be handled by web API or separate posting service)
                     # For now, just log - actual posting will be triggered via API
@@ -74,6 +108,11 @@ class PostScheduler:
         except Exception as e:
             logger.error("Error checking scheduled posts: %s", e)
     
+    def mark_completed(self, post_id: int):
+        """Forget a triggered post once it has been posted (or failed) so it can be triggered again if re-queued."""
+        with self._in_flight_lock:
+            self._in_flight.discard(post_id)
+    
     def _trigger_posting(self, post_id: int):
         """Trigger posting for a post. This will call the posting API."""
         # In a full implementation, this would call the posting service
@@ -4,12 +4,23 @@ See -> Decide -> Act: this module provides "see" (state) and "decide" (find elem
 """
 from __future__ import annotations
 
+import io
 import logging
+import re
+import xml.etree.ElementTree as ET
 from enum import Enum
 from typing import List, Optional, Tuple
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Debug screenshots are re-encoded as JPEG at this quality when Pillow is installed (PNG otherwise)
+DEBUG_JPEG_QUALITY = 60
+
 # Success phrases in page source (lowercase) to confirm post was shared
 SUCCESS_PHRASES = [
     "your post has been shared",
@@ -36,18 +47,49 @@ def _find_el(driver, selectors: List[Tuple[str, str]], timeout: float = 1.5):
     return _find_element(driver, selectors, timeout=timeout)
 
 
-def get_posting_screen_state(driver) -> PostingScreenState:
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+def parse_page_source(page_source: str) -> Optional[ET.Element]:
+    """Parse UiAutomator2 page source XML. Returns the root element, or None if it can't be parsed."""
+    try:
+        return ET.fromstring(page_source.encode("utf-8"))
+    except (ET.ParseError, AttributeError):
+        return None
+
+
+def node_bounds(node: ET.Element) -> Optional[Tuple[int, int, int, int]]:
+    """(x1, y1, x2, y2) of a page-source node from its bounds="[x1,y1][x2,y2]" attribute."""
+    m = _BOUNDS_RE.match(node.get("bounds", ""))
+    if not m:
+        return None
+    return tuple(map(int, m.groups()))  # type: ignore[return-value]
+
+
+def node_center(node: ET.Element) -> Optional[Tuple[int, int]]:
+    """Center (x, y) of a page-source node."""
+    b = node_bounds(node)
+    if not b:
+        return None
+    x1, y1, x2, y2 = b
+    return (x1 + x2) // 2, (y1 + y2) // 2
+
+
+def get_posting_screen_state(driver, page_source: Optional[str] = None) -> PostingScreenState:
     """
     Detect current screen state using priority order.
     Uses lightweight checks: key element lookups and a slice of page_source.
+    Pass page_source to reuse a snapshot the caller already fetched.
     """
     try:
         # Cache page source once per detection (first 12k chars so toasts are found)
-        try:
-            full_src = driver.page_source or ""
-            src_lower = full_src[:12000].lower()
-        except Exception:
-            src_lower = ""
+        full_src = page_source or ""
+        if page_source is None:
+            try:
+                full_src = driver.page_source or ""
+            except Exception:
+                full_src = ""
+        src_lower = full_src[:12000].lower()
 
         # 1) SUCCESS: explicit success phrases (toast or screen text)
         for phrase in SUCCESS_PHRASES:
@@ -92,7 +134,7 @@ def get_posting_screen_state(driver) -> PostingScreenState:
                 try:
                     from appium.webdriver.common.appiumby import AppiumBy
                     images = driver.find_elements(AppiumBy.XPATH, "//android.widget.ImageView")
-                    if len(images) >= 4 and "recycler" in (driver.page_source or "").lower()[:3000]:
+                    if len(images) >= 4 and "recycler" in src_lower[:3000]:
                         return PostingScreenState.GALLERY
                 except Exception:
                     pass
@@ -126,6 +168,81 @@ def get_action_for_state(state: PostingScreenState) -> str:
     }.get(state, "retry_or_fallback")
 
 
+def find_tap_point_by_intent(root: Optional[ET.Element], intent: str) -> Optional[Tuple[int, int]]:
+    """
+    Resolve an intent to a tap coordinate from an already-parsed page source (no server round trip).
+    Only intents expressible as plain attribute matches are handled; returns None otherwise or when
+    nothing matches, in which case callers fall back to find_element_by_intent.
+    """
+    if root is None:
+        return None
+    if intent == "first_image":
+        for path in (
+            ".//android.widget.ImageView[@clickable='true']",
+            ".//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView",
+        ):
+            for node in root.iterfind(path):
+                if node.get("displayed", "true") != "true":
+                    continue
+                center = node_center(node)
+                if center:
+                    return center
+    return None
+
+
+def gallery_thumbnail_points(root: Optional[ET.Element], limit: int, min_side: int = 80) -> List[Tuple[int, int]]:
+    """
+    Centers of the first `limit` gallery grid thumbnails in reading order (newest media first),
+    from an already-parsed page source. Nodes smaller than min_side px (icons, badges) are skipped.
+    """
+    if root is None:
+        return []
+    nodes = root.findall(".//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView")
+    if not nodes:
+        nodes = root.findall(".//android.widget.ImageView[@clickable='true']")
+    boxes = set()
+    for node in nodes:
+        if node.get("displayed", "true") != "true":
+            continue
+        b = node_bounds(node)
+        if b and b[2] - b[0] >= min_side and b[3] - b[1] >= min_side:
+            boxes.add(b)
+    ordered = sorted(boxes, key=lambda b: (b[1], b[0]))
+    return [((x1 + x2) // 2, (y1 + y2) // 2) for x1, y1, x2, y2 in ordered[:limit]]
+
+
+# Containers whose direct children are gallery grid cells
+_GRID_TAGS = frozenset({"androidx.recyclerview.widget.RecyclerView", "android.widget.GridView"})
+
+
+def count_selected(root: Optional[ET.Element], min_side: int = 80) -> int:
+    """
+    Number of gallery grid cells marked picked in a parsed page source: a RecyclerView/GridView child
+    holding a thumbnail-sized ImageView (as in gallery_thumbnail_points) with a selected/checked node
+    inside it. Tabs, toggles and switches elsewhere on screen are not counted.
+    """
+    if root is None:
+        return 0
+    picked = set()
+    for grid in root.iter():
+        if grid.tag not in _GRID_TAGS:
+            continue
+        for cell in grid:
+            marked = False
+            thumb = None
+            for n in cell.iter():
+                if n.get("selected") == "true" or n.get("checked") == "true":
+                    marked = True
+                if thumb is None and n.tag == "android.widget.ImageView":
+                    b = node_bounds(n)
+                    if b and b[2] - b[0] >= min_side and b[3] - b[1] >= min_side:
+                        thumb = b
+            if marked and thumb is not None:
+                # Keyed by thumbnail bounds so a cell seen through nested grids counts once
+                picked.add(thumb)
+    return len(picked)
+
+
 def find_element_by_intent(driver, intent: str):
     """
     Find the best-matching visible element for the given intent.
@@ -247,14 +364,38 @@ def find_element_by_intent(driver, intent: str):
     return None
 
 
-def dump_screen_summary(driver, path: Optional[str] = None) -> str:
+def save_debug_image(driver, base_path: str) -> str:
+    """
+    Save a screenshot to base_path + ".jpg" (JPEG, DEBUG_JPEG_QUALITY) when Pillow is available,
+    else base_path + ".png". Returns the path written; raises if the screenshot can't be taken.
+    """
+    if Image is None:
+        path = base_path + ".png"
+        driver.save_screenshot(path)
+    else:
+        path = base_path + ".jpg"
+        png = driver.get_screenshot_as_png()
+        Image.open(io.BytesIO(png)).convert("RGB").save(path, "JPEG", quality=DEBUG_JPEG_QUALITY)
+    logger.info("Screenshot saved: %s", path)
+    return path
+
+
+def dump_screen_summary(driver, path: Optional[str] = None, use_ui_tree: bool = True) -> str:
     """
     Collect visible elements (content-desc, text, resource-id) and write to a debug file.
-    Optionally saves a screenshot with the same base path and .png extension.
-    Returns the path written (txt path).
+    Also saves a screenshot with the same base path (see save_debug_image).
+    use_ui_tree=False skips the (slow) page source + element scan and only saves the screenshot.
+    Returns the path written (txt path, or image path when use_ui_tree=False).
     """
     import os
     out_path = path or "post_debug_screen.txt"
+    base = os.path.splitext(out_path)[0]
+    if not use_ui_tree:
+        try:
+            return save_debug_image(driver, base)
+        except Exception as e:
+            logger.debug("Screenshot failed: %s", e)
+            return ""
     lines = []
     try:
         try:
@@ -294,10 +435,8 @@ def dump_screen_summary(driver, path: Optional[str] = None) -> str:
         with open(out_path, "w", encoding="utf-8", errors="replace") as f:
             f.write("\n".join(lines))
         logger.info("Screen dump saved: %s", out_path)
-        base = os.path.splitext(out_path)[0]
         try:
-            driver.save_screenshot(base + ".png")
-            logger.info("Screenshot saved: %s.png", base)
+            save_debug_image(driver, base)
         except Exception as e:
             logger.debug("Screenshot failed: %s", e)
     except Exception as e:
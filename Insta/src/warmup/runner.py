@@ -269,6 +269,8 @@ def run_plan(
         else:
             delay()
 
+    # Session over: write buffered action_history rows now rather than on the next batch or at exit
+    repo.flush_actions()
     session_ended_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     session_started_str = session_started_at.isoformat() + "Z"
     repo.upsert_daily_totals(
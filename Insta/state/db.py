@@ -5,35 +5,76 @@ One DB per account or single DB with account_id; we use single DB with account_i
 from __future__ import annotations
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Dict, Generator, Optional, Set
 
 # Default DB path relative to project root
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "warmup.db"
 
+# WAL lets readers (web UI, scheduler) run while a session writes; NORMAL sync is safe under WAL
+# and skips an fsync per commit. journal_mode is persistent, so it is set once per DB file.
+_CONNECTION_PRAGMAS = ("PRAGMA synchronous=NORMAL", "PRAGMA temp_store=MEMORY")
+_WAL_ENABLED: Set[str] = set()
+_WAL_LOCK = threading.Lock()
+# Per-thread connections reused by cursor(); sqlite3 caches prepared statements per connection
+_local = threading.local()
+
 
 def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     path = db_path or DEFAULT_DB_PATH
     path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(path))
     conn.row_factory = sqlite3.Row
+    key = str(path)
+    if key not in _WAL_ENABLED:
+        with _WAL_LOCK:
+            if key not in _WAL_ENABLED:
+                conn.execute("PRAGMA journal_mode=WAL")
+                _WAL_ENABLED.add(key)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _thread_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """This thread's open connection to db_path (created on first use)."""
+    conns: Optional[Dict[str, sqlite3.Connection]] = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    key = str(db_path or DEFAULT_DB_PATH)
+    conn = conns.get(key)
+    if conn is None:
+        conn = conns[key] = get_connection(db_path)
     return conn
 
 
+def close_thread_connections() -> None:
+    """Close the calling thread's cached connections (e.g. at the end of a worker thread)."""
+    conns = getattr(_local, "conns", None) or {}
+    while conns:
+        _, conn = conns.popitem()
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
 @contextmanager
 def cursor(db_path: Optional[Path] = None) -> Generator[sqlite3.Cursor, None, None]:
-    conn = get_connection(db_path)
+    """Cursor on this thread's reused connection; commits on success, rolls back on error."""
+    conn = _thread_connection(db_path)
+    cur = conn.cursor()
     try:
-        cur = conn.cursor()
-        try:
-            yield cur
-            conn.commit()
-        finally:
-            cur.close()
+        yield cur
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        cur.close()
 
 
 def init_schema(conn: Optional[sqlite3.Connection] = None, db_path: Optional[Path] = None) -> None:
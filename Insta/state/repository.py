@@ -3,12 +3,35 @@ Repository layer for account state: first_run_date, last_run_date, action counts
 """
 from __future__ import annotations
 
-from datetime import date, datetime
+import atexit
+import threading
+import time
+from datetime import date
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from . import db as db_module
 
+# record_action buffers rows and writes them with one executemany once this many are pending;
+# flush_actions() writes whatever is left (called at session end, when worker threads finish and at exit).
+ACTION_FLUSH_COUNT = 20
+_pending_actions: List[Tuple[Optional[Path], tuple]] = []
+_pending_lock = threading.Lock()
+# (unix second, formatted UTC timestamp) of the last _now_iso() call
+_TS_CACHE: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as 'YYYY-MM-DDTHH:MM:SSZ', formatted at most once per second."""
+    global _TS_CACHE
+    sec = int(time.time())
+    cached_sec, cached = _TS_CACHE
+    if sec == cached_sec:
+        return cached
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+    _TS_CACHE = (sec, stamp)
+    return stamp
+
 
 def register_account(
     account_id: str,
@@ -17,7 +40,7 @@ def register_account(
     db_path: Optional[Path] = None,
 ) -> None:
     today = date.today().isoformat()
-    now = datetime.utcnow().isoformat() + "Z"
+    now = _now_iso()
     with db_module.cursor(db_path) as cur:
         cur.execute(
             """
@@ -41,22 +64,26 @@ def get_account(account_id: str, db_path: Optional[Path] = None) -> Optional[dic
         return dict(row) if row else None
 
 
+def _get_account_field(account_id: str, column: str, db_path: Optional[Path] = None) -> Any:
+    """One column of the account row (None if the account doesn't exist). column must be a literal name."""
+    with db_module.cursor(db_path) as cur:
+        cur.execute(f"SELECT {column} FROM account WHERE account_id = ?", (account_id,))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+
 def get_first_run_date(account_id: str, db_path: Optional[Path] = None) -> Optional[date]:
-    acc = get_account(account_id, db_path)
-    if not acc or not acc.get("first_run_date"):
-        return None
-    return date.fromisoformat(acc["first_run_date"])
+    value = _get_account_field(account_id, "first_run_date", db_path)
+    return date.fromisoformat(value) if value else None
 
 
 def get_last_run_date(account_id: str, db_path: Optional[Path] = None) -> Optional[date]:
-    acc = get_account(account_id, db_path)
-    if not acc or not acc.get("last_run_date"):
-        return None
-    return date.fromisoformat(acc["last_run_date"])
+    value = _get_account_field(account_id, "last_run_date", db_path)
+    return date.fromisoformat(value) if value else None
 
 
 def set_last_run_date(account_id: str, run_date: date, db_path: Optional[Path] = None) -> None:
-    now = datetime.utcnow().isoformat() + "Z"
+    now = _now_iso()
     with db_module.cursor(db_path) as cur:
         cur.execute(
             "UPDATE account SET last_run_date = ?, updated_at = ? WHERE account_id = ?",
@@ -65,12 +92,11 @@ def set_last_run_date(account_id: str, run_date: date, db_path: Optional[Path] =
 
 
 def get_bio_edit_done(account_id: str, db_path: Optional[Path] = None) -> bool:
-    acc = get_account(account_id, db_path)
-    return bool(acc and acc.get("bio_edit_done"))
+    return bool(_get_account_field(account_id, "bio_edit_done", db_path))
 
 
 def set_bio_edit_done(account_id: str, db_path: Optional[Path] = None) -> None:
-    now = datetime.utcnow().isoformat() + "Z"
+    now = _now_iso()
     with db_module.cursor(db_path) as cur:
         cur.execute(
             "UPDATE account SET bio_edit_done = 1, updated_at = ? WHERE account_id = ?",
@@ -85,12 +111,43 @@ def record_action(
     count: int = 1,
     db_path: Optional[Path] = None,
 ) -> None:
-    now = datetime.utcnow().isoformat() + "Z"
-    with db_module.cursor(db_path) as cur:
-        cur.execute(
-            "INSERT INTO action_history (account_id, run_date, action_type, count, created_at) VALUES (?, ?, ?, ?, ?)",
-            (account_id, run_date.isoformat(), action_type, count, now),
-        )
+    """Queue an action_history row; rows are written in batches of ACTION_FLUSH_COUNT (see flush_actions)."""
+    now = _now_iso()
+    with _pending_lock:
+        _pending_actions.append((db_path, (account_id, run_date.isoformat(), action_type, count, now)))
+        due = len(_pending_actions) >= ACTION_FLUSH_COUNT
+    if due:
+        flush_actions()
+
+
+def flush_actions() -> None:
+    """
+    Write all buffered action_history rows (one executemany per DB). If a write fails (e.g. database
+    is locked) the rows not yet written go back to the front of the buffer and the error is re-raised.
+    """
+    with _pending_lock:
+        pending = _pending_actions[:]
+        _pending_actions.clear()
+    by_db: Dict[Optional[Path], List[tuple]] = {}
+    for db_path, row in pending:
+        by_db.setdefault(db_path, []).append(row)
+    while by_db:
+        db_path, rows = next(iter(by_db.items()))
+        try:
+            with db_module.cursor(db_path) as cur:
+                cur.executemany(
+                    "INSERT INTO action_history (account_id, run_date, action_type, count, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except Exception:
+            unwritten = [(path, row) for path, path_rows in by_db.items() for row in path_rows]
+            with _pending_lock:
+                _pending_actions[:0] = unwritten
+            raise
+        del by_db[db_path]
+
+
+atexit.register(flush_actions)
 
 
 def get_today_totals(account_id: str, db_path: Optional[Path] = None) -> Tuple[int, int]:
@@ -132,6 +189,7 @@ def upsert_daily_totals(
 
 
 def get_actions_today(account_id: str, db_path: Optional[Path] = None) -> List[dict]:
+    flush_actions()
     today = date.today().isoformat()
     with db_module.cursor(db_path) as cur:
         cur.execute(
@@ -150,12 +208,17 @@ def increment_daily_totals(
     session_ended_at: Optional[str] = None,
     db_path: Optional[Path] = None,
 ) -> None:
-    total, likes = get_today_totals(account_id, db_path)
-    total += actions_delta
-    likes += likes_delta
-    upsert_daily_totals(
-        account_id, run_date, total, likes,
-        session_started_at=session_started_at,
-        session_ended_at=session_ended_at,
-        db_path=db_path,
-    )
+    """Add deltas to run_date's totals in one atomic upsert (no read-modify-write race)."""
+    with db_module.cursor(db_path) as cur:
+        cur.execute(
+            """
+            INSERT INTO daily_totals (account_id, run_date, total_actions, likes_count, session_started_at, session_ended_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(account_id, run_date) DO UPDATE SET
+                total_actions = total_actions + excluded.total_actions,
+                likes_count = likes_count + excluded.likes_count,
+                session_started_at = COALESCE(session_started_at, excluded.session_started_at),
+                session_ended_at = COALESCE(excluded.session_ended_at, session_ended_at)
+            """,
+            (account_id, run_date.isoformat(), actions_delta, likes_delta, session_started_at, session_ended_at),
+        )
@@ -46,12 +46,21 @@ app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024  # 100MB max file size
 app.config["UPLOAD_FOLDER"] = str(MEDIA_QUEUE)
 
 # Initialize database schema
-from state.db import ensure_schema
+from state.db import close_thread_connections, ensure_schema
+from state.repository import flush_actions
 ensure_schema()
 
+
+@app.teardown_request
+def _close_request_connections(_exc):
+    # Dev server runs each request on its own short-lived thread; don't leave its cached connection open
+    close_thread_connections()
+
 # Initialize managers
 queue_manager = MediaQueue()
 caption_manager = CaptionManager()
+# Posting only happens in this process: anything still "posting" was cut off by a previous run
+queue_manager.recover_interrupted_posts()
 
 # Allowed file extensions
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
@@ -179,6 +188,8 @@ def api_upload():
             hashtags=hashtags,
             scheduled_time=scheduled_time,
         )
+        if _scheduler:
+            _scheduler.notify_new_post()
         
         return jsonify({"success": True, "post": post_item.to_dict()}), 200
     
@@ -232,6 +243,8 @@ def api_update_queue(post_id: int):
             hashtags=hashtags,
             scheduled_time=scheduled_time,
         )
+        if _scheduler:
+            _scheduler.notify_new_post()
         
         return jsonify({"success": True, "post": new_post.to_dict()}), 200
     
@@ -284,8 +297,9 @@ def api_post_now(post_id: int):
         if post.account_id != account_id:
             return jsonify({"error": "Post belongs to different account"}), 403
         
-        # Mark as posting
-        queue_manager.update_status(post_id, PostStatus.POSTING)
+        # Mark as posting (atomic: a second request for the same post is rejected)
+        if not queue_manager.claim_post(post_id):
+            return jsonify({"error": "Post is already being posted"}), 409
         
         # Import poster and driver creation
         from src.posting.poster import InstagramPoster
@@ -298,6 +312,7 @@ def api_post_now(post_id: int):
         device_config = config.get("device", {})
         package = app_config.get("package", "com.instagram.android")
         adb_serial = device_config.get("adb_serial")
+        fast_idle = device_config.get("fast_idle", True)
         
         # Check account health before posting
         from src.health.monitor import is_in_cooldown
@@ -324,10 +339,16 @@ def api_post_now(post_id: int):
                 result["success"] = poster.post_item(post)
             except Exception as e:
                 result["error"] = e
+            finally:
+                try:
+                    flush_actions()
+                except Exception as e:
+                    logger.warning("Could not flush action history: %s", e)
+                close_thread_connections()
 
         try:
             driver = create_driver(package=package, activity=None, adb_serial=adb_serial)
-            poster = InstagramPoster(driver, account_id, adb_serial=adb_serial)
+            poster = InstagramPoster(driver, account_id, adb_serial=adb_serial, fast_idle=fast_idle)
 
             t = threading.Thread(target=run_post)
             t.daemon = True
@@ -366,6 +387,8 @@ def api_post_now(post_id: int):
                     driver.quit()
                 except Exception:
                     pass
+            if _scheduler:
+                _scheduler.mark_completed(post_id)
     
     except Exception as e:
         logger.error("Post error: %s", e, exc_info=True)
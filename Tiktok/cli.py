@@ -123,7 +123,7 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
 
     action_counts = {}
     for item in plan.items:
-        action_counts[item.action.value] = action_counts.get(item.action.value, 0) + 1
+        action_counts[item.action] = action_counts.get(item.action, 0) + 1
     print(f"Plan: {len(plan.items)} actions")
     for action_type, count in action_counts.items():
         print(f"   - {action_type}: {count}")
@@ -160,17 +160,21 @@ def _cmd_start(account_id: str, force: bool = False) -> int:
     config_with_force["force_mode"] = force
 
     def run():
-        result = run_plan(
-            plan,
-            app,
-            account_id,
-            today,
-            on_action_done=on_action_done,
-            session_started_at=session_started,
-            stop_flag=lambda: _stop_requested,
-            config=config_with_force,
-        )
-        logger.info("Session finished: %s", result)
+        from src.health.monitor import close_thread_connections
+        try:
+            result = run_plan(
+                plan,
+                app,
+                account_id,
+                today,
+                on_action_done=on_action_done,
+                session_started_at=session_started,
+                stop_flag=lambda: _stop_requested,
+                config=config_with_force,
+            )
+            logger.info("Session finished: %s", result)
+        finally:
+            close_thread_connections()
 
     _run_thread = threading.Thread(target=run)
     _run_thread.start()
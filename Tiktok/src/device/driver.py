@@ -4,16 +4,44 @@ No automated login: user must be already logged in on the device.
 """
 from __future__ import annotations
 
+import random
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
+import urllib3
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
+from selenium.common.exceptions import WebDriverException
 
 # Project root: tiktok/
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# Session creation against a cold-starting Appium server often fails once or twice; retry with backoff
+DRIVER_ATTEMPTS = 3
+RETRY_BASE_SEC = 0.5
+RETRY_MAX_SEC = 8.0
+RETRY_JITTER_SEC = 0.25
+_RETRYABLE = (WebDriverException, urllib3.exceptions.HTTPError, ConnectionError)
+
+T = TypeVar("T")
+
+
+def _with_retries(fn: Callable[[], T], attempts: int = DRIVER_ATTEMPTS) -> T:
+    """
+    Call fn, retrying on Appium/connection errors. The first retry is immediate; later ones wait
+    RETRY_BASE_SEC * 2**attempt (capped at RETRY_MAX_SEC) plus jitter. Re-raises the last error.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except _RETRYABLE:
+            if attempt == attempts - 1:
+                raise
+            if attempt:
+                time.sleep(min(RETRY_MAX_SEC, RETRY_BASE_SEC * 2 ** attempt) + random.uniform(0, RETRY_JITTER_SEC))
+    raise RuntimeError("unreachable")
+
 
 def create_driver(
     package: str = "com.zhiliaoapp.musically",
@@ -42,11 +70,11 @@ def create_driver(
         for k, v in caps_override.items():
             setattr(options, k, v)
 
-    driver = webdriver.Remote(appium_url, options=options)
+    driver = _with_retries(lambda: webdriver.Remote(appium_url, options=options))
 
     if not activity:
         try:
-            driver.activate_app(package)
+            _with_retries(lambda: driver.activate_app(package))
             time.sleep(1)
         except Exception:
             import subprocess
@@ -3,101 +3,149 @@ Selectors for TikTok posting (create) flow: +, Upload, gallery, Next, caption, P
 """
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Tuple
 
+# Locator strategies, spelled exactly as the AppiumBy values so pairs go to find_element unchanged
 BY_ACCESSIBILITY_ID = "accessibility id"
 BY_ID = "id"
 BY_XPATH = "xpath"
 BY_CLASS = "class name"
-
-
-def create_post_button_selectors() -> List[Tuple[str, str]]:
+BY_ANDROID_UIAUTOMATOR = "-android uiautomator"
+
+# Selector lists are built once at import; the *_selectors() functions return the shared tuple
+# Order within a tuple is by lookup cost: accessibility id / id first, then XPath, broad catch-alls last
+# Only true equals are fused into one XPath (spelling/case variants on the same attribute): XPath returns
+# matches in document order, so a fused lower-priority predicate could win; fallbacks stay separate entries
+# XPaths filter on @displayed server-side, so _find_element skips the is_displayed() round trip for them
+Selectors = Tuple[Tuple[str, str], ...]
+
+_CREATE_POST_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Create"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Create') or contains(@content-desc, 'create')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@resource-id, 'create') or contains(@resource-id, 'post')][@displayed='true']"),
+)
+
+_UPLOAD: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Upload"),
+    (BY_XPATH, "//*[contains(@resource-id, 'upload')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@text, 'Upload') or contains(@text, 'upload')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Upload') or contains(@content-desc, 'upload')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Gallery') or contains(@content-desc, 'gallery')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'album') or contains(@content-desc, 'library') or contains(@content-desc, 'photo')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@text, 'Gallery') or contains(@text, 'gallery')][@displayed='true']"),
+    # Create screen: clickable image/button in bottom area (upload icon often has no text)
+    (BY_XPATH, "//*[@clickable='true' and (contains(@resource-id, 'upload') or contains(@resource-id, 'gallery') or contains(@resource-id, 'album') or contains(@resource-id, 'choose') or contains(@resource-id, 'media'))][@displayed='true']"),
+)
+
+_GALLERY: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Gallery"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Gallery') or contains(@content-desc, 'gallery')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@resource-id, 'gallery')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@text, 'Gallery') or contains(@text, 'Recent')][@displayed='true']"),
+)
+
+# Gallery grid: UiSelector queries resolve on the device without serializing the hierarchy to XML,
+# which is what made the XPath versions slow on a full RecyclerView of thumbnails
+_GALLERY_THUMBNAIL: Selectors = (
+    (BY_ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.ImageView").clickable(true).instance(0)'),
+    (BY_ANDROID_UIAUTOMATOR, 'new UiSelector().resourceIdMatches(".*(thumbnail|video).*").instance(0)'),
+    (BY_ANDROID_UIAUTOMATOR, 'new UiSelector().className("androidx.recyclerview.widget.RecyclerView")'
+                             '.childSelector(new UiSelector().className("android.widget.ImageView").instance(0))'),
+    (BY_ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.ImageView").instance(0)'),
+)
+
+_NEXT_BUTTON: Selectors = (
+    (BY_ID, "com.zhiliaoapp.musically:id/vn0"),
+    (BY_ACCESSIBILITY_ID, "Next"),
+    (BY_XPATH, "//*[contains(@text, 'Next') or contains(@text, 'next')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Next')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@resource-id, 'next')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@text, 'Continue') or contains(@text, 'continue')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Continue')][@displayed='true']"),
+)
+
+_CONTINUE_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Continue"),
+    (BY_XPATH, "//*[contains(@text, 'Continue') or contains(@text, 'continue')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Continue')][@displayed='true']"),
+)
+
+_CAPTION_INPUT: Selectors = (
+    (BY_XPATH, "//*[contains(@resource-id, 'caption')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@resource-id, 'desc')]//android.widget.EditText[@displayed='true']"),
+    (BY_XPATH, "//android.widget.EditText[contains(@hint, 'caption') or contains(@hint, 'description') or contains(@hint, 'Add a caption')][@displayed='true']"),
+    (BY_CLASS, "android.widget.EditText"),
+)
+
+_SHARE_POST_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Post"),
+    (BY_XPATH, "//*[contains(@text, 'Post') or contains(@text, 'post')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@text, 'Publish') or contains(@text, 'publish')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Post') or contains(@content-desc, 'Publish')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@resource-id, 'post') or contains(@resource-id, 'publish')][@displayed='true']"),
+)
+
+_DONE_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Done"),
+    (BY_XPATH, "//*[contains(@text, 'Done') or contains(@text, 'done')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Done')][@displayed='true']"),
+)
+
+_SKIP_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Skip"),
+    (BY_XPATH, "//*[contains(@text, 'Skip') or contains(@text, 'skip')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Skip')][@displayed='true']"),
+)
+
+
+def create_post_button_selectors() -> Selectors:
     """Create (+) button - center of bottom nav or on create screen."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Create"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Create') or contains(@content-desc, 'create')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'create') or contains(@resource-id, 'post')]"),
-        (BY_XPATH, "//android.widget.ImageButton[contains(@content-desc, 'Create')]"),
-    ]
+    return _CREATE_POST_BUTTON
 
 
-def create_post_button_on_profile_selectors() -> List[Tuple[str, str]]:
+def create_post_button_on_profile_selectors() -> Selectors:
     """Same as create - TikTok uses same + for create from anywhere."""
-    return create_post_button_selectors()
+    return _CREATE_POST_BUTTON
 
 
-def upload_selectors() -> List[Tuple[str, str]]:
+def upload_selectors() -> Selectors:
     """Upload option (to pick from gallery) - icon to the right of record button."""
-    return [
-        (BY_XPATH, "//*[contains(@text, 'Upload') or contains(@text, 'upload')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Upload') or contains(@content-desc, 'upload')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Gallery') or contains(@content-desc, 'gallery')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'album') or contains(@content-desc, 'library') or contains(@content-desc, 'photo')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'upload')]"),
-        (BY_XPATH, "//*[contains(@text, 'Gallery') or contains(@text, 'gallery')]"),
-        # Create screen: clickable image/button in bottom area (upload icon often has no text)
-        (BY_XPATH, "//*[@clickable='true' and (contains(@resource-id, 'upload') or contains(@resource-id, 'gallery') or contains(@resource-id, 'album') or contains(@resource-id, 'choose') or contains(@resource-id, 'media'))]"),
-    ]
-
-
-def gallery_selectors() -> List[Tuple[str, str]]:
+    return _UPLOAD
+
+
+def gallery_selectors() -> Selectors:
     """Gallery / file picker."""
-    return [
-        (BY_XPATH, "//*[contains(@content-desc, 'Gallery') or contains(@content-desc, 'gallery')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'gallery')]"),
-        (BY_XPATH, "//*[contains(@text, 'Gallery') or contains(@text, 'Recent')]"),
-    ]
+    return _GALLERY
+
+
+def gallery_thumbnail_selectors() -> Selectors:
+    """First video thumbnail in the gallery grid."""
+    return _GALLERY_THUMBNAIL
 
 
-def next_button_selectors() -> List[Tuple[str, str]]:
+def next_button_selectors() -> Selectors:
     """Next / Continue (trim and composer steps)."""
-    return [
-        (BY_ID, "com.zhiliaoapp.musically:id/vn0"),
-        (BY_XPATH, "//*[contains(@text, 'Next') or contains(@text, 'next')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Next')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'next')]"),
-        (BY_XPATH, "//*[contains(@text, 'Continue') or contains(@text, 'continue')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Continue')]"),
-    ]
+    return _NEXT_BUTTON
 
 
-def continue_button_selectors() -> List[Tuple[str, str]]:
-    return [
-        (BY_XPATH, "//*[contains(@text, 'Continue') or contains(@text, 'continue')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Continue')]"),
-    ]
+def continue_button_selectors() -> Selectors:
+    return _CONTINUE_BUTTON
 
 
-def caption_input_selectors() -> List[Tuple[str, str]]:
+def caption_input_selectors() -> Selectors:
     """Caption / description input."""
-    return [
-        (BY_XPATH, "//*[contains(@resource-id, 'caption')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'desc')]//android.widget.EditText"),
-        (BY_XPATH, "//android.widget.EditText[contains(@hint, 'caption') or contains(@hint, 'description') or contains(@hint, 'Add a caption')]"),
-        (BY_CLASS, "android.widget.EditText"),
-    ]
+    return _CAPTION_INPUT
 
 
-def share_post_button_selectors() -> List[Tuple[str, str]]:
+def share_post_button_selectors() -> Selectors:
     """Post / Publish button."""
-    return [
-        (BY_XPATH, "//*[contains(@text, 'Post') or contains(@text, 'post')]"),
-        (BY_XPATH, "//*[contains(@text, 'Publish') or contains(@text, 'publish')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Post') or contains(@content-desc, 'Publish')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'post') or contains(@resource-id, 'publish')]"),
-    ]
+    return _SHARE_POST_BUTTON
 
 
-def done_button_selectors() -> List[Tuple[str, str]]:
+def done_button_selectors() -> Selectors:
     """Done (after selecting media)."""
-    return [
-        (BY_XPATH, "//*[contains(@text, 'Done') or contains(@text, 'done')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Done')]"),
-    ]
+    return _DONE_BUTTON
 
 
-def skip_button_selectors() -> List[Tuple[str, str]]:
-    return [
-        (BY_XPATH, "//*[contains(@text, 'Skip') or contains(@text, 'skip')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Skip')]"),
-    ]
+def skip_button_selectors() -> Selectors:
+    return _SKIP_BUTTON
@@ -4,105 +4,132 @@ FYP (For You) scroll, like, profile visit. Refine with real device dumps.
 """
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
+# Locator strategies, spelled exactly as the AppiumBy values so pairs go to find_element unchanged
 BY_ACCESSIBILITY_ID = "accessibility id"
 BY_ID = "id"
 BY_XPATH = "xpath"
 BY_CLASS = "class name"
 
-
-def home_tab_selectors() -> List[Tuple[str, str]]:
+# Selector lists are built once at import; the *_selectors() functions return the shared tuple
+# Order within a tuple is by lookup cost: accessibility id / id first, then XPath, broad catch-alls last
+# Only true equals are fused into one XPath (spelling/case variants on the same attribute): XPath returns
+# matches in document order, so a fused lower-priority predicate could win; fallbacks stay separate entries
+# XPaths filter on @displayed server-side, so _find_element skips the is_displayed() round trip for them
+Selectors = Tuple[Tuple[str, str], ...]
+
+_HOME_TAB: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Home"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Home') or contains(@content-desc, 'home')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'For You') or contains(@content-desc, 'For you')][@displayed='true']"),
+)
+
+_DISCOVER_TAB: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Discover"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Discover') or contains(@content-desc, 'discover')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Search')][@displayed='true']"),
+)
+
+_CREATE_TAB: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Create"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Create') or contains(@content-desc, 'create')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Upload') or contains(@content-desc, 'upload')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@resource-id, 'create') or contains(@resource-id, 'post')][@displayed='true']"),
+)
+
+_INBOX_TAB: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Inbox"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Inbox') or contains(@content-desc, 'inbox')][@displayed='true']"),
+)
+
+_PROFILE_TAB: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Profile"),
+    (BY_ACCESSIBILITY_ID, "Me"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Profile') or contains(@content-desc, 'profile')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Me') or contains(@content-desc, 'me')][@displayed='true']"),
+)
+
+_LIKE_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Like"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Like') and not(contains(@content-desc, 'Liked'))][@displayed='true']"),
+    # Lower priority: like counters / containers can carry a 'like' resource-id too
+    (BY_XPATH, "//*[contains(@resource-id, 'like')][@displayed='true']"),
+)
+
+_LIKE_BUTTON_LIKED: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Liked"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Liked') or contains(@content-desc, 'Unlike')][@displayed='true']"),
+)
+
+_PROFILE_USERNAME_IN_FEED: Selectors = (
+    (BY_XPATH, "//*[contains(@resource-id, 'username') or contains(@resource-id, 'author')][@displayed='true']"),
+    (BY_XPATH, "//*[contains(@content-desc, 'profile') or contains(@content-desc, 'Profile')][@displayed='true']"),
+    (BY_XPATH, "//android.widget.TextView[@clickable='true'][@displayed='true']"),
+)
+
+_BACK_BUTTON: Selectors = (
+    (BY_ACCESSIBILITY_ID, "Back"),
+    (BY_XPATH, "//*[contains(@content-desc, 'Back') or contains(@content-desc, 'back')][@displayed='true']"),
+    (BY_XPATH, "//android.widget.ImageButton[@displayed='true']"),
+)
+
+_BLOCK_WARNING: Selectors = (
+    (BY_XPATH, "//*[contains(@text, 'Try again later') or contains(@text, 'try again later')"
+               " or contains(@text, 'Action blocked') or contains(@text, 'action blocked')"
+               " or contains(@text, 'Suspicious') or contains(@text, 'suspicious')"
+               " or contains(@text, 'Challenge') or contains(@text, 'challenge')][@displayed='true']"),
+)
+
+
+def home_tab_selectors() -> Selectors:
     """Home tab (For You feed)."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Home"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Home') or contains(@content-desc, 'home')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'For You') or contains(@content-desc, 'For you')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'tab') and contains(@content-desc, 'Home')]"),
-    ]
+    return _HOME_TAB
 
 
-def discover_tab_selectors() -> List[Tuple[str, str]]:
+def discover_tab_selectors() -> Selectors:
     """Discover / Search tab."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Discover"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Discover') or contains(@content-desc, 'discover')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Search')]"),
-    ]
+    return _DISCOVER_TAB
 
 
-def create_tab_selectors() -> List[Tuple[str, str]]:
+def create_tab_selectors() -> Selectors:
     """Create (+) button in bottom nav."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Create"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Create') or contains(@content-desc, 'create')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Upload') or contains(@content-desc, 'upload')]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'create') or contains(@resource-id, 'post')]"),
-    ]
+    return _CREATE_TAB
 
 
-def inbox_tab_selectors() -> List[Tuple[str, str]]:
+def inbox_tab_selectors() -> Selectors:
     """Inbox tab."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Inbox"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Inbox') or contains(@content-desc, 'inbox')]"),
-    ]
+    return _INBOX_TAB
 
 
-def profile_tab_selectors() -> List[Tuple[str, str]]:
+def profile_tab_selectors() -> Selectors:
     """Profile / Me tab (own profile)."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Profile"),
-        (BY_ACCESSIBILITY_ID, "Me"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Profile') or contains(@content-desc, 'profile')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Me') or contains(@content-desc, 'me')]"),
-    ]
+    return _PROFILE_TAB
 
 
-def like_button_selectors() -> List[Tuple[str, str]]:
+def like_button_selectors() -> Selectors:
     """Like (heart) on video."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Like"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Like') and not(contains(@content-desc, 'Liked'))]"),
-        (BY_XPATH, "//*[contains(@resource-id, 'like')]"),
-        (BY_XPATH, "//android.widget.ImageView[contains(@content-desc, 'Like')]"),
-    ]
+    return _LIKE_BUTTON
 
 
-def like_button_liked_selectors() -> List[Tuple[str, str]]:
+def like_button_liked_selectors() -> Selectors:
     """Like button in liked state."""
-    return [
-        (BY_ACCESSIBILITY_ID, "Liked"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Liked') or contains(@content-desc, 'Unlike')]"),
-    ]
+    return _LIKE_BUTTON_LIKED
 
 
-def profile_username_in_feed_selectors() -> List[Tuple[str, str]]:
+def profile_username_in_feed_selectors() -> Selectors:
     """Username or avatar on current video to open creator profile."""
-    return [
-        (BY_XPATH, "//*[contains(@resource-id, 'username') or contains(@resource-id, 'author')]"),
-        (BY_XPATH, "//*[contains(@content-desc, 'profile') or contains(@content-desc, 'Profile')]"),
-        (BY_XPATH, "//android.widget.TextView[@clickable='true']"),
-    ]
+    return _PROFILE_USERNAME_IN_FEED
 
 
-def back_button_selectors() -> List[Tuple[str, str]]:
-    return [
-        (BY_ACCESSIBILITY_ID, "Back"),
-        (BY_XPATH, "//*[contains(@content-desc, 'Back') or contains(@content-desc, 'back')]"),
-        (BY_XPATH, "//android.widget.ImageButton"),
-    ]
+def back_button_selectors() -> Selectors:
+    return _BACK_BUTTON
 
 
-def block_warning_selectors() -> List[Tuple[str, str]]:
+def block_warning_selectors() -> Selectors:
     """Block or rate-limit warning."""
-    return [
-        (BY_XPATH, "//*[contains(@text, 'Try again later') or contains(@text, 'try again later')]"),
-        (BY_XPATH, "//*[contains(@text, 'Action blocked') or contains(@text, 'action blocked')]"),
-        (BY_XPATH, "//*[contains(@text, 'Suspicious') or contains(@text, 'suspicious')]"),
-        (BY_XPATH, "//*[contains(@text, 'Challenge') or contains(@text, 'challenge')]"),
-    ]
+    return _BLOCK_WARNING
 
 
-def get_first_selector_pair(selectors: List[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+def get_first_selector_pair(selectors: Sequence[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
     return selectors[0] if selectors else None
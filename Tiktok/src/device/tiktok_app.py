@@ -6,13 +6,11 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import List, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 from appium.webdriver import WebElement
-from appium.webdriver.common.appiumby import AppiumBy
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
-    NoSuchElementException,
     StaleElementReferenceException,
     WebDriverException,
 )
@@ -23,31 +21,40 @@ from . import selectors as sel
 logger = logging.getLogger(__name__)
 
 FIND_TIMEOUT = 2
+# Retry delay between selector sweeps: starts short (most elements appear within ~100 ms) and grows to FIND_POLL
+FIND_POLL_INITIAL = 0.05
+FIND_POLL_BACKOFF = 1.7
 FIND_POLL = 0.5
 MAX_SWIPES = 50
 
 
-def _find_element(driver: WebDriver, selectors: List[Tuple[str, str]], timeout: float = FIND_TIMEOUT) -> Optional[WebElement]:
-    by_map = {
-        "accessibility id": AppiumBy.ACCESSIBILITY_ID,
-        "id": AppiumBy.ID,
-        "xpath": AppiumBy.XPATH,
-        "class name": AppiumBy.CLASS_NAME,
-    }
-    end = time.time() + timeout
-    while time.time() < end:
-        for by_key, locator in selectors:
+def _find_element(driver: WebDriver, selectors: Sequence[Tuple[str, str]], timeout: float = FIND_TIMEOUT) -> Optional[WebElement]:
+    """First displayed element matched by selectors (in priority order), retried with backoff until timeout."""
+
+    def _first_displayed(d: WebDriver):
+        # Selector strategies are already AppiumBy values (see selectors.BY_*), passed straight through.
+        # find_elements returns [] on a miss, so no NoSuchElementException round trip per selector.
+        for by, locator in selectors:
             try:
-                by = by_map.get(by_key, by_key)
-                el = driver.find_element(by, locator)
-                if el and el.is_displayed():
-                    return el
-            except NoSuchElementException:
-                continue
+                for el in d.find_elements(by, locator):
+                    # Selector XPaths carry [@displayed='true'], so their matches are already visible
+                    if by == sel.BY_XPATH or el.is_displayed():
+                        return el
             except WebDriverException:
                 continue
-        time.sleep(FIND_POLL)
-    return None
+        return None
+
+    deadline = time.monotonic() + timeout
+    delay = FIND_POLL_INITIAL
+    while True:
+        el = _first_displayed(driver)
+        if el is not None:
+            return el
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * FIND_POLL_BACKOFF, FIND_POLL)
 
 
 def _tap_element(driver: WebDriver, element: WebElement) -> None:
@@ -76,9 +83,8 @@ def _tap_element_robust(driver: WebDriver, element: WebElement) -> bool:
     return False
 
 
-def _scroll_fyp_up(driver: WebDriver, duration_ms: int = 300) -> None:
-    """Swipe up = next video on FYP."""
-    size = driver.get_window_size()
+def _scroll_fyp_up(driver: WebDriver, size: Dict[str, int], duration_ms: int = 300) -> None:
+    """Swipe up = next video on FYP. size is the (cached) window size."""
     x = size["width"] // 2
     y1 = int(size["height"] * 0.7)
     y2 = int(size["height"] * 0.3)
@@ -90,6 +96,13 @@ class TikTokApp:
 
     def __init__(self, driver: WebDriver) -> None:
         self.driver = driver
+        # Window size is constant for the session; fetched once on first swipe/tap
+        self._window_size: Optional[Dict[str, int]] = None
+
+    def _get_window_size(self) -> Dict[str, int]:
+        if self._window_size is None:
+            self._window_size = self.driver.get_window_size()
+        return self._window_size
 
     def go_to_home_tab(self) -> bool:
         """Navigate to Home (For You feed)."""
@@ -112,7 +125,7 @@ class TikTokApp:
     def scroll_fyp(self, duration_sec: float = 0.3) -> bool:
         """Scroll to next video (swipe up). Returns True if swipe was performed."""
         try:
-            _scroll_fyp_up(self.driver, int(duration_sec * 1000))
+            _scroll_fyp_up(self.driver, self._get_window_size(), int(duration_sec * 1000))
             return True
         except WebDriverException:
             return False
@@ -122,7 +135,7 @@ class TikTokApp:
         count = 0
         for _ in range(num_videos):
             try:
-                _scroll_fyp_up(self.driver, 300)
+                _scroll_fyp_up(self.driver, self._get_window_size(), 300)
                 count += 1
                 time.sleep(step_sec)
             except WebDriverException:
@@ -139,7 +152,7 @@ class TikTokApp:
             return True
         # Fallback: double-tap on video area
         try:
-            size = self.driver.get_window_size()
+            size = self._get_window_size()
             x = size["width"] // 2
             y = int(size["height"] * 0.5)
             self.driver.tap([(x, y)], 100)
@@ -3,14 +3,71 @@ Account health: cooldown on block/warning. Uses TikTok state DB.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import random
+import sqlite3
+import threading
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
+
+try:
+    from state.db import DEFAULT_DB_PATH, get_connection, init_schema
+except ImportError:
+    # Project root not on sys.path (e.g. module imported standalone); health calls need it
+    DEFAULT_DB_PATH = get_connection = init_schema = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Fixed SQL text: every call hits the connection's prepared-statement cache (health.account_id is the PRIMARY KEY)
+_SET_COOLDOWN_SQL = """
+    INSERT INTO health (account_id, cooldown_until_date, last_incident_at, incident_type, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(account_id) DO UPDATE SET
+        cooldown_until_date = excluded.cooldown_until_date,
+        last_incident_at = excluded.last_incident_at,
+        incident_type = excluded.incident_type,
+        updated_at = excluded.updated_at
+"""
+_SELECT_COOLDOWN_SQL = "SELECT cooldown_until_date FROM health WHERE account_id = ?"
+_CLEAR_COOLDOWN_SQL = "UPDATE health SET cooldown_until_date = NULL, updated_at = ? WHERE account_id = ?"
+
+# DB paths whose schema has been ensured by this process (CREATE TABLE IF NOT EXISTS runs once per path)
+_SCHEMA_READY: Set[Path] = set()
+# Per-thread open connections keyed by DB path; sqlite3 connections must stay on their creating thread
+_local = threading.local()
+
+
+def _connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """Cached connection for this thread and db_path, with the schema ensured on first use."""
+    path = db_path or DEFAULT_DB_PATH
+    conns: Dict[Path, sqlite3.Connection] = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        conn = conns[path] = get_connection(path)
+    if path not in _SCHEMA_READY:
+        init_schema(conn=conn)
+        conn.commit()
+        _SCHEMA_READY.add(path)
+    return conn
+
+
+def close_thread_connections() -> None:
+    """Close the calling thread's cached health connections (registered atexit for the main thread)."""
+    conns = getattr(_local, "conns", None) or {}
+    while conns:
+        _, conn = conns.popitem()
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_thread_connections)
+
 
 def set_cooldown(
     account_id: str,
@@ -22,49 +79,24 @@ def set_cooldown(
     days = random.randint(cooldown_days_min, cooldown_days_max)
     until = date.today() + timedelta(days=days)
     now = datetime.utcnow().isoformat() + "Z"
-    from state.db import get_connection, init_schema
-
-    init_schema(db_path=db_path)
-    conn = get_connection(db_path)
-    try:
-        conn.execute(
-            """
-            INSERT INTO health (account_id, cooldown_until_date, last_incident_at, incident_type, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(account_id) DO UPDATE SET
-                cooldown_until_date = excluded.cooldown_until_date,
-                last_incident_at = excluded.last_incident_at,
-                incident_type = excluded.incident_type,
-                updated_at = excluded.updated_at
-            """,
-            (account_id, until.isoformat(), now, incident_type or "block", now, now),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    conn = _connection(db_path)
+    conn.execute(
+        _SET_COOLDOWN_SQL,
+        (account_id, until.isoformat(), now, incident_type or "block", now, now),
+    )
+    conn.commit()
     logger.warning("Health: cooldown set until %s for account %s", until, account_id)
     return until
 
 
 def get_cooldown_until(account_id: str, db_path: Optional[Path] = None) -> Optional[date]:
-    from state.db import get_connection, init_schema
-
-    init_schema(db_path=db_path)
-    conn = get_connection(db_path)
-    try:
-        cur = conn.execute(
-            "SELECT cooldown_until_date FROM health WHERE account_id = ?",
-            (account_id,),
-        )
-        row = cur.fetchone()
-        if row and row[0]:
-            d = date.fromisoformat(row[0])
-            if d >= date.today():
-                return d
-            return None
+    row = _connection(db_path).execute(_SELECT_COOLDOWN_SQL, (account_id,)).fetchone()
+    if row and row[0]:
+        d = date.fromisoformat(row[0])
+        if d >= date.today():
+            return d
         return None
-    finally:
-        conn.close()
+    return None
 
 
 def is_in_cooldown(account_id: str, db_path: Optional[Path] = None) -> bool:
@@ -72,14 +104,6 @@ def is_in_cooldown(account_id: str, db_path: Optional[Path] = None) -> bool:
 
 
 def clear_cooldown(account_id: str, db_path: Optional[Path] = None) -> None:
-    from state.db import get_connection
-
-    conn = get_connection(db_path)
-    try:
-        conn.execute(
-            "UPDATE health SET cooldown_until_date = NULL, updated_at = ? WHERE account_id = ?",
-            (datetime.utcnow().isoformat() + "Z", account_id),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    conn = _connection(db_path)
+    conn.execute(_CLEAR_COOLDOWN_SQL, (datetime.utcnow().isoformat() + "Z", account_id))
+    conn.commit()
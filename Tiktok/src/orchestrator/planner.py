@@ -3,13 +3,12 @@ TikTok warm-up planner: day bands, SCROLL_FYP, LIKE_VIDEO, VISIT_PROFILE, GO_TO_
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from datetime import date
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 
-class ActionType(str, Enum):
+class ActionType:
+    """Action names (plain str constants: dispatch compares strings, no Enum lookup)."""
     SCROLL_FYP = "scroll_fyp"
     LIKE_VIDEO = "like_video"
     VISIT_PROFILE = "visit_profile"
@@ -18,8 +17,8 @@ class ActionType(str, Enum):
     IDLE = "idle"
 
 
-@dataclass
-class DayBand:
+# Plan types are NamedTuples: immutable, slot-sized (no per-instance __dict__), Python 3.9 compatible
+class DayBand(NamedTuple):
     min_days: int
     max_days: int
     scroll_min_sec: int
@@ -38,28 +37,47 @@ DEFAULT_DAY_BANDS = [
 ]
 
 
-@dataclass
-class ActionPlanItem:
-    action: ActionType
-    params: Dict[str, Any] = field(default_factory=dict)
+# Plan items are read-only once built, so parameterless items share one params dict and one instance
+_EMPTY_PARAMS: Dict[str, Any] = {}
 
 
-@dataclass
-class DailyPlan:
+class ActionPlanItem(NamedTuple):
+    action: str  # one of ActionType.*
+    params: Dict[str, Any] = _EMPTY_PARAMS
+
+
+_LIKE_VIDEO = ActionPlanItem(ActionType.LIKE_VIDEO, _EMPTY_PARAMS)
+_VISIT_PROFILE = ActionPlanItem(ActionType.VISIT_PROFILE, _EMPTY_PARAMS)
+_RETURN_HOME = ActionPlanItem(ActionType.RETURN_HOME, _EMPTY_PARAMS)
+_GO_TO_OWN_PROFILE = ActionPlanItem(ActionType.GO_TO_OWN_PROFILE, _EMPTY_PARAMS)
+
+
+class DailyPlan(NamedTuple):
     items: List[ActionPlanItem]
     max_session_minutes: int
     max_total_actions: int
     max_likes: int
 
 
-def _band_for_day(days_since_first: int, bands: Optional[List[DayBand]] = None) -> DayBand:
-    bands = bands or DEFAULT_DAY_BANDS
+def _scan_bands(days_since_first: int, bands: List[DayBand]) -> DayBand:
     for b in bands:
         if b.min_days <= days_since_first <= b.max_days:
             return b
     return bands[-1]
 
 
+# DEFAULT_DAY_BANDS resolved per day for days 0-14; every other day falls to the last band
+_DAY_BAND_INDEX = tuple(_scan_bands(d, DEFAULT_DAY_BANDS) for d in range(15))
+
+
+def _band_for_day(days_since_first: int, bands: Optional[List[DayBand]] = None) -> DayBand:
+    if not bands:
+        if 0 <= days_since_first < len(_DAY_BAND_INDEX):
+            return _DAY_BAND_INDEX[days_since_first]
+        return DEFAULT_DAY_BANDS[-1]
+    return _scan_bands(days_since_first, bands)
+
+
 def build_plan(
     first_run_date: date,
     last_run_date: Optional[date],
@@ -96,22 +114,19 @@ def build_plan(
     like_count = warmup_cfg.get("like_count", 4)
     visit_profile_count = warmup_cfg.get("visit_profile_count", 2)
 
-    items: List[ActionPlanItem] = []
-
-    items.append(ActionPlanItem(ActionType.SCROLL_FYP, {"num_videos": fyp_scroll_count}))
+    scroll = ActionPlanItem(ActionType.SCROLL_FYP, {"num_videos": fyp_scroll_count})
+    items: List[ActionPlanItem] = [scroll]
 
+    # Likes separated by scrolls: LIKE, SCROLL, LIKE, ..., LIKE
     num_likes = min(like_count, max_likes)
-    for i in range(num_likes):
-        items.append(ActionPlanItem(ActionType.LIKE_VIDEO, {}))
-        if i < num_likes - 1:
-            items.append(ActionPlanItem(ActionType.SCROLL_FYP, {"num_videos": fyp_scroll_count}))
+    if num_likes > 0:
+        items += [_LIKE_VIDEO, scroll] * (num_likes - 1)
+        items.append(_LIKE_VIDEO)
 
     num_profiles = min(visit_profile_count, band.profiles_max, max(0, remaining_actions - len(items) - 2))
-    for _ in range(num_profiles):
-        items.append(ActionPlanItem(ActionType.VISIT_PROFILE, {}))
-        items.append(ActionPlanItem(ActionType.RETURN_HOME, {}))
+    items += [_VISIT_PROFILE, _RETURN_HOME] * num_profiles
 
-    items.append(ActionPlanItem(ActionType.GO_TO_OWN_PROFILE, {}))
+    items.append(_GO_TO_OWN_PROFILE)
 
     items = items[: max_session_minutes * 2]
     if remaining_actions < len(items):
@@ -3,12 +3,20 @@ Caption Manager: Templates and hashtag pools for TikTok. Points to tiktok/captio
 """
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import random
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from string import Formatter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +25,28 @@ CAPTIONS_DIR = PROJECT_ROOT / "captions"
 CAPTIONS_TEMPLATES = CAPTIONS_DIR / "templates.json"
 CAPTIONS_HASHTAGS = CAPTIONS_DIR / "hashtags.json"
 
+# (template, names of the fields it references)
+CompiledTemplate = Tuple[str, FrozenSet[str]]
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file from raw bytes (orjson when installed)."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _compile_template(template: str) -> CompiledTemplate:
+    """Parse template once: its {field} names, so callers only compute the variables it uses."""
+    try:
+        # Root name only: {date[0]} / {time.upper} still need the "date" / "time" variables
+        fields = frozenset(
+            re.split(r"[.\[]", name, maxsplit=1)[0] for _, name, _, _ in Formatter().parse(template) if name
+        )
+    except ValueError:
+        # Malformed template: format() will raise as before; nothing to precompute
+        fields = frozenset()
+    return template, fields
+
 
 class CaptionManager:
     """Manages captions and hashtags for TikTok."""
@@ -26,7 +56,11 @@ class CaptionManager:
         self.hashtags_file = hashtags_file or CAPTIONS_HASHTAGS
         self._ensure_files()
         self.templates: Dict[str, List[str]] = {}
+        # media_type -> templates with their field names, rebuilt whenever templates change
+        self._compiled_templates: Dict[str, List[CompiledTemplate]] = {}
         self.hashtag_pools: Dict[str, List[str]] = {}
+        # Deduplicated union of hashtag pools, keyed by pool names; cleared whenever pools change
+        self._pool_cache: Dict[Tuple[str, ...], List[str]] = {}
         self._load_templates()
         self._load_hashtags()
 
@@ -59,19 +93,22 @@ class CaptionManager:
 
     def _load_templates(self):
         try:
-            with open(self.templates_file, "r", encoding="utf-8") as f:
-                self.templates = json.load(f)
+            self.templates = _read_json(self.templates_file)
         except Exception as e:
             logger.warning("Failed to load templates: %s", e)
             self.templates = {}
+        self._compiled_templates = {
+            media_type: [_compile_template(t) for t in templates]
+            for media_type, templates in self.templates.items()
+        }
 
     def _load_hashtags(self):
         try:
-            with open(self.hashtags_file, "r", encoding="utf-8") as f:
-                self.hashtag_pools = json.load(f)
+            self.hashtag_pools = _read_json(self.hashtags_file)
         except Exception as e:
             logger.warning("Failed to load hashtags: %s", e)
             self.hashtag_pools = {}
+        self._pool_cache.clear()
 
     def generate_caption(
         self,
@@ -81,12 +118,15 @@ class CaptionManager:
     ) -> str:
         variables = variables or {}
         variables.setdefault("caption", base_caption or "")
-        variables.setdefault("date", datetime.now().strftime("%B %d, %Y"))
-        variables.setdefault("time", datetime.now().strftime("%I:%M %p"))
-        templates = self.templates.get(media_type, self.templates.get("video", []))
+        templates = self._compiled_templates.get(media_type, self._compiled_templates.get("video", []))
         if not templates:
             return base_caption or ""
-        template = random.choice(templates)
+        template, fields = random.choice(templates)
+        # Format the clock only for templates that use it, from a single now()
+        if "date" in fields or "time" in fields:
+            now = datetime.now()
+            variables.setdefault("date", now.strftime("%B %d, %Y"))
+            variables.setdefault("time", now.strftime("%I:%M %p"))
         try:
             caption = template.format(**variables)
         except KeyError:
@@ -99,19 +139,14 @@ class CaptionManager:
         count: int = 10,
         pools: Optional[List[str]] = None,
     ) -> List[str]:
-        pools = pools or ["general", "video"]
-        all_hashtags = []
-        for pool_name in pools:
-            if pool_name in self.hashtag_pools:
-                all_hashtags.extend(self.hashtag_pools[pool_name])
-        seen = set()
-        unique = []
-        for tag in all_hashtags:
-            if tag not in seen:
-                seen.add(tag)
-                unique.append(tag)
-        random.shuffle(unique)
-        return unique[:count]
+        key = tuple(pools or ("general", "video"))
+        unique = self._pool_cache.get(key)
+        if unique is None:
+            # dict.fromkeys keeps first-seen order while dropping duplicates
+            unique = list(dict.fromkeys(itertools.chain.from_iterable(self.hashtag_pools.get(p, ()) for p in key)))
+            self._pool_cache[key] = unique
+        # sample() draws without mutating the cached list and only does O(count) work
+        return random.sample(unique, max(0, min(count, len(unique))))
 
     def format_caption_with_hashtags(
         self,
@@ -136,10 +171,12 @@ class CaptionManager:
         if media_type not in self.templates:
             self.templates[media_type] = []
         self.templates[media_type].append(template)
+        self._compiled_templates.setdefault(media_type, []).append(_compile_template(template))
         self._save_templates()
 
     def add_hashtags(self, pool_name: str, hashtags: List[str]):
         if pool_name not in self.hashtag_pools:
             self.hashtag_pools[pool_name] = []
         self.hashtag_pools[pool_name].extend(hashtags)
+        self._pool_cache.clear()
         self._save_hashtags()
@@ -3,17 +3,29 @@ Media Queue: Manage TikTok posts in queue; single video per post.
 """
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import os
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 from state import db as db_module
 from state.db import DEFAULT_DB_PATH
 
-from .models import MediaType, PostItem, PostStatus
+from .models import MediaType, PostItem, PostStatus, PostSummary
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +37,148 @@ MEDIA_FAILED = MEDIA_ROOT / "failed"
 MEDIA_VIDEOS = MEDIA_QUEUE / "videos"
 
 
+def _json_dumps(obj: Any) -> str:
+    """Encode a JSON column value (orjson when installed)."""
+    return orjson.dumps(obj).decode("utf-8") if orjson else json.dumps(obj)
+
+
+def _json_loads(text: str) -> Any:
+    return orjson.loads(text) if orjson else json.loads(text)
+
+
+@lru_cache(maxsize=512)
+def _encode_hashtags(hashtags: Tuple[str, ...]) -> str:
+    """hashtags column for a tag set; campaigns enqueue the same set many times, so encodings are reused."""
+    return _json_dumps(list(hashtags))
+
+
+# Upper bound on threads used to move/delete a post's files; a single file is handled inline
+FILE_OP_WORKERS = 4
+
+
+# Rows fetched per sqlite round trip while iter_queue streams a listing
+QUEUE_FETCH_SIZE = 200
+
+# PostItems kept per MediaQueue for repeat get_post() calls (least recently used evicted first)
+POST_CACHE_SIZE = 256
+
+
+def _move_file(fp: Path, target_dir: Path) -> None:
+    try:
+        try:
+            # Same filesystem (queue/ and posted/ share MEDIA_ROOT): one rename syscall, no stat calls
+            os.rename(fp, target_dir / fp.name)
+        except FileNotFoundError:
+            return
+        except OSError:
+            # Cross-device (e.g. media dir on another mount) or platform rename limits
+            shutil.move(str(fp), str(target_dir / fp.name))
+        logger.info("Moved %s to %s", fp.name, target_dir.name)
+    except Exception as e:
+        logger.warning("Failed to move file %s: %s", fp.name, e)
+
+
+def _delete_file(fp: Path) -> None:
+    try:
+        if fp.exists():
+            fp.unlink()
+            logger.info("Deleted file %s", fp.name)
+    except Exception as e:
+        logger.warning("Failed to delete file %s: %s", fp.name, e)
+
+
+def _for_each_file(fn, file_paths: List[Path], *args) -> None:
+    """Apply fn(fp, *args) to every file; several files run concurrently (each op is a blocking syscall)."""
+    if len(file_paths) <= 1:
+        for fp in file_paths:
+            fn(fp, *args)
+        return
+    with ThreadPoolExecutor(max_workers=min(FILE_OP_WORKERS, len(file_paths))) as pool:
+        for fp in file_paths:
+            pool.submit(fn, fp, *args)
+
+
+def _utcnow_iso() -> str:
+    """UTC now as stored in post_queue timestamps (fixed width, microseconds, trailing Z)."""
+    # time_ns + gmtime skips building a datetime; ~2x faster on the per-poll dequeue path
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{ns // 1000:06d}Z"
+
+
+# Set once the media directories have been created; later MediaQueue() instances skip the mkdirs
+_dirs_ready = False
+
+
+# Explicit post_queue column order for full-row reads; _row_to_post_item unpacks rows positionally
+_POST_COLUMNS = (
+    "id, account_id, media_type, file_paths, caption, hashtags,"
+    " scheduled_time, status, created_at, posted_at, error_message"
+)
+
+
 def _ensure_media_directories():
+    global _dirs_ready
+    if _dirs_ready:
+        return
     for dir_path in [MEDIA_QUEUE, MEDIA_POSTED, MEDIA_FAILED, MEDIA_VIDEOS]:
         dir_path.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
 
 
 class MediaQueue:
     """Manages post queue using SQLite. Video-only."""
 
+    # SQL text is fixed per statement so each connection's prepared-statement cache is reused
+    _INSERT_SQL = (
+        "INSERT INTO post_queue"
+        " (account_id, media_type, file_paths, caption, hashtags, scheduled_time, status, created_at)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    # Next due post = earliest due scheduled post, else oldest unscheduled one (scheduled_time NULLS LAST).
+    # Two LIMIT 1 branches instead of "scheduled_time IS NULL OR scheduled_time <= ?": each is a range
+    # seek on the partial dequeue index, and UNION ALL ... LIMIT 1 skips the second when the first hits.
+    _NEXT_SQL = (
+        "SELECT * FROM (SELECT " + _POST_COLUMNS + " FROM post_queue"
+        " WHERE status IN ('pending', 'scheduled') AND scheduled_time <= ?"
+        " ORDER BY scheduled_time, created_at LIMIT 1)"
+        " UNION ALL"
+        " SELECT * FROM (SELECT " + _POST_COLUMNS + " FROM post_queue"
+        " WHERE status IN ('pending', 'scheduled') AND scheduled_time IS NULL"
+        " ORDER BY created_at LIMIT 1)"
+        " LIMIT 1"
+    )
+    _NEXT_FOR_ACCOUNT_SQL = (
+        "SELECT * FROM (SELECT " + _POST_COLUMNS + " FROM post_queue"
+        " WHERE account_id = ? AND status IN ('pending', 'scheduled') AND scheduled_time <= ?"
+        " ORDER BY scheduled_time, created_at LIMIT 1)"
+        " UNION ALL"
+        " SELECT * FROM (SELECT " + _POST_COLUMNS + " FROM post_queue"
+        " WHERE account_id = ? AND status IN ('pending', 'scheduled') AND scheduled_time IS NULL"
+        " ORDER BY created_at LIMIT 1)"
+        " LIMIT 1"
+    )
+    _SET_POSTED_SQL = "UPDATE post_queue SET status = ?, posted_at = ?, error_message = NULL WHERE id = ?"
+    _SET_FAILED_SQL = "UPDATE post_queue SET status = ?, error_message = ? WHERE id = ?"
+    _SET_STATUS_SQL = "UPDATE post_queue SET status = ? WHERE id = ?"
+    _SET_STATUS_CLEAR_ERROR_SQL = "UPDATE post_queue SET status = ?, error_message = NULL WHERE id = ?"
+    # Conditional claim: matches only while the post is still queued, so one claimer wins
+    _CLAIM_SQL = "UPDATE post_queue SET status = 'posting' WHERE id = ? AND status IN ('pending', 'scheduled')"
+    # Manual "post now" may also retry a failed post
+    _CLAIM_ONE_SQL = (
+        "UPDATE post_queue SET status = 'posting', error_message = NULL"
+        " WHERE id = ? AND status IN ('pending', 'scheduled', 'failed')"
+    )
+    _GET_SQL = "SELECT " + _POST_COLUMNS + " FROM post_queue WHERE id = ?"
+    # Only status/error_message/posted_at change after insert; matching them means a cached PostItem is current
+    _VERSION_SQL = "SELECT status, error_message, posted_at FROM post_queue WHERE id = ?"
+    _FILE_PATHS_SQL = "SELECT file_paths FROM post_queue WHERE id = ?"
+    _DELETE_SQL = "DELETE FROM post_queue WHERE id = ?"
+
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or DEFAULT_DB_PATH
+        # (db_path, post_id) -> ((status, error_message, posted_at), PostItem)
+        self._post_cache: "OrderedDict[Tuple[str, int], Tuple[Tuple[Any, ...], PostItem]]" = OrderedDict()
+        self._post_cache_lock = threading.Lock()
         _ensure_media_directories()
 
     def add_post(
@@ -47,70 +191,117 @@ class MediaQueue:
         scheduled_time: Optional[datetime] = None,
         db_path: Optional[Path] = None,
     ) -> PostItem:
-        hashtags = hashtags or []
-        for fp in file_paths:
-            if not fp.exists():
-                raise FileNotFoundError(f"Media file not found: {fp}")
-        status = PostStatus.SCHEDULED if scheduled_time else PostStatus.PENDING
-        file_paths_json = json.dumps([str(p) for p in file_paths])
-        hashtags_json = json.dumps(hashtags)
-        scheduled_time_str = scheduled_time.isoformat() if scheduled_time else None
-        created_at = datetime.utcnow().isoformat() + "Z"
+        return self.add_posts(
+            [{
+                "account_id": account_id,
+                "media_type": media_type,
+                "file_paths": file_paths,
+                "caption": caption,
+                "hashtags": hashtags,
+                "scheduled_time": scheduled_time,
+            }],
+            db_path=db_path,
+        )[0]
+
+    def add_posts(self, specs: List[Dict[str, Any]], db_path: Optional[Path] = None) -> List[PostItem]:
+        """Insert several posts in one transaction. Each spec holds add_post's keyword arguments."""
+        for spec in specs:
+            for fp in spec["file_paths"]:
+                if not fp.exists():
+                    raise FileNotFoundError(f"Media file not found: {fp}")
+        created_at = _utcnow_iso()
+        items = [
+            PostItem(
+                id=None,
+                account_id=spec["account_id"],
+                media_type=spec["media_type"],
+                file_paths=list(spec["file_paths"]),
+                caption=spec.get("caption") or "",
+                hashtags=spec.get("hashtags") or [],
+                scheduled_time=spec.get("scheduled_time"),
+                status=PostStatus.SCHEDULED if spec.get("scheduled_time") else PostStatus.PENDING,
+                created_at=created_at,
+            )
+            for spec in specs
+        ]
+        if not items:
+            return items
+        rows = [
+            (
+                item.account_id,
+                item.media_type.value,
+                _json_dumps([str(p) for p in item.file_paths]),
+                item.caption,
+                _encode_hashtags(tuple(item.hashtags)),
+                item.scheduled_time.isoformat() if item.scheduled_time else None,
+                item.status.value,
+                created_at,
+            )
+            for item in items
+        ]
         db_path = db_path or self.db_path
         with db_module.cursor(db_path) as cur:
-            cur.execute(
-                """
-                INSERT INTO post_queue
-                (account_id, media_type, file_paths, caption, hashtags, scheduled_time, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (account_id, media_type.value, file_paths_json, caption, hashtags_json, scheduled_time_str, status.value, created_at),
-            )
-            post_id = cur.lastrowid
-        logger.info("Added post %s to queue: %s (%s files)", post_id, media_type.value, len(file_paths))
-        return PostItem(
-            id=post_id,
-            account_id=account_id,
-            media_type=media_type,
-            file_paths=file_paths,
-            caption=caption,
-            hashtags=hashtags,
-            scheduled_time=scheduled_time,
-            status=status,
-            created_at=datetime.fromisoformat(created_at.replace("Z", "+00:00")),
-        )
+            cur.executemany(self._INSERT_SQL, rows)
+            # One transaction holds the write lock, so the new AUTOINCREMENT ids are consecutive
+            last_id = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+        for post_id, item in enumerate(items, start=last_id - len(items) + 1):
+            item.id = post_id
+            logger.info("Added post %s to queue: %s (%s files)", post_id, item.media_type.value, len(item.file_paths))
+        return items
 
     def get_next_post(self, account_id: Optional[str] = None, db_path: Optional[Path] = None) -> Optional[PostItem]:
         db_path = db_path or self.db_path
-        now = datetime.utcnow().isoformat() + "Z"
+        now = _utcnow_iso()
         with db_module.cursor(db_path) as cur:
             if account_id:
-                cur.execute(
-                    """
-                    SELECT * FROM post_queue
-                    WHERE account_id = ? AND status IN ('pending', 'scheduled')
-                    AND (scheduled_time IS NULL OR scheduled_time <= ?)
-                    ORDER BY scheduled_time ASC NULLS LAST, created_at ASC
-                    LIMIT 1
-                    """,
-                    (account_id, now),
-                )
+                cur.execute(self._NEXT_FOR_ACCOUNT_SQL, (account_id, now, account_id))
             else:
-                cur.execute(
-                    """
-                    SELECT * FROM post_queue
-                    WHERE status IN ('pending', 'scheduled')
-                    AND (scheduled_time IS NULL OR scheduled_time <= ?)
-                    ORDER BY scheduled_time ASC NULLS LAST, created_at ASC
-                    LIMIT 1
-                    """,
-                    (now,),
-                )
+                cur.execute(self._NEXT_SQL, (now,))
             row = cur.fetchone()
             if not row:
                 return None
             return self._row_to_post_item(row)
 
+    def claim_next_post(
+        self, account_id: Optional[str] = None, db_path: Optional[Path] = None, attempts: int = 3
+    ) -> Optional[PostItem]:
+        """Select the next due post and mark it POSTING in one transaction; None if nothing is due.
+
+        The UPDATE only matches a still-queued row, so when another process/thread claims the
+        same post first (rowcount 0) the next candidate is tried instead of posting it twice.
+        """
+        db_path = db_path or self.db_path
+        for _ in range(attempts):
+            now = _utcnow_iso()
+            with db_module.cursor(db_path) as cur:
+                if account_id:
+                    cur.execute(self._NEXT_FOR_ACCOUNT_SQL, (account_id, now, account_id))
+                else:
+                    cur.execute(self._NEXT_SQL, (now,))
+                row = cur.fetchone()
+                if not row:
+                    return None
+                post = self._row_to_post_item(row)
+                cur.execute(self._CLAIM_SQL, (post.id,))
+                if cur.rowcount != 1:
+                    continue
+            self._forget_post(db_path, post.id)
+            post.status = PostStatus.POSTING
+            logger.info("Claimed post %s for posting", post.id)
+            return post
+        return None
+
+    def claim_post(self, post_id: int, db_path: Optional[Path] = None) -> bool:
+        """Atomically move one queued or failed post to POSTING; False if it is already posting/posted."""
+        db_path = db_path or self.db_path
+        with db_module.cursor(db_path) as cur:
+            cur.execute(self._CLAIM_ONE_SQL, (post_id,))
+            claimed = cur.rowcount == 1
+        if claimed:
+            self._forget_post(db_path, post_id)
+            logger.info("Claimed post %s for posting", post_id)
+        return claimed
+
     def update_status(
         self,
         post_id: int,
@@ -119,64 +310,92 @@ class MediaQueue:
         db_path: Optional[Path] = None,
     ):
         db_path = db_path or self.db_path
-        now = datetime.utcnow().isoformat() + "Z"
         with db_module.cursor(db_path) as cur:
-            if status == PostStatus.POSTED:
-                cur.execute(
-                    "UPDATE post_queue SET status = ?, posted_at = ?, error_message = NULL WHERE id = ?",
-                    (status.value, now, post_id),
-                )
-            elif status == PostStatus.FAILED:
-                cur.execute(
-                    "UPDATE post_queue SET status = ?, error_message = ? WHERE id = ?",
-                    (status.value, error_message, post_id),
-                )
-            elif status == PostStatus.POSTING:
-                cur.execute(
-                    "UPDATE post_queue SET status = ? WHERE id = ?",
-                    (status.value, post_id),
-                )
-            else:
-                cur.execute(
-                    "UPDATE post_queue SET status = ?, error_message = NULL WHERE id = ?",
-                    (status.value, post_id),
-                )
+            self._apply_status(cur, post_id, status, error_message)
+        self._forget_post(db_path, post_id)
         logger.info("Updated post %s status to %s", post_id, status.value)
 
+    @classmethod
+    def _apply_status(cls, cur, post_id: int, status: PostStatus, error_message: Optional[str] = None) -> None:
+        if status == PostStatus.POSTED:
+            cur.execute(cls._SET_POSTED_SQL, (status.value, _utcnow_iso(), post_id))
+        elif status == PostStatus.FAILED:
+            cur.execute(cls._SET_FAILED_SQL, (status.value, error_message, post_id))
+        elif status == PostStatus.POSTING:
+            cur.execute(cls._SET_STATUS_SQL, (status.value, post_id))
+        else:
+            cur.execute(cls._SET_STATUS_CLEAR_ERROR_SQL, (status.value, post_id))
+
+    @classmethod
+    def _file_paths_of(cls, cur, post_id: int) -> Optional[List[Path]]:
+        """file_paths column only (no full-row decode); None if the post does not exist."""
+        row = cur.execute(cls._FILE_PATHS_SQL, (post_id,)).fetchone()
+        return [Path(p) for p in _json_loads(row[0])] if row else None
+
     def mark_posted(self, post_id: int, success: bool = True, error_message: Optional[str] = None, db_path: Optional[Path] = None):
         db_path = db_path or self.db_path
-        post = self.get_post(post_id, db_path=db_path)
-        if not post:
-            return
         status = PostStatus.POSTED if success else PostStatus.FAILED
-        self.update_status(post_id, status, error_message, db_path)
+        with db_module.cursor(db_path) as cur:
+            file_paths = self._file_paths_of(cur, post_id)
+            if file_paths is None:
+                return
+            self._apply_status(cur, post_id, status, error_message)
+        self._forget_post(db_path, post_id)
+        logger.info("Updated post %s status to %s", post_id, status.value)
         target_dir = MEDIA_POSTED if success else MEDIA_FAILED
         target_dir.mkdir(parents=True, exist_ok=True)
-        for fp in post.file_paths:
-            try:
-                if fp.exists():
-                    shutil.move(str(fp), str(target_dir / fp.name))
-                    logger.info("Moved %s to %s", fp.name, target_dir.name)
-            except Exception as e:
-                logger.warning("Failed to move file %s: %s", fp.name, e)
+        _for_each_file(_move_file, file_paths, target_dir)
 
     def get_post(self, post_id: int, db_path: Optional[Path] = None) -> Optional[PostItem]:
+        """Fetch one post. Repeat lookups reuse the cached PostItem while its mutable columns are unchanged,
+        so only a three-column read is paid instead of the JSON/datetime decode (other processes may write too)."""
         db_path = db_path or self.db_path
+        key = (str(db_path), post_id)
+        with self._post_cache_lock:
+            cached = self._post_cache.get(key)
         with db_module.cursor(db_path) as cur:
-            cur.execute("SELECT * FROM post_queue WHERE id = ?", (post_id,))
-            row = cur.fetchone()
-            return self._row_to_post_item(row) if row else None
+            if cached is not None:
+                version = cur.execute(self._VERSION_SQL, (post_id,)).fetchone()
+                if version is None:
+                    self._forget_post(db_path, post_id)
+                    return None
+                if tuple(version) == cached[0]:
+                    with self._post_cache_lock:
+                        if key in self._post_cache:
+                            self._post_cache.move_to_end(key)
+                    return self._detached_copy(cached[1])
+            row = cur.execute(self._GET_SQL, (post_id,)).fetchone()
+        if not row:
+            return None
+        post = self._row_to_post_item(row)
+        with self._post_cache_lock:
+            self._post_cache[key] = ((row[7], row[10], row[9]), post)
+            self._post_cache.move_to_end(key)
+            if len(self._post_cache) > POST_CACHE_SIZE:
+                self._post_cache.popitem(last=False)
+        return self._detached_copy(post)
 
-    def list_queue(
-        self,
-        account_id: Optional[str] = None,
-        status: Optional[PostStatus] = None,
-        media_type: Optional[MediaType] = None,
-        db_path: Optional[Path] = None,
-    ) -> List[PostItem]:
-        db_path = db_path or self.db_path
+    @staticmethod
+    def _detached_copy(post: PostItem) -> PostItem:
+        """Copy handed to callers: they may reassign fields or mutate file_paths/hashtags in place,
+        neither of which may reach the cached PostItem (copy.copy keeps datetimes lazily parsed)."""
+        post = copy.copy(post)
+        post.file_paths = list(post.file_paths)
+        post.hashtags = list(post.hashtags)
+        return post
+
+    def _forget_post(self, db_path: Path, post_id: int) -> None:
+        with self._post_cache_lock:
+            self._post_cache.pop((str(db_path), post_id), None)
+
+    @staticmethod
+    def _queue_filter(
+        account_id: Optional[str],
+        status: Optional[PostStatus],
+        media_type: Optional[MediaType],
+    ) -> Tuple[str, List[Any]]:
         conditions = []
-        params = []
+        params: List[Any] = []
         if account_id:
             conditions.append("account_id = ?")
             params.append(account_id)
@@ -186,49 +405,119 @@ class MediaQueue:
         if media_type:
             conditions.append("media_type = ?")
             params.append(media_type.value)
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        return (" AND ".join(conditions) if conditions else "1=1"), params
+
+    def iter_queue(
+        self,
+        account_id: Optional[str] = None,
+        status: Optional[PostStatus] = None,
+        media_type: Optional[MediaType] = None,
+        db_path: Optional[Path] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[PostItem]:
+        """Posts newest first, decoded one row at a time; limit/offset page through them (limit=None: all)."""
+        db_path = db_path or self.db_path
+        where_clause, params = self._queue_filter(account_id, status, media_type)
+        with db_module.cursor(db_path) as cur:
+            cur.arraysize = QUEUE_FETCH_SIZE
+            cur.execute(
+                f"SELECT {_POST_COLUMNS} FROM post_queue WHERE {where_clause} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                (*params, -1 if limit is None else limit, offset),
+            )
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_post_item(row)
+
+    def list_queue(
+        self,
+        account_id: Optional[str] = None,
+        status: Optional[PostStatus] = None,
+        media_type: Optional[MediaType] = None,
+        db_path: Optional[Path] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[PostItem]:
+        """Posts newest first; limit/offset page through them (limit=None returns all)."""
+        return list(self.iter_queue(account_id, status, media_type, db_path, limit, offset))
+
+    def count_queue(
+        self,
+        account_id: Optional[str] = None,
+        status: Optional[PostStatus] = None,
+        media_type: Optional[MediaType] = None,
+        db_path: Optional[Path] = None,
+    ) -> int:
+        """Number of posts matching the filters (no rows decoded)."""
+        db_path = db_path or self.db_path
+        where_clause, params = self._queue_filter(account_id, status, media_type)
+        with db_module.cursor(db_path) as cur:
+            return cur.execute(f"SELECT COUNT(*) FROM post_queue WHERE {where_clause}", params).fetchone()[0]
+
+    def count_queue_by_status(self, account_id: Optional[str] = None, db_path: Optional[Path] = None) -> Dict[PostStatus, int]:
+        """Post counts per status in one grouped query; statuses with no posts map to 0."""
+        db_path = db_path or self.db_path
+        where_clause, params = self._queue_filter(account_id, None, None)
+        counts = dict.fromkeys(PostStatus, 0)
+        with db_module.cursor(db_path) as cur:
+            cur.execute(f"SELECT status, COUNT(*) FROM post_queue WHERE {where_clause} GROUP BY status", params)
+            for status_value, n in cur.fetchall():
+                counts[PostStatus(status_value)] = n
+        return counts
+
+    def list_queue_summary(
+        self,
+        account_id: Optional[str] = None,
+        status: Optional[PostStatus] = None,
+        media_type: Optional[MediaType] = None,
+        db_path: Optional[Path] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[PostSummary]:
+        """Like list_queue but skips the JSON columns and datetime parsing."""
+        db_path = db_path or self.db_path
+        where_clause, params = self._queue_filter(account_id, status, media_type)
         with db_module.cursor(db_path) as cur:
             cur.execute(
-                f"SELECT * FROM post_queue WHERE {where_clause} ORDER BY created_at DESC, id DESC",
-                params,
+                f"SELECT id, account_id, media_type, status, scheduled_time, created_at FROM post_queue"
+                f" WHERE {where_clause} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                (*params, -1 if limit is None else limit, offset),
             )
-            rows = cur.fetchall()
-            return [self._row_to_post_item(row) for row in rows]
+            return [
+                PostSummary(row[0], row[1], MediaType(row[2]), PostStatus(row[3]), row[4], row[5])
+                for row in cur.fetchall()
+            ]
 
     def delete_post(self, post_id: int, db_path: Optional[Path] = None) -> bool:
         db_path = db_path or self.db_path
-        post = self.get_post(post_id, db_path=db_path)
         with db_module.cursor(db_path) as cur:
-            cur.execute("DELETE FROM post_queue WHERE id = ?", (post_id,))
+            file_paths = self._file_paths_of(cur, post_id)
+            cur.execute(self._DELETE_SQL, (post_id,))
             deleted = cur.rowcount > 0
-        if deleted and post:
-            for fp in post.file_paths:
-                try:
-                    if fp.exists():
-                        fp.unlink()
-                        logger.info("Deleted file %s", fp.name)
-                except Exception as e:
-                    logger.warning("Failed to delete file %s: %s", fp.name, e)
+        self._forget_post(db_path, post_id)
+        if deleted and file_paths:
+            _for_each_file(_delete_file, file_paths)
         return deleted
 
     def _row_to_post_item(self, row) -> PostItem:
-        file_paths = json.loads(row["file_paths"])
-        hashtags = json.loads(row["hashtags"]) if row["hashtags"] else []
-        scheduled_time = None
-        if row["scheduled_time"]:
-            scheduled_time = datetime.fromisoformat(row["scheduled_time"])
-        created_at = datetime.fromisoformat(row["created_at"].replace("Z", "+00:00")) if row["created_at"] else None
-        posted_at = datetime.fromisoformat(row["posted_at"].replace("Z", "+00:00")) if row["posted_at"] else None
+        # Positional unpack (column order = _POST_COLUMNS) instead of ten by-name Row lookups
+        (
+            post_id, account_id, media_type, file_paths, caption, hashtags,
+            scheduled_time, status, created_at, posted_at, error_message,
+        ) = row
         return PostItem(
-            id=row["id"],
-            account_id=row["account_id"],
-            media_type=MediaType(row["media_type"]),
-            file_paths=[Path(p) for p in file_paths],
-            caption=row["caption"] or "",
-            hashtags=hashtags,
+            id=post_id,
+            account_id=account_id,
+            media_type=MediaType(media_type),
+            file_paths=[Path(p) for p in _json_loads(file_paths)],
+            caption=caption or "",
+            hashtags=_json_loads(hashtags) if hashtags else [],
             scheduled_time=scheduled_time,
-            status=PostStatus(row["status"]),
+            status=PostStatus(status),
             created_at=created_at,
             posted_at=posted_at,
-            error_message=row["error_message"],
+            error_message=error_message,
         )
@@ -3,11 +3,12 @@ Data models for TikTok posting. Video-only.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, NamedTuple, Optional, Union
 
 
 class MediaType(str, Enum):
@@ -22,6 +23,35 @@ class PostStatus(str, Enum):
     FAILED = "failed"
 
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing "Z" itself from 3.11; bind it directly (no str.replace copy)
+    parse_utc_iso = datetime.fromisoformat
+else:
+    def parse_utc_iso(text: str) -> datetime:
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
+class _LazyDatetime:
+    """PostItem datetime attribute that also accepts the raw ISO string and parses it on first read."""
+
+    def __init__(self, parse: Callable[[str], datetime]):
+        self.parse = parse
+
+    def __set_name__(self, owner, name: str):
+        self.slot = "_" + name + "_value"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.slot]
+        if isinstance(value, str):
+            value = obj.__dict__[self.slot] = self.parse(value)
+        return value
+
+    def __set__(self, obj, value: Union[datetime, str, None]):
+        obj.__dict__[self.slot] = value or None
+
+
 @dataclass
 class PostItem:
     """Represents a post in the queue."""
@@ -61,9 +91,32 @@ class PostItem:
             file_paths=[Path(p) for p in data.get("file_paths", [])],
             caption=data.get("caption", ""),
             hashtags=data.get("hashtags", []),
-            scheduled_time=datetime.fromisoformat(data["scheduled_time"]) if data.get("scheduled_time") else None,
+            scheduled_time=data.get("scheduled_time"),
             status=PostStatus(data.get("status", "pending")),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            posted_at=datetime.fromisoformat(data["posted_at"]) if data.get("posted_at") else None,
+            created_at=data.get("created_at"),
+            posted_at=data.get("posted_at"),
             error_message=data.get("error_message"),
         )
+
+
+# Installed after @dataclass so the generated __init__/__eq__/__repr__ keep the plain field names; the
+# timestamp strings handed in by MediaQueue rows and from_dict are only parsed when a caller reads them
+for _name, _parse in (
+    ("scheduled_time", datetime.fromisoformat),
+    ("created_at", parse_utc_iso),
+    ("posted_at", parse_utc_iso),
+):
+    _attr = _LazyDatetime(_parse)
+    _attr.__set_name__(PostItem, _name)
+    setattr(PostItem, _name, _attr)
+del _name, _parse, _attr
+
+
+class PostSummary(NamedTuple):
+    """Queue row without the file_paths/hashtags JSON columns (list views, counts)."""
+    id: int
+    account_id: str
+    media_type: MediaType
+    status: PostStatus
+    scheduled_time: Optional[str]
+    created_at: Optional[str]
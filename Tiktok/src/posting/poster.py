@@ -7,7 +7,7 @@ import logging
 import subprocess
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import sys
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -40,6 +40,13 @@ class TikTokPoster:
         self.driver = driver
         self.account_id = account_id
         self.adb_serial = adb_serial
+        # Screen size is fixed for a posting session; queried once instead of per fallback tap
+        self._window_size: Optional[Dict[str, int]] = None
+
+    def _get_window_size(self) -> Dict[str, int]:
+        if self._window_size is None:
+            self._window_size = self.driver.get_window_size()
+        return self._window_size
 
     def _adb_cmd(self, args: List[str], timeout: int = 30) -> subprocess.CompletedProcess:
         cmd = ["adb"]
@@ -84,7 +91,7 @@ class TikTokPoster:
                 return True
             return True
         try:
-            size = self.driver.get_window_size()
+            size = self._get_window_size()
             x = int(size["width"] * 0.5)
             y = int(size["height"] * 0.85)
             self.driver.tap([(x, y)], 100)
@@ -141,15 +148,9 @@ class TikTokPoster:
             time.sleep(2.5)
         else:
             time.sleep(1.5)
-        from appium.webdriver.common.appiumby import AppiumBy
-        for xpath in [
-            "//android.widget.ImageView[@clickable='true'][1]",
-            "//*[contains(@resource-id, 'thumbnail') or contains(@resource-id, 'video')][1]",
-            "//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView[1]",
-            "//android.widget.ImageView[1]",
-        ]:
+        for by, locator in post_sel.gallery_thumbnail_selectors():
             try:
-                el = self.driver.find_element(AppiumBy.XPATH, xpath)
+                el = self.driver.find_element(by, locator)
                 if el and el.is_displayed():
                     el.click()
                     time.sleep(1.5)
@@ -223,7 +224,7 @@ class TikTokPoster:
                     time.sleep(2)
                 else:
                     try:
-                        size = self.driver.get_window_size()
+                        size = self._get_window_size()
                         w, h = size["width"], size["height"]
                         self.driver.tap([(int(w * 0.9), int(h * 0.92))], 120)
                         time.sleep(2)
@@ -235,7 +236,7 @@ class TikTokPoster:
 
     def _fallback_tap_for_state(self, state: PostingScreenState) -> bool:
         try:
-            size = self.driver.get_window_size()
+            size = self._get_window_size()
             w, h = size["width"], size["height"]
             if state == PostingScreenState.SHARE_READY:
                 for rx, ry in [(0.85, 0.08), (0.5, 0.92), (0.85, 0.5)]:
@@ -6,7 +6,6 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -15,8 +14,9 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.health.monitor import close_thread_connections
 from src.posting.media_queue import MediaQueue
-from src.posting.models import PostStatus
+from src.posting.models import PostItem, PostStatus
 
 logger = logging.getLogger(__name__)
 
@@ -50,88 +50,91 @@ class PostScheduler:
         logger.info("Post scheduler stopped")
 
     def _run(self):
-        while self.running:
-            try:
-                self._check_and_post()
-            except Exception as e:
-                logger.error("Scheduler error: %s", e, exc_info=True)
-            for _ in range(self.check_interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+        try:
+            while self.running:
+                try:
+                    self._check_and_post()
+                except Exception as e:
+                    logger.error("Scheduler error: %s", e, exc_info=True)
+                for _ in range(self.check_interval):
+                    if not self.running:
+                        break
+                    time.sleep(1)
+        finally:
+            # is_in_cooldown cached a health connection on this thread; atexit only covers the main thread
+            close_thread_connections()
 
     def _check_and_post(self):
         try:
-            post = self.queue_manager.get_next_post(account_id=self.account_id)
-            if post and post.status in [PostStatus.PENDING, PostStatus.SCHEDULED]:
-                now = datetime.utcnow()
-                if not post.scheduled_time or post.scheduled_time <= now:
+            if not _posting_lock.acquire(blocking=False):
+                logger.debug("Posting already in progress, skipping check")
+                return
+            try:
+                # Claim (status -> posting) atomically so another scheduler process, or the web
+                # "post now" path (which claims per id via claim_post), cannot pick the same post
+                post = self.queue_manager.claim_next_post(account_id=self.account_id)
+                if post:
                     logger.info("Found post ready to publish: %s (type: %s)", post.id, post.media_type.value)
-                    self._trigger_posting(post.id)
+                    try:
+                        self._trigger_posting(post)
+                    except Exception as e:
+                        # Never leave a claimed post stuck in 'posting'
+                        logger.error("Post %s failed before posting: %s", post.id, e, exc_info=True)
+                        self.queue_manager.mark_posted(post.id, success=False, error_message=str(e)[:500])
+            finally:
+                _posting_lock.release()
         except Exception as e:
             logger.error("Error checking scheduled posts: %s", e)
 
-    def _trigger_posting(self, post_id: int):
-        """Run posting: API or Appium depending on config."""
-        if not _posting_lock.acquire(blocking=False):
-            logger.warning("Posting already in progress, skipping post %s", post_id)
-            return
-        try:
-            post = self.queue_manager.get_post(post_id)
-            if not post:
-                logger.error("Post %s not found", post_id)
-                return
-            account_id = post.account_id
-            if self.account_id and account_id != self.account_id:
-                return
+    def _trigger_posting(self, post: PostItem):
+        """Run posting for a claimed post (caller holds _posting_lock): API or Appium depending on config."""
+        post_id = post.id
+        account_id = post.account_id
 
-            from config.loader import get_full_config
-            from src.health.monitor import is_in_cooldown
+        from config.loader import get_full_config
+        from src.health.monitor import is_in_cooldown
 
-            if is_in_cooldown(account_id):
-                self.queue_manager.update_status(post_id, PostStatus.FAILED, error_message="Account in cooldown")
-                return
-
-            self.queue_manager.update_status(post_id, PostStatus.POSTING)
-            config = get_full_config(account_id)
-            posting_config = config.get("posting", {}) or {}
-            method = posting_config.get("method", "appium")
-
-            if method == "api":
-                from src.posting.api_poster import TikTokApiPoster
-                try:
-                    poster = TikTokApiPoster(account_id)
-                    success = poster.post_item(post)
-                    self.queue_manager.mark_posted(post_id, success=success)
-                except Exception as e:
-                    logger.error("Post %s failed (API): %s", post_id, e, exc_info=True)
-                    self.queue_manager.mark_posted(post_id, success=False, error_message=str(e)[:500])
-                return
+        if is_in_cooldown(account_id):
+            self.queue_manager.update_status(post_id, PostStatus.FAILED, error_message="Account in cooldown")
+            return
 
-            from src.device.driver import create_driver
-            from src.posting.poster import TikTokPoster
-            app_config = config.get("app", {})
-            device_config = config.get("device", {})
-            package = app_config.get("package", "com.zhiliaoapp.musically")
-            adb_serial = device_config.get("adb_serial")
+        config = get_full_config(account_id)
+        posting_config = config.get("posting", {}) or {}
+        method = posting_config.get("method", "appium")
 
-            driver = None
+        if method == "api":
+            from src.posting.api_poster import TikTokApiPoster
             try:
-                driver = create_driver(package=package, adb_serial=adb_serial)
-                poster = TikTokPoster(driver, account_id, adb_serial)
+                poster = TikTokApiPoster(account_id)
                 success = poster.post_item(post)
                 self.queue_manager.mark_posted(post_id, success=success)
             except Exception as e:
-                logger.error("Post %s failed: %s", post_id, e, exc_info=True)
+                logger.error("Post %s failed (API): %s", post_id, e, exc_info=True)
                 self.queue_manager.mark_posted(post_id, success=False, error_message=str(e)[:500])
-            finally:
-                if driver:
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
+            return
+
+        from src.device.driver import create_driver
+        from src.posting.poster import TikTokPoster
+        app_config = config.get("app", {})
+        device_config = config.get("device", {})
+        package = app_config.get("package", "com.zhiliaoapp.musically")
+        adb_serial = device_config.get("adb_serial")
+
+        driver = None
+        try:
+            driver = create_driver(package=package, adb_serial=adb_serial)
+            poster = TikTokPoster(driver, account_id, adb_serial)
+            success = poster.post_item(post)
+            self.queue_manager.mark_posted(post_id, success=success)
+        except Exception as e:
+            logger.error("Post %s failed: %s", post_id, e, exc_info=True)
+            self.queue_manager.mark_posted(post_id, success=False, error_message=str(e)[:500])
         finally:
-            _posting_lock.release()
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
 
     def get_status(self) -> dict:
         return {
@@ -7,7 +7,7 @@ from __future__ import annotations
 import logging
 import re
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class PostingScreenState(str, Enum):
     UNKNOWN = "unknown"
 
 
-def _find_el(driver, selectors: List[Tuple[str, str]], timeout: float = 1.5):
+def _find_el(driver, selectors: Sequence[Tuple[str, str]], timeout: float = 1.5):
     from src.device.tiktok_app import _find_element
     return _find_element(driver, selectors, timeout=timeout)
 
@@ -223,7 +223,6 @@ def get_suggested_action_from_hints(driver) -> Optional[str]:
 
 
 def find_element_by_intent(driver, intent: str):
-    from appium.webdriver.common.appiumby import AppiumBy
     from src.device import post_selectors as post_sel
     from src.device.tiktok_app import _find_element
 
@@ -232,16 +231,11 @@ def find_element_by_intent(driver, intent: str):
     if intent == "upload":
         return _find_element(driver, post_sel.upload_selectors(), timeout=1.5)
     if intent == "first_video":
-        for xpath in [
-            "//android.widget.ImageView[@clickable='true'][1]",
-            "//*[contains(@resource-id, 'thumbnail') or contains(@resource-id, 'video')][1]",
-            "//androidx.recyclerview.widget.RecyclerView//android.widget.ImageView[1]",
-            "//android.widget.ImageView[1]",
-        ]:
+        for by, locator in post_sel.gallery_thumbnail_selectors():
             try:
-                el = driver.find_element(AppiumBy.XPATH, xpath)
-                if el and el.is_displayed():
-                    return el
+                for el in driver.find_elements(by, locator):
+                    if el.is_displayed():
+                        return el
             except Exception:
                 continue
         return None
@@ -64,7 +64,7 @@ def run_plan(
     own_profile_items = [item for item in items if item.action == ActionType.GO_TO_OWN_PROFILE]
     other_items = [item for item in items if item.action != ActionType.GO_TO_OWN_PROFILE]
     items = shuffle_actions(other_items) + own_profile_items
-    logger.info("Plan has %s actions: %s", len(items), [item.action.value for item in items])
+    logger.info("Plan has %s actions: %s", len(items), [item.action for item in items])
 
     def elapsed() -> float:
         return (datetime.now(timezone.utc) - session_started_at).total_seconds()
@@ -198,7 +198,7 @@ def run_plan(
                 delay()
 
         except Exception as e:
-            logger.warning("Action %s failed: %s", action.value, e, exc_info=True)
+            logger.warning("Action %s failed: %s", action, e, exc_info=True)
             delay()
 
     session_ended_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
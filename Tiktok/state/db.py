@@ -4,21 +4,46 @@ TikTok uses separate DB so state is independent from Insta.
 """
 from __future__ import annotations
 
+import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Optional, Set
 
 # TikTok DB path: tiktok/data/tiktok_warmup.db
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "tiktok_warmup.db"
 
+# WAL lets readers (web UI, scheduler) run while the poster writes; NORMAL sync is safe under WAL and
+# skips an fsync per commit. journal_mode is persistent, so it is set once per DB file.
+# Set TIKTOK_DB_TUNING=0 to keep SQLite defaults (e.g. throwaway test DBs).
+DB_TUNING = os.environ.get("TIKTOK_DB_TUNING", "1") != "0"
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA busy_timeout=5000",
+)
+_WAL_ENABLED: Set[str] = set()
+_WAL_LOCK = threading.Lock()
+
 
 def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     path = db_path or DEFAULT_DB_PATH
     path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(path))
     conn.row_factory = sqlite3.Row
+    if DB_TUNING:
+        key = str(path)
+        if key not in _WAL_ENABLED:
+            with _WAL_LOCK:
+                if key not in _WAL_ENABLED:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    _WAL_ENABLED.add(key)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
     return conn
 
 
@@ -116,6 +141,14 @@ def _init_schema_impl(conn: sqlite3.Connection) -> None:
             ON post_queue(account_id, status);
         CREATE INDEX IF NOT EXISTS idx_post_queue_scheduled_time
             ON post_queue(scheduled_time) WHERE scheduled_time IS NOT NULL;
+        -- Dequeue order for MediaQueue.get_next_post; partial so it only holds rows still waiting to post
+        CREATE INDEX IF NOT EXISTS idx_post_queue_dequeue
+            ON post_queue(scheduled_time, created_at) WHERE status IN ('pending', 'scheduled');
+        CREATE INDEX IF NOT EXISTS idx_post_queue_account_dequeue
+            ON post_queue(account_id, scheduled_time, created_at) WHERE status IN ('pending', 'scheduled');
+        -- Newest-first listing for MediaQueue.list_queue / list_queue_summary
+        CREATE INDEX IF NOT EXISTS idx_post_queue_created
+            ON post_queue(created_at DESC, id DESC);
     """)
 
 
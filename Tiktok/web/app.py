@@ -77,11 +77,18 @@ app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024
 app.config["UPLOAD_FOLDER"] = str(MEDIA_QUEUE)
 
 from state.db import ensure_schema
+from src.health.monitor import close_thread_connections as close_health_connections
 ensure_schema()
 
 queue_manager = MediaQueue()
 caption_manager = CaptionManager()
 
+
+@app.teardown_request
+def _close_request_health_connections(_exc):
+    # Requests run on short-lived server threads; close what is_in_cooldown cached on this one
+    close_health_connections()
+
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi"}
 
 
@@ -312,7 +319,11 @@ def api_get_queue():
     type_str = request.args.get("type")
     status = PostStatus(status_str) if status_str else None
     media_type = MediaType(type_str) if type_str else None
-    posts = queue_manager.list_queue(account_id=account_id, status=status, media_type=media_type)
+    limit = request.args.get("limit", type=int)
+    offset = request.args.get("offset", default=0, type=int)
+    posts = queue_manager.iter_queue(
+        account_id=account_id, status=status, media_type=media_type, limit=limit, offset=offset
+    )
     return jsonify([post.to_dict() for post in posts])
 
 
@@ -382,22 +393,28 @@ def api_post_now(post_id: int):
         account_id = _get_current_account()
         if post.account_id != account_id:
             return jsonify({"error": "Post belongs to different account"}), 403
-        queue_manager.update_status(post_id, PostStatus.POSTING)
 
-        from src.posting.poster import TikTokPoster
-        from src.device.driver import create_driver
         from config.loader import get_full_config
         from src.health.monitor import is_in_cooldown
 
-        if is_in_cooldown(account_id):
-            queue_manager.update_status(post_id, PostStatus.FAILED, error_message="Account in cooldown")
-            return jsonify({"error": "Account is in cooldown. Cannot post."}), 403
-
+        # Take the lock before claiming so a busy lock never touches the post's status
+        # (the scheduler may hold the lock with this very post claimed)
         if not _posting_lock.acquire(blocking=False):
-            queue_manager.update_status(post_id, PostStatus.PENDING)
             return jsonify({"error": "Another post is in progress. Try again shortly."}), 429
 
-        config = get_full_config(account_id)
+        try:
+            # Mark as posting (atomic: a post already claimed by the scheduler or another request is rejected)
+            if not queue_manager.claim_post(post_id):
+                _posting_lock.release()
+                return jsonify({"error": "Post is already being posted"}), 409
+            if is_in_cooldown(account_id):
+                queue_manager.update_status(post_id, PostStatus.FAILED, error_message="Account in cooldown")
+                _posting_lock.release()
+                return jsonify({"error": "Account is in cooldown. Cannot post."}), 403
+            config = get_full_config(account_id)
+        except Exception:
+            _posting_lock.release()
+            raise
         posting_config = config.get("posting", {}) or {}
         method = posting_config.get("method", "appium")
 
@@ -444,6 +461,7 @@ def api_post_now(post_id: int):
                     except Exception:
                         pass
                     driver_holder.pop("driver", None)
+                close_health_connections()
 
         try:
             t = threading.Thread(target=run_post, daemon=True)
@@ -490,13 +508,14 @@ def api_post_now(post_id: int):
 @app.route("/api/stats", methods=["GET"])
 def api_stats():
     account_id = _get_current_account()
-    all_posts = queue_manager.list_queue(account_id=account_id)
+    # One GROUP BY over status; no queue rows are fetched or decoded
+    counts = queue_manager.count_queue_by_status(account_id=account_id)
     stats = {
-        "total": len(all_posts),
-        "pending": len([p for p in all_posts if p.status == PostStatus.PENDING]),
-        "scheduled": len([p for p in all_posts if p.status == PostStatus.SCHEDULED]),
-        "posted": len([p for p in all_posts if p.status == PostStatus.POSTED]),
-        "failed": len([p for p in all_posts if p.status == PostStatus.FAILED]),
+        "total": sum(counts.values()),
+        "pending": counts[PostStatus.PENDING],
+        "scheduled": counts[PostStatus.SCHEDULED],
+        "posted": counts[PostStatus.POSTED],
+        "failed": counts[PostStatus.FAILED],
     }
     return jsonify(stats)
 